@@ -0,0 +1,69 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Size, write throughput and parse throughput of a generated document
+written as JSON, YAML and XML with the pretty and the compact output of
+write_file. Throughputs are in MB of the pretty output per second, so that
+they compare documents rather than bytes.
+
+    python benchmarks/bench_compact.py [--files N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from generate import make_document
+
+from spdx.parsers import parse_anything
+from spdx.writers.write_anything import write_file
+
+
+class QuietLogger(object):
+    """The generated packages list files without filesAnalyzed, drop the errors."""
+
+    def log(self, msg):
+        pass
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=20000)
+    args = parser.parse_args()
+
+    parse_anything.StandardLogger = QuietLogger
+    packages = max(1, args.files // 100)
+    doc = make_document(packages, args.files // packages)
+    print(f"{'format':>6} {'output':>7} {'MB':>6} {'size':>6} {'write MB/s':>11} {'parse MB/s':>11}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for file_format in ("json", "yaml", "xml"):
+            pretty_size = None
+            for compact in (False, True):
+                path = os.path.join(temp_dir, "bench." + file_format)
+                written = timed(write_file, doc, path, validate=False, compact=compact)
+                size = os.path.getsize(path) / 1e6
+                pretty_size = pretty_size or size
+                parsed = timed(parse_anything.parse_file, path)
+                print(f"{file_format:>6} {'compact' if compact else 'pretty':>7} {size:6.1f} {size / pretty_size:6.0%} "
+                      f"{pretty_size / written:11.1f} {pretty_size / parsed:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Size, write time and parse time of a generated JSON document written
+uncompressed and with each available compression of spdx.compression,
+through write_file and parse_file.
+
+    python benchmarks/bench_compression.py [--files N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from generate import make_document
+
+from spdx import compression
+from spdx.parsers import parse_anything
+from spdx.writers.write_anything import write_file
+
+
+class QuietLogger(object):
+    """The generated packages list files without filesAnalyzed, drop the errors."""
+
+    def log(self, msg):
+        pass
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=20000)
+    args = parser.parse_args()
+
+    parse_anything.StandardLogger = QuietLogger
+    packages = max(1, args.files // 100)
+    doc = make_document(packages, args.files // packages)
+    print(f"{'suffix':>8} {'MB':>6} {'write':>7} {'parse':>7}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for suffix in [""] + list(compression.SUFFIXES):
+            path = os.path.join(temp_dir, "bench.json" + suffix)
+            try:
+                written = timed(write_file, doc, path, False)
+            except ImportError as err:
+                print(f"{suffix:>8} {err}")
+                continue
+            parsed = timed(parse_anything.parse_file, path)
+            print(f"{suffix or '-':>8} {os.path.getsize(path) / 1e6:6.1f} {written:6.2f}s {parsed:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
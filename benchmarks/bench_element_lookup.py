@@ -0,0 +1,67 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time spent writing generated documents of growing size, with a snippet
+in every tenth file, as tag/value and JSON, and finding the files of a
+package with get_files_in_package. All of them look elements up by
+SPDX id, which should grow linearly with the number of files.
+
+    python benchmarks/bench_element_lookup.py [--files N N ...]
+"""
+
+import argparse
+import io
+import time
+
+from generate import make_document
+
+from spdx.snippet import Snippet
+from spdx.utils import NoAssert, get_files_in_package
+from spdx.writers import json, tagvalue
+
+
+def add_snippets(doc):
+    for file in doc.files[::10]:
+        snippet = Snippet(spdx_id=file.spdx_id.replace("File", "Snippet"))
+        snippet.snip_from_file_spdxid = file.spdx_id
+        snippet.conc_lics = NoAssert()
+        snippet.copyright = "NOASSERTION"
+        snippet.byte_range = (1, 10)
+        doc.add_snippet(snippet)
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'files':>6} {'tag/value':>10} {'JSON':>10} {'files in package':>16}")
+    for files in args.files:
+        packages = max(1, files // 100)
+        doc = make_document(packages, files // packages)
+        add_snippets(doc)
+
+        tag_value = timed(lambda: tagvalue.write_document(doc, io.StringIO(), validate=False))
+        json_time = timed(lambda: json.write_document(doc, io.StringIO(), validate=False))
+        in_package = timed(lambda: get_files_in_package(doc.packages[0], doc.files, doc.relationships))
+        print(f"{files:6} {tag_value:9.2f}s {json_time:9.2f}s {in_package:15.2f}s")
+
+
+if __name__ == "__main__":
+    main()
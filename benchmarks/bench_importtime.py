@@ -0,0 +1,79 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Import time of the entry points, as reported by python -X importtime,
+and which of the optional format libraries each import pulls in.
+
+Each sample is a fresh interpreter; the median cumulative time of the
+module's import is reported.
+
+    python benchmarks/bench_importtime.py [--runs N] [module ...]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "spdx.parsers.parse_anything",
+    "spdx.writers.write_anything",
+    "spdx.cli_tools.convertor",
+    "spdx.parsers.jsonparser",
+    "spdx.parsers.yamlparser",
+    "spdx.parsers.xmlparser",
+    "spdx.parsers.tagvalue",
+    "spdx.parsers.rdf",
+]
+
+LIBRARIES = ["rdflib", "yaml", "xmltodict", "ply", "orjson"]
+
+
+def import_time(module):
+    """Return the cumulative import time of `module` in seconds, and the LIBRARIES it imported."""
+    script = "import sys, {0}; print(' '.join(m for m in {1!r} if m in sys.modules))".format(module, LIBRARIES)
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    )
+    for line in out.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1e6, out.stdout.split()
+    raise RuntimeError("No import time reported for " + module)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args()
+
+    # make sure the modules are byte-compiled like in an installed package
+    subprocess.run([sys.executable, "-m", "compileall", "-q", os.path.join(ROOT, "spdx")], check=True)
+
+    print(f"{'module':32} {'median ms':>10} {'min ms':>8}  libraries")
+    for module in args.modules:
+        samples = []
+        for _ in range(args.runs):
+            seconds, libraries = import_time(module)
+            samples.append(seconds)
+        print(f"{module:32} {statistics.median(samples) * 1000:10.1f} {min(samples) * 1000:8.1f}  "
+              f"{' '.join(libraries)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory held by parsed documents, which share the License objects, the
+special values and the repeated strings (copyright texts, supplier
+names) of the document between all the elements using them.
+
+By default a document shaped like the SBOM of a container image is
+generated: a few hundred distribution packages of the same supplier,
+whose files have a handful of licenses and copyright texts between them.
+Pass --sbom with SBOMs of real images, as written by SBOM generators for
+container images, to measure those instead.
+
+    python benchmarks/bench_interning.py [--files N] [--sbom PATH ...]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+
+from generate import make_document
+
+from spdx.creationinfo import Organization
+from spdx.license import License
+from spdx.parsers.parse_anything import parse_file
+from spdx.utils import NoAssert, SPDXNone
+from spdx.writers.write_anything import write_file
+
+COPYRIGHTS = [
+    "Copyright (c) 1989, 1991 Free Software Foundation, Inc.",
+    "Copyright (c) 2000-2022 The OpenSSL Project Authors",
+    "Copyright (c) 1995-2017 Jean-loup Gailly and Mark Adler",
+    "Copyright (c) Debian Project",
+    "Copyright 2004-2022 Python Software Foundation",
+]
+
+
+def make_image_sbom(files):
+    packages = max(1, files // 200)
+    doc = make_document(packages, files // packages)
+    for i, package in enumerate(doc.packages):
+        package.supplier = Organization("Debian", "debian-devel@lists.debian.org")
+        package.cr_text = COPYRIGHTS[i % len(COPYRIGHTS)]
+        package.files_analyzed = True
+    for i, file in enumerate(doc.files):
+        file.copyright = COPYRIGHTS[i % len(COPYRIGHTS)] if i % 3 else SPDXNone()
+        file.conc_lics = NoAssert()
+    return doc
+
+
+def retained(path):
+    """Return the bytes held by the document parsed from `path`, and its number of files."""
+    gc.collect()
+    tracemalloc.start()
+    doc, error = parse_file(path)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, len(doc.files)
+
+
+def distinct(values):
+    return len({id(value) for value in values})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50000)
+    parser.add_argument("--sbom", nargs="+", default=[])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = args.sbom
+        if not paths:
+            doc = make_image_sbom(args.files)
+            paths = [os.path.join(temp_dir, "image.spdx.json"), os.path.join(temp_dir, "image.spdx")]
+            for path in paths:
+                write_file(doc, path, validate=False)
+
+        print(f"{'document':>20} {'files':>7} {'MB':>7} {'bytes/file':>11} {'licenses':>9} {'copyrights':>11}")
+        for path in paths:
+            size, files = retained(path)
+            doc, _ = parse_file(path)
+            licenses = [lic for file in doc.files for lic in file.licenses_in_file if isinstance(lic, License)]
+            copyrights = [file.copyright for file in doc.files]
+            print(f"{os.path.basename(path)[-20:]:>20} {files:7} {size / 1e6:7.1f} {size / max(files, 1):11.0f} "
+                  f"{distinct(licenses):9} {distinct(copyrights):11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Throughput of each installed JSON backend of spdx.json_codec on the JSON
+documents in tests/data/formats: decoding and encoding the JSON alone,
+and parsing and writing the documents with the JSON parser and writer.
+
+    python benchmarks/bench_json_codec.py [--repeat N]
+"""
+
+import argparse
+import glob
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spdx import json_codec
+from spdx.parsers import jsonparser
+from spdx.parsers.jsonyamlxmlbuilders import Builder
+from spdx.parsers.loggers import StandardLogger
+from spdx.writers.json import write_document
+
+FORMATS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "data", "formats")
+
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    texts = []
+    for path in sorted(glob.glob(os.path.join(FORMATS_DIR, "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            texts.append(f.read())
+    size = sum(len(text.encode("utf-8")) for text in texts) * args.repeat / 1e6
+
+    print(f"{len(texts)} documents, {size:.1f} MB per measurement")
+    print(f"{'backend':>8} {'loads MB/s':>11} {'dumps MB/s':>11} {'parse MB/s':>11} {'write MB/s':>11}")
+    for name in json_codec.BACKENDS:
+        try:
+            json_codec.set_backend(name)
+        except ImportError:
+            print(f"{name:>8} not installed")
+            continue
+        codec = json_codec.get_codec()
+        values = [codec.loads(text) for text in texts]
+        documents = [jsonparser.Parser(Builder(), StandardLogger()).parse(io.StringIO(text))[0] for text in texts]
+
+        def loads():
+            for text in texts:
+                codec.loads(text)
+
+        def dumps():
+            for value in values:
+                codec.dumps(value, pretty=True)
+
+        def parse():
+            for text in texts:
+                jsonparser.Parser(Builder(), StandardLogger()).parse(io.StringIO(text))
+
+        def write():
+            for document in documents:
+                write_document(document, io.StringIO(), validate=False, streaming=False)
+
+        print(f"{name:>8}" + "".join(f" {size / timed(f, args.repeat):11.1f}" for f in (loads, dumps, parse, write)))
+    json_codec.set_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time and peak memory, including the parsed Document, of parsing generated
+JSON documents of growing size with Parser.parse_stream, which parses the
+packages and files while reading them, and with Parser.parse, which
+decodes the whole JSON first.
+
+    python benchmarks/bench_json_parser.py [--files N N ...]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from generate import make_document
+
+from spdx.parsers import jsonparser
+from spdx.parsers.jsonyamlxmlbuilders import Builder
+from spdx.writers.json import write_document
+
+
+class QuietLogger(object):
+    """The generated packages list files without filesAnalyzed, drop the errors."""
+
+    def log(self, msg):
+        pass
+
+
+def parse(path, streaming):
+    parser = jsonparser.Parser(Builder(), QuietLogger())
+    with open(path) as f:
+        return parser.parse_stream(f) if streaming else parser.parse(f)
+
+
+def measure(path, streaming):
+    """Return the time and, in a separate traced run, the peak allocated memory of a parse."""
+    start = time.perf_counter()
+    parse(path, streaming)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    parse(path, streaming)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'files':>6} {'MB':>6} {'streaming':>10} {'peak MB':>8} {'json.load':>10} {'peak MB':>8}")
+    for files in args.files:
+        packages = max(1, files // 100)
+        doc = make_document(packages, files // packages)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "bench.json")
+            with open(path, "w") as out:
+                write_document(doc, out, validate=False)
+            del doc
+            size = os.path.getsize(path)
+            streamed, streamed_peak = measure(path, True)
+            loaded, loaded_peak = measure(path, False)
+        print(f"{files:6} {size / 1e6:6.1f} {streamed:9.2f}s {streamed_peak / 1e6:8.1f} "
+              f"{loaded:9.2f}s {loaded_peak / 1e6:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
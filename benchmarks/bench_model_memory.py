@@ -0,0 +1,72 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory taken by the model objects of a document: the bytes allocated per
+file (with its checksum and licenses) and per relationship while building
+a generated document, and per object of each model class alone.
+
+    python benchmarks/bench_model_memory.py [--files N]
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+from generate import make_document
+
+from spdx.checksum import Checksum, ChecksumAlgorithm
+from spdx.file import File
+from spdx.license import License
+from spdx.package import Package
+from spdx.relationship import Relationship
+
+MODEL_CLASSES = {
+    "File": lambda i: File(f"./src/file-{i}.c", f"SPDXRef-File-{i}"),
+    "Package": lambda i: Package(f"package-{i}", f"SPDXRef-Package-{i}"),
+    "Checksum": lambda i: Checksum(ChecksumAlgorithm.SHA1, "da39a3ee5e6b4b0d3255bfef95601890afd80709"),
+    "Relationship": lambda i: Relationship("SPDXRef-Package CONTAINS SPDXRef-File"),
+    "License": lambda i: License.from_identifier("MIT"),
+}
+
+
+def allocated(function):
+    """Return what `function` returns and the bytes it left allocated."""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    value = function()
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return value, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=100000)
+    args = parser.parse_args()
+
+    files_only, files_size = allocated(lambda: make_document(args.files // 100, 100))
+    del files_only
+    print(f"{args.files} files, in packages of 100")
+    print(f"  per file with its relationship {files_size / args.files:8.0f} bytes")
+
+    count = 100000
+    for name, make in MODEL_CLASSES.items():
+        objects, size = allocated(lambda: [make(i) for i in range(count)])
+        # leave out the list holding the objects
+        size -= sys.getsizeof(objects)
+        print(f"  per {name:<12} {size / count:26.0f} bytes")
+        del objects
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time turning an RDF graph into a Document for generated documents of
+growing size, reading the triples through the parser's TripleIndex and
+through rdflib store queries. Loading the RDF/XML into the graph is
+timed separately.
+
+    python benchmarks/bench_rdf_parser.py [--files N N ...] [--runs N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from generate import make_document, write_document
+
+from spdx.parsers.loggers import StandardLogger
+from spdx.parsers.rdf import IndexedGraph, Parser
+from spdx.parsers.rdfbuilders import Builder
+
+
+def best_time(func, runs):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'files':>6} {'triples':>8} {'load':>8} {'index':>8} {'queries':>8} {'us/triple (index)':>18}")
+    for files in args.files:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            packages = max(1, files // 100)
+            path = write_document(make_document(packages, files // packages), os.path.join(temp_dir, "bench.rdf"))
+            graph = IndexedGraph()
+            start = time.perf_counter()
+            graph.parse(path, format="xml")
+            load = time.perf_counter() - start
+
+        def ingest(index):
+            doc, error = Parser(Builder(), StandardLogger()).parse_graph(graph, index)
+            assert not error and len(doc.files) == files
+
+        indexed = best_time(lambda: ingest(graph.index), args.runs)
+        queried = best_time(lambda: ingest(None), args.runs)
+        print(f"{files:6} {len(graph):8} {load:7.2f}s {indexed:7.2f}s {queried:7.2f}s "
+              f"{indexed / len(graph) * 1e6:18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time and peak traced memory of parsing generated RDF/XML documents of
+growing size with the SAX reader and with an rdflib Graph.
+
+    python benchmarks/bench_rdf_sax.py [--files N N ...] [--runs N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from generate import make_document, write_document
+
+from spdx.parsers.loggers import StandardLogger
+from spdx.parsers.rdf import Parser
+from spdx.parsers.rdfbuilders import Builder
+
+
+def parse(path, files, sax):
+    with open(path, "rb") as f:
+        doc, error = Parser(Builder(), StandardLogger()).parse(f, sax=sax)
+    assert not error and len(doc.files) == files
+
+
+def best_time(func, runs):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, nargs="+", default=[500, 1000, 2000, 4000])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'files':>6} {'MB':>6} {'SAX':>10} {'rdflib':>8} {'peak MB (SAX)':>20} {'peak MB (rdflib)':>17}")
+    for files in args.files:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            packages = max(1, files // 100)
+            path = write_document(make_document(packages, files // packages), os.path.join(temp_dir, "bench.rdf"))
+            size = os.path.getsize(path)
+            results = []
+            for sax in (True, False):
+                results.append(best_time(lambda: parse(path, files, sax), args.runs))
+            for sax in (True, False):
+                results.append(peak_memory(lambda: parse(path, files, sax)))
+        sax_time, rdflib_time, sax_peak, rdflib_peak = results
+        print(f"{files:6} {size / 1e6:6.1f} {sax_time:9.2f}s {rdflib_time:7.2f}s "
+              f"{sax_peak / 1e6:20.1f} {rdflib_peak / 1e6:17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time writing generated documents of growing size as RDF/XML, in the
+deterministic mode and by canonicalizing the graph with to_isomorphic
+and serializing it as pretty-xml. The default sizes go up to 100000
+files; the canonicalizing writer is skipped above --max-canonical files.
+
+    python benchmarks/bench_rdf_writer.py [--files N N ...] [--max-canonical N]
+"""
+
+import argparse
+import io
+import time
+
+from generate import make_document
+
+from spdx.writers.rdf import write_document
+
+
+def timed(doc, deterministic):
+    out = io.BytesIO()
+    start = time.perf_counter()
+    write_document(doc, out, validate=False, deterministic=deterministic)
+    return time.perf_counter() - start, len(out.getvalue())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--max-canonical", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{'files':>7} {'MB':>7} {'deterministic':>14} {'canonical':>10}")
+    for files in args.files:
+        packages = max(1, files // 100)
+        doc = make_document(packages, files // packages)
+        doc.relationships = [r for r in doc.relationships if r.relationship_type != "CONTAINS"]
+        deterministic, size = timed(doc, True)
+        canonical = f"{timed(doc, False)[0]:9.2f}s" if files <= args.max_canonical else f"{'-':>10}"
+        print(f"{files:7} {size / 1e6:7.1f} {deterministic:13.2f}s {canonical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time of building the relationship graph of generated documents, where
+every package DEPENDS_ON the next two, and of asking the first ten
+packages for their files and their transitive dependencies, with the
+graph and by walking the relationships once per query.
+
+    python benchmarks/bench_relationship_graph.py [--files N N ...]
+"""
+
+import argparse
+import time
+
+from generate import make_document
+
+from spdx.relationship import Relationship
+
+
+def walk_contained(relationships, spdx_id):
+    return [relationship.related_spdx_element for relationship in relationships
+            if relationship.relationship_type == "CONTAINS" and relationship.spdx_element_id == spdx_id]
+
+
+def walk_dependencies(relationships, spdx_id):
+    reached = {spdx_id}
+    queue = [spdx_id]
+    for current in queue:
+        for relationship in relationships:
+            if relationship.relationship_type == "DEPENDS_ON" and relationship.spdx_element_id == current \
+                    and relationship.related_spdx_element not in reached:
+                reached.add(relationship.related_spdx_element)
+                queue.append(relationship.related_spdx_element)
+    return queue[1:]
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--walk-limit", type=int, default=10000,
+                        help="largest document to also query by walking the relationships")
+    args = parser.parse_args()
+
+    print(f"{'files':>6} {'build':>7} {'contains':>9} {'depends':>8} {'walk contains':>14} {'walk depends':>13}")
+    for files in args.files:
+        packages = max(1, files // 100)
+        doc = make_document(packages, files // packages)
+        all_ids = [package.spdx_id for package in doc.packages]
+        for i, spdx_id in enumerate(all_ids):
+            for dependency in all_ids[i + 1:i + 3]:
+                doc.add_relationship(Relationship(f"{spdx_id} DEPENDS_ON {dependency}"))
+
+        ids = all_ids[:10]
+        build = timed(doc.get_relationship_graph)
+        graph = doc.get_relationship_graph()
+        contains = timed(lambda: [graph.contained(spdx_id) for spdx_id in ids])
+        depends = timed(lambda: [graph.dependencies(spdx_id) for spdx_id in ids])
+        line = f"{files:6} {build:6.2f}s {contains:8.4f}s {depends:7.4f}s"
+        if files <= args.walk_limit:
+            walk_contains = timed(lambda: [walk_contained(doc.relationships, spdx_id) for spdx_id in ids])
+            walk_depends = timed(lambda: [walk_dependencies(doc.relationships, spdx_id) for spdx_id in ids])
+            line += f" {walk_contains:13.2f}s {walk_depends:12.2f}s"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Reading the parts of relationships parsed once, against splitting the
+relationship string on every access as Relationship used to, and the
+time of writing a generated document with many relationships as
+tag/value and JSON.
+
+    python benchmarks/bench_relationships.py [--relationships N] [--files N]
+"""
+
+import argparse
+import io
+import time
+
+from generate import make_document
+
+from spdx.relationship import Relationship
+from spdx.writers import json, tagvalue
+
+
+class SplitRelationship(object):
+    """The former Relationship, splitting the string for every part."""
+
+    def __init__(self, relationship):
+        self.relationship = relationship
+
+    @property
+    def spdx_element_id(self):
+        return self.relationship.split(" ")[0]
+
+    @property
+    def relationship_type(self):
+        return self.relationship.split(" ")[1]
+
+    @property
+    def related_spdx_element(self):
+        return self.relationship.split(" ")[2]
+
+
+def read_parts(relationships):
+    for relationship in relationships:
+        relationship.spdx_element_id
+        relationship.relationship_type
+        relationship.related_spdx_element
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--relationships", type=int, default=1000000)
+    parser.add_argument("--files", type=int, default=100000)
+    args = parser.parse_args()
+
+    strings = [f"SPDXRef-Package-{i // 100} CONTAINS SPDXRef-File-{i}" for i in range(args.relationships)]
+    parsed = [Relationship(string) for string in strings]
+    split = [SplitRelationship(string) for string in strings]
+    print(f"{args.relationships} relationships")
+    print(f"  parse       {timed(lambda: [Relationship(string) for string in strings]):6.2f}s")
+    print(f"  read parsed {timed(lambda: read_parts(parsed)):6.2f}s")
+    print(f"  read split  {timed(lambda: read_parts(split)):6.2f}s")
+
+    packages = max(1, args.files // 100)
+    doc = make_document(packages, args.files // packages)
+    print(f"{len(doc.relationships)} relationships in a document of {args.files} files")
+    print(f"  tag/value   {timed(lambda: tagvalue.write_document(doc, io.StringIO(), validate=False)):6.2f}s")
+    print(f"  JSON        {timed(lambda: json.write_document(doc, io.StringIO(), validate=False)):6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
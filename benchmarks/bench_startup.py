@@ -0,0 +1,78 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cold start cost of parsing a small tag-value file, with the shipped LALR
+tables and with the grammar rebuilt from scratch on every run.
+
+Each sample is a fresh interpreter, so the numbers include imports.
+
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLE = os.path.join(ROOT, "tests", "data", "formats", "SPDXTagExample-v2.3.spdx")
+
+PRECOMPILED = """
+from spdx.parsers import parse_anything
+parse_anything.parse_file({path!r})
+"""
+
+# Point both grammars at a table module that does not exist and forbid
+# writing it, so PLY builds the LALR tables in memory on every start.
+REBUILT = """
+from spdx import utils
+from spdx.parsers import tagvalue
+utils.LICENSE_LIST_TABMODULE = tagvalue.TABMODULE = "spdx.parsers.no_such_parsetab"
+_build = tagvalue.Parser.build
+tagvalue.Parser.build = lambda self, **kwargs: _build(self, write_tables=False, **kwargs)
+_lbuild = utils.LicenseListParser.build
+utils.LicenseListParser.build = lambda self, **kwargs: _lbuild(self, write_tables=False, **kwargs)
+from spdx.parsers import parse_anything
+parse_anything.parse_file({path!r})
+"""
+
+
+def time_script(script, runs):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c",
+             "import time; _t = time.perf_counter()\n" + script + "\nprint(time.perf_counter() - _t)"],
+            cwd=ROOT, check=True, capture_output=True, text=True,
+        )
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    # make sure the shipped tables are byte-compiled like in an installed package
+    subprocess.run([sys.executable, "-m", "compileall", "-q", os.path.join(ROOT, "spdx", "parsers")], check=True)
+
+    for label, script in (("precompiled tables", PRECOMPILED), ("grammar rebuilt", REBUILT)):
+        samples = time_script(script.format(path=EXAMPLE), args.runs)
+        print(f"{label:20} median {statistics.median(samples) * 1000:8.1f} ms  "
+              f"min {min(samples) * 1000:8.1f} ms  ({args.runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tokenize a large generated tag-value document with every lexer backend and
+check that they agree.
+
+    python benchmarks/bench_tagvalue_lexer.py [--packages N] [--files N] [--runs N]
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import time
+
+from generate import make_document, write_document
+
+from spdx.parsers.lexers.tagvalue import LEXER_BACKENDS
+
+
+def tokenize(lexer_class, data):
+    lexer = lexer_class()
+    lexer.build(reflags=re.UNICODE)
+    lexer.input(data)
+    token = lexer.token()
+    while token is not None:
+        yield token
+        token = lexer.token()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packages", type=int, default=10)
+    parser.add_argument("--files", type=int, default=2000, help="files per package")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = write_document(make_document(args.packages, args.files), os.path.join(temp_dir, "bench.spdx"))
+        with open(path) as f:
+            data = f.read()
+    print(f"{len(data) / 1e6:.1f} MB of tag-value, {args.packages * args.files} files")
+
+    reference = None
+    for name, lexer_class in LEXER_BACKENDS.items():
+        best = float("inf")
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            count = sum(1 for _ in tokenize(lexer_class, data))
+            best = min(best, time.perf_counter() - start)
+        summary = [(t.type, t.value, t.lineno, t.lexpos) for t in tokenize(lexer_class, data)]
+        if reference is None:
+            reference = summary
+        elif summary != reference:
+            raise SystemExit(f"{name} lexer disagrees with {next(iter(LEXER_BACKENDS))}")
+        print(f"{name:6} {count:9} tokens  {best:7.3f} s  {count / best / 1e6:5.2f} M tokens/s")
+
+
+if __name__ == "__main__":
+    main()
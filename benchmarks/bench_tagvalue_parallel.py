@@ -0,0 +1,76 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parse a large generated tag-value document serially and with the
+multi-process parser, and check that both give the same document.
+
+    python benchmarks/bench_tagvalue_parallel.py [--packages N] [--files N] [--workers N]
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+
+from generate import make_document, write_document
+
+from spdx.parsers.loggers import StandardLogger
+from spdx.parsers.tagvalue import Parser
+from spdx.parsers.tagvaluebuilders import Builder
+from spdx.writers import tagvalue as tagvalue_writer
+
+
+def new_parser(lexer_backend):
+    parser = Parser(Builder(), StandardLogger())
+    parser.build(lexer_backend=lexer_backend)
+    return parser
+
+
+def write(doc):
+    out = io.StringIO()
+    tagvalue_writer.write_document(doc, out, validate=False)
+    return out.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packages", type=int, default=50)
+    parser.add_argument("--files", type=int, default=100, help="files per package")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--shard-size", type=int, default=1 << 18, help="minimum shard size in characters")
+    parser.add_argument("--lexer", default="fast")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = write_document(make_document(args.packages, args.files), os.path.join(temp_dir, "bench.spdx"))
+        with open(path) as f:
+            data = f.read()
+    print(f"{len(data) / 1e6:.1f} MB of tag-value, {args.packages * args.files} files")
+
+    start = time.perf_counter()
+    serial_doc, _ = new_parser(args.lexer).parse(data)
+    serial = time.perf_counter() - start
+    print(f"serial               {serial:7.3f} s")
+
+    start = time.perf_counter()
+    parallel_doc, _ = new_parser(args.lexer).parse_parallel(data, args.workers, args.shard_size)
+    parallel = time.perf_counter() - start
+    print(f"{args.workers:2} workers           {parallel:7.3f} s  {serial / parallel:5.2f}x")
+
+    if write(parallel_doc) != write(serial_doc):
+        raise SystemExit("parallel parse disagrees with serial parse")
+
+
+if __name__ == "__main__":
+    main()
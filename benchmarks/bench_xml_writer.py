@@ -0,0 +1,68 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time and memory allocated on top of the Document while writing generated
+documents of growing size as XML, streaming the packages and files and
+building the whole document object for xmltodict.unparse.
+
+    python benchmarks/bench_xml_writer.py [--files N N ...]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from generate import make_document
+
+from spdx.writers.xml import write_document
+
+
+def write(doc, path, streaming):
+    with open(path, "w", encoding="utf-8") as out:
+        write_document(doc, out, validate=False, streaming=streaming)
+
+
+def measure(doc, path, streaming):
+    """Return the time and, in a separate traced run, the peak allocated memory of a write."""
+    start = time.perf_counter()
+    write(doc, path, streaming)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    write(doc, path, streaming)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'files':>6} {'MB':>6} {'streaming':>10} {'peak MB':>8} {'unparse':>10} {'peak MB':>8}")
+    for files in args.files:
+        packages = max(1, files // 100)
+        doc = make_document(packages, files // packages)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "bench.xml")
+            streamed, streamed_peak = measure(doc, path, True)
+            size = os.path.getsize(path)
+            dumped, dumped_peak = measure(doc, path, False)
+        print(f"{files:6} {size / 1e6:6.1f} {streamed:9.2f}s {streamed_peak / 1e6:8.1f} "
+              f"{dumped:9.2f}s {dumped_peak / 1e6:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
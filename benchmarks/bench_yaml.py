@@ -0,0 +1,77 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time of writing and parsing generated YAML documents of growing size with
+each spdx.yaml_engine engine available: libyaml's C loader and dumper and
+PyYAML's pure Python ones.
+
+    python benchmarks/bench_yaml.py [--files N N ...]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from generate import make_document
+
+from spdx import yaml_engine
+from spdx.parsers import yamlparser
+from spdx.parsers.jsonyamlxmlbuilders import Builder
+from spdx.writers.yaml import write_document
+
+
+class QuietLogger(object):
+    """The generated packages list files without filesAnalyzed, drop the errors."""
+
+    def log(self, msg):
+        pass
+
+
+def write(doc, path):
+    start = time.perf_counter()
+    with open(path, "wb") as out:
+        write_document(doc, out, validate=False)
+    return time.perf_counter() - start
+
+
+def parse(path):
+    start = time.perf_counter()
+    with open(path) as f:
+        yamlparser.Parser(Builder(), QuietLogger()).parse(f)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    engines = [engine for engine in yaml_engine.ENGINES if engine != "libyaml" or yaml_engine.default_engine() == "libyaml"]
+    print(f"{'files':>6} {'MB':>6} {'engine':>8} {'write':>8} {'parse':>8}")
+    for files in args.files:
+        packages = max(1, files // 100)
+        doc = make_document(packages, files // packages)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "bench.yaml")
+            for engine in engines:
+                yaml_engine.set_engine(engine)
+                written = write(doc, path)
+                parsed = parse(path)
+                size = os.path.getsize(path)
+                print(f"{files:6} {size / 1e6:6.1f} {engine:>8} {written:7.2f}s {parsed:7.2f}s", flush=True)
+    yaml_engine.set_engine()
+
+
+if __name__ == "__main__":
+    main()
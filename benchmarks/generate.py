@@ -0,0 +1,79 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Synthetic SPDX documents of arbitrary size for the benchmark scripts.
+"""
+
+import hashlib
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spdx.checksum import Checksum, ChecksumAlgorithm
+from spdx.creationinfo import Tool
+from spdx.document import Document
+from spdx.file import File, FileType
+from spdx.license import License
+from spdx.package import Package
+from spdx.relationship import Relationship
+from spdx.utils import NoAssert
+from spdx.version import Version
+
+LICENSE_IDS = ["MIT", "Apache-2.0", "BSD-3-Clause", "GPL-2.0-only", "LGPL-2.1-or-later"]
+
+
+def make_document(packages=10, files_per_package=100):
+    """
+    Return a valid Document with `packages` packages, each containing
+    `files_per_package` files, plus the matching CONTAINS and DESCRIBES
+    relationships.
+    """
+    doc = Document(Version(2, 3), License.from_identifier("CC0-1.0"),
+                   "Benchmark-Document", spdx_id="SPDXRef-DOCUMENT",
+                   namespace="https://spdx.org/spdxdocs/benchmark-0000")
+    doc.creation_info.add_creator(Tool("spdx-benchmarks"))
+    doc.creation_info.created = datetime(2022, 1, 1, 12, 0, 0)
+
+    for p in range(packages):
+        package = Package(name=f"package-{p}", download_location=NoAssert())
+        package.spdx_id = f"SPDXRef-Package-{p}"
+        package.version = "1.0"
+        package.cr_text = NoAssert()
+        package.license_declared = License.from_identifier(LICENSE_IDS[p % len(LICENSE_IDS)])
+        package.conc_lics = NoAssert()
+        package.files_analyzed = False
+        doc.add_package(package)
+        doc.add_relationship(Relationship(f"{doc.spdx_id} DESCRIBES {package.spdx_id}"))
+
+        for f in range(files_per_package):
+            name = f"./package-{p}/src/file-{f}.c"
+            file = File(name, spdx_id=f"SPDXRef-File-{p}-{f}")
+            file.set_checksum(Checksum(ChecksumAlgorithm.SHA1, hashlib.sha1(name.encode()).hexdigest()))
+            file.file_types = [FileType.SOURCE]
+            lic = License.from_identifier(LICENSE_IDS[f % len(LICENSE_IDS)])
+            file.conc_lics = lic
+            file.add_lics(lic)
+            file.copyright = NoAssert()
+            doc.add_file(file)
+            doc.add_relationship(Relationship(f"{package.spdx_id} CONTAINS {file.spdx_id}"))
+    return doc
+
+
+def write_document(doc, path):
+    """Write `doc` to `path` in the format implied by its extension."""
+    from spdx.writers import write_anything
+
+    write_anything.write_file(doc, path, validate=False)
+    return path
@@ -0,0 +1,141 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Change tracking for the indexes a Document keeps of its elements and
+relationships, see spdx.document.ElementIndex and
+spdx.relationship.RelationshipGraph.
+
+The lists of elements and relationships of a Document are TrackedLists,
+counting the changes made to them other than appending. The indexes
+register themselves in `_indexes` of the elements they hold, and an
+element tells them when it changes with `changed`, so that only the
+indexes of its own documents update or rebuild.
+"""
+
+
+def register(element, index):
+    indexes = element._indexes
+    if indexes is None:
+        element._indexes = (index,)
+    elif index not in indexes:
+        element._indexes = indexes + (index,)
+
+
+def unregister(element, index):
+    indexes = element._indexes
+    if indexes is not None and index in indexes:
+        element._indexes = tuple(other for other in indexes if other is not index) or None
+
+
+def changed(element, *args):
+    """Tell the indexes holding `element` that it changed, passing them `args`."""
+    if element._indexes is not None:
+        for index in element._indexes:
+            index.changed(element, *args)
+
+
+class TrackedList(list):
+    """A list counting in `changes` the changes made to it other than appending."""
+
+    changes = 0
+
+    def __setitem__(self, index, value):
+        self.changes += 1
+        super(TrackedList, self).__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self.changes += 1
+        super(TrackedList, self).__delitem__(index)
+
+    def __imul__(self, count):
+        self.changes += 1
+        return super(TrackedList, self).__imul__(count)
+
+    def insert(self, index, value):
+        self.changes += 1
+        super(TrackedList, self).insert(index, value)
+
+    def pop(self, *args):
+        self.changes += 1
+        return super(TrackedList, self).pop(*args)
+
+    def remove(self, value):
+        self.changes += 1
+        super(TrackedList, self).remove(value)
+
+    def clear(self):
+        self.changes += 1
+        super(TrackedList, self).clear()
+
+    def sort(self, **kwargs):
+        self.changes += 1
+        super(TrackedList, self).sort(**kwargs)
+
+    def reverse(self):
+        self.changes += 1
+        super(TrackedList, self).reverse()
+
+
+def tracked(elements):
+    """Return `elements` as a TrackedList, itself if it already is one."""
+    return elements if isinstance(elements, TrackedList) else TrackedList(elements)
+
+
+class ListIndex(object):
+    """
+    Base of the indexes of a list, kept up to date by `update`: the items
+    appended since the last update are added with `add`, and the index is
+    cleared with `clear` and built again after any other change to a
+    TrackedList. The items are registered with the index, which `changed`
+    invalidates by default. An index is pickled and copied empty, and
+    rebuilt at the next update.
+    """
+
+    def __init__(self):
+        self.items = None
+        self.count = 0
+        self.changes = None
+        self.registered = []
+
+    def __reduce__(self):
+        return self.__class__, ()
+
+    def clear(self):
+        raise NotImplementedError
+
+    def add(self, item):
+        raise NotImplementedError
+
+    def changed(self, item, *args):
+        self.invalidate()
+
+    def invalidate(self):
+        """Have the next update rebuild the index."""
+        self.items = None
+
+    def update(self, items):
+        changes = getattr(items, "changes", None)
+        if items is not self.items or changes != self.changes or len(items) < self.count:
+            for item in self.registered:
+                unregister(item, self)
+            self.registered = []
+            self.clear()
+            self.items = items
+            self.count = 0
+            self.changes = changes
+        if len(items) > self.count:
+            for item in items[self.count:]:
+                register(item, self)
+                self.registered.append(item)
+                self.add(item)
+            self.count = len(items)
@@ -60,6 +60,8 @@ class ChecksumAlgorithm(Enum):
 class Checksum(object):
     """Generic checksum algorithm."""
 
+    __slots__ = ("identifier", "value")
+
     def __init__(self, identifier: ChecksumAlgorithm, value: str):
         self.identifier = identifier
         self.value = value
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import os
+import sys
 from spdx.parsers.builderexceptions import FileTypeError
-from spdx.parsers.parse_anything import parse_file
-from spdx.writers.write_anything import write_file
+from spdx.parsers.parse_anything import parse_file, parse_stream
+from spdx.writers.write_anything import write_file, write_stream
 
 import click
 
@@ -38,10 +40,10 @@ def determine_infile_and_outfile(infile, outfile, src, from_, to):
         infile = src[0]
         outfile = src[1]
         # infile = os.path.splitext(infile)[0]
-        if from_ is not None:
+        if from_ is not None and infile != "-":
             infile_path = os.path.splitext(infile)[0]
             infile = infile_path + "." + from_
-        if to is not None:
+        if to is not None and outfile != "-":
             outfile_path = os.path.splitext(outfile)[0]
             outfile = outfile_path + "." + to
         return infile, outfile
@@ -51,7 +53,7 @@ def determine_infile_and_outfile(infile, outfile, src, from_, to):
         ' pyspdxtools_convertor -f/--from <type> <input_file> --outfile <output_file> '
         """
         infile = src[0]
-        if from_ is not None:
+        if from_ is not None and infile != "-":
             infile_path = os.path.splitext(infile)[0]
             infile = infile_path + "." + from_
         return infile, outfile
@@ -61,7 +63,7 @@ def determine_infile_and_outfile(infile, outfile, src, from_, to):
         ' pyspdxtools_convertor --infile <input_file> -t/--to <type> <output_file>'
         """
         outfile = src[0]
-        if to is not None:
+        if to is not None and outfile != "-":
             outfile_path = os.path.splitext(outfile)[0]
             outfile = outfile_path + "." + to
         return infile, outfile
@@ -85,12 +87,15 @@ def determine_infile_and_outfile(infile, outfile, src, from_, to):
     "from_",
     type=click.Choice(["tag", "rdf"], case_sensitive=False))
 @click.option("--force", is_flag=True, help="convert even if there are some parsing errors or inconsistencies")
-def main(infile, outfile, src, from_, to, force):
+@click.option("--compact", is_flag=True, help="write JSON, YAML or XML without indentation, for machines rather than people")
+def main(infile, outfile, src, from_, to, force, compact):
     """
     CLI-TOOL for converting a RDF or TAG file to RDF, JSON, YAML, TAG or XML format.
 
     To use : run 'pyspdxtools_convertor -f <from_TYPE> <input file> -t <to_TYPE> <output_file>' command on terminal or use ' pyspdxtools_convertor --infile <input file name> --outfile <output file name> '
 
+    Use '-' as input file to read from stdin, with the format detected from the content, and as output file to write to stdout, which requires -t/--to.
+
     """
     try:
         infile, outfile = determine_infile_and_outfile(infile, outfile, src, from_, to)
@@ -99,13 +104,37 @@ def main(infile, outfile, src, from_, to, force):
         print_help_msg(main)
         return
 
-    doc, errors = parse_file(infile)
+    if outfile == "-" and to is None:
+        print("Writing to stdout requires -t/--to.")
+        print_help_msg(main)
+        return
+
+    if outfile == "-":
+        # keep the messages of the parser and writers out of the document
+        out = sys.stdout.buffer
+        with contextlib.redirect_stdout(sys.stderr):
+            return convert(infile, None, force, compact, out, to)
+    return convert(infile, outfile, force, compact)
+
+
+def convert(infile, outfile, force, compact, out=None, to=None):
+    """
+    Convert the document in `infile`, "-" for stdin, writing it to the file
+    `outfile`, or to the binary file `out` in the format `to`.
+    """
+    if infile == "-":
+        doc, errors = parse_stream(sys.stdin.buffer)
+    else:
+        doc, errors = parse_file(infile)
     if errors:
         print("Errors while parsing: ", errors)
         if not force:
             return 1
 
-    write_file(doc, outfile)
+    if out is not None:
+        write_stream(doc, out, to, compact=compact)
+    else:
+        write_file(doc, outfile, compact=compact)
 
 
 if __name__ == "__main__":
@@ -13,16 +13,17 @@
 # limitations under the License.
 
 import os
+import sys
 
 from spdx import utils
-from spdx.parsers.parse_anything import parse_file
+from spdx.parsers.parse_anything import parse_file, parse_stream
 import spdx.file as spdxfile
 
 import click
 
 
 @click.command()
-@click.option("--file", prompt="File name", help="The file to be parsed")
+@click.option("--file", prompt="File name", help="The file to be parsed, - for stdin")
 @click.option("--force", is_flag=True, help="print information even if there are some parsing errors")
 def main(file, force):
     """
@@ -30,8 +31,13 @@ def main(file, force):
 
     To use : run `pyspdxtools_parser` using terminal or run `pyspdxtools_parser --file <file name>`
 
+    With `--file -` the document is read from stdin, and its format is detected from the content.
+
     """
-    doc, errors = parse_file(file)
+    if file == "-":
+        doc, errors = parse_stream(sys.stdin.buffer)
+    else:
+        doc, errors = parse_file(file)
     if errors:
         print("Errors while parsing: ", errors)
         if not force:
@@ -0,0 +1,115 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compressed documents for parse_file and write_file: gzip, bz2 and xz with
+the standard library, and zstd if the zstandard package is installed.
+
+Files are (de)compressed while the parsers and writers read and write
+them, without intermediate files. The compression of a file being read is
+recognized by its magic bytes, whatever its name; the one of a file being
+written by the suffix of its name, like "doc.spdx.json.gz".
+"""
+
+import bz2
+import contextlib
+import gzip
+import importlib
+import io
+import lzma
+
+COMPRESSIONS = ("gzip", "bz2", "xz", "zstd")
+
+SUFFIXES = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+
+MAGIC_BYTES = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+
+
+def split_suffix(fn):
+    """
+    Return the file name `fn` without its compression suffix, and the
+    compression the suffix stands for, or None if it has none.
+    """
+    for suffix, compression in SUFFIXES.items():
+        if fn.endswith(suffix):
+            return fn[: -len(suffix)], compression
+    return fn, None
+
+
+def detect(head):
+    """Return the compression whose magic bytes `head` starts with, or None."""
+    for compression, magic in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def zstandard():
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError:
+        raise ImportError("Install the zstandard package for zstd compressed documents")
+
+
+def decompressed(raw, compression):
+    """Return a binary file like object reading `raw` decompressed."""
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    if compression == "bz2":
+        return bz2.BZ2File(raw, "rb")
+    if compression == "xz":
+        return lzma.LZMAFile(raw, "rb")
+    return io.BufferedReader(zstandard().ZstdDecompressor().stream_reader(raw))
+
+
+def compressed(raw, compression):
+    """Return a binary file like object writing to `raw` compressed."""
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="wb")
+    if compression == "bz2":
+        return bz2.BZ2File(raw, "wb")
+    if compression == "xz":
+        return lzma.LZMAFile(raw, "wb")
+    return zstandard().ZstdCompressor().stream_writer(raw)
+
+
+@contextlib.contextmanager
+def open_file(fn, mode="r", encoding=None):
+    """
+    Open the file `fn` like open(fn, mode, encoding=encoding), with `mode`
+    one of "r", "rb", "w" or "wb", decompressing what is read and
+    compressing what is written as described above.
+    """
+    writing = mode.startswith("w")
+    with open(fn, "wb" if writing else "rb") as raw:
+        if writing:
+            compression = split_suffix(fn)[1]
+        else:
+            compression = detect(raw.peek(max(len(magic) for magic in MAGIC_BYTES.values())))
+
+        with contextlib.ExitStack() as stack:
+            stream = raw
+            if compression is not None:
+                stream = stack.enter_context(compressed(raw, compression) if writing else decompressed(raw, compression))
+            if "b" not in mode:
+                stream = stack.enter_context(io.TextIOWrapper(stream, encoding=encoding))
+            yield stream
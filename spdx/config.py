@@ -62,11 +62,19 @@ def load_exception_list(file_name):
     )
 
 
-(_lmajor, _lminor), LICENSE_MAP = load_license_list(_licenses)
-LICENSE_LIST_VERSION = Version(major=_lmajor, minor=_lminor)
+def _load_lists():
+    global LICENSE_MAP, LICENSE_LIST_VERSION, EXCEPTION_MAP
+    (lmajor, lminor), license_map = load_license_list(_licenses)
+    (emajor, eminor), exception_map = load_exception_list(_exceptions)
+    assert (lmajor, lminor) == (emajor, eminor)
+    LICENSE_LIST_VERSION = Version(major=lmajor, minor=lminor)
+    LICENSE_MAP = license_map
+    EXCEPTION_MAP = exception_map
 
-(_emajor, _eminor), EXCEPTION_MAP = load_exception_list(_exceptions)
-EXCEPTION_LIST_VERSION = Version(major=_emajor, minor=_eminor)
 
-assert LICENSE_LIST_VERSION == EXCEPTION_LIST_VERSION
-del _emajor, _eminor, EXCEPTION_LIST_VERSION
+def __getattr__(name):
+    # the lists are only loaded when first used, not when importing
+    if name in ("LICENSE_MAP", "LICENSE_LIST_VERSION", "EXCEPTION_MAP"):
+        _load_lists()
+        return globals()[name]
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
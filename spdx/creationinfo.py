@@ -134,7 +134,8 @@ class CreationInfo(object):
         Type: Creator.
     - comment: Creation comment, optional. Type: str.
     - license_list_version: version of SPDX license used in creation of SPDX
-        document. One, optional. Type: spdx.version.Version
+        document. One, optional, the version of spdx.config's list by
+        default. Type: spdx.version.Version
     - created: Creation date. Mandatory one. Type: datetime.
     """
 
@@ -142,11 +143,13 @@ class CreationInfo(object):
         self,
         created=None,
         comment=None,
-        license_list_version=config.LICENSE_LIST_VERSION,
+        license_list_version=None,
     ):
         self.creators = []
         self.created = created
         self.comment = comment
+        if license_list_version is None:
+            license_list_version = config.LICENSE_LIST_VERSION
         self.license_list_version = license_list_version
 
     def add_creator(self, creator):
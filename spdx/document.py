@@ -13,6 +13,7 @@ from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from spdx.file import File
+from spdx import changes
 from spdx.license import ExtractedLicense
 from spdx.parsers.loggers import ErrorMessages
 
@@ -21,7 +22,54 @@ import warnings
 from functools import total_ordering
 from spdx.relationship import Relationship
 
-from spdx.relationship import Relationship
+from spdx.relationship import Relationship, RelationshipGraph
+
+
+TRACKED_LISTS = ("files", "packages", "snippet", "relationships")
+
+
+class ElementIndex(changes.ListIndex):
+    """
+    The elements of one list of a Document by SPDX id, the first one for an
+    id used more than once. Elements are indexed as they are added, or at
+    the next lookup if appended to the list directly. Setting the SPDX id
+    of an indexed element moves it to its new id, unless ids are used more
+    than once, and any change to the list other than appending has the
+    index rebuilt.
+    """
+
+    def __init__(self):
+        super(ElementIndex, self).__init__()
+        self.by_spdx_id = dict()
+        self.duplicates = 0
+
+    def clear(self):
+        self.by_spdx_id = dict()
+        self.duplicates = 0
+
+    def add(self, element):
+        if element.spdx_id is not None:
+            if element.spdx_id in self.by_spdx_id:
+                self.duplicates += 1
+            else:
+                self.by_spdx_id[element.spdx_id] = element
+
+    def changed(self, element, old_spdx_id):
+        spdx_id = element.spdx_id
+        if self.items is None or spdx_id == old_spdx_id:
+            return
+        if self.duplicates or spdx_id in self.by_spdx_id:
+            # which element an id stands for depends on their order
+            self.invalidate()
+            return
+        self.by_spdx_id.pop(old_spdx_id, None)
+        if spdx_id is not None:
+            self.by_spdx_id[spdx_id] = element
+
+    def get(self, elements, spdx_id):
+        """Return the element of the list `elements` with the SPDX id `spdx_id`, or None."""
+        self.update(elements)
+        return self.by_spdx_id.get(spdx_id)
 
 
 @total_ordering
@@ -135,11 +183,21 @@ class Document(object):
         self.annotations = []
         self.relationships: List[Relationship] = []
         self.snippet = []
+        self._package_index = ElementIndex()
+        self._file_index = ElementIndex()
+        self._snippet_index = ElementIndex()
+        self._relationship_graph = RelationshipGraph()
 
         # due to backwards compatibility write input argument for license list version to creation info
         if license_list_version:
             self.creation_info.set_license_list_version(license_list_version)
 
+    def __setattr__(self, name, value):
+        # the indexes notice changes to these lists other than appending
+        if name in TRACKED_LISTS:
+            value = changes.tracked(value)
+        super(Document, self).__setattr__(name, value)
+
     def add_review(self, review):
         self.reviews.append(review)
 
@@ -157,12 +215,56 @@ class Document(object):
 
     def add_snippet(self, snip):
         self.snippet.append(snip)
+        self._snippet_index.update(self.snippet)
 
     def add_package(self, package):
         self.packages.append(package)
+        self._package_index.update(self.packages)
 
     def add_file(self, file: 'File') -> None:
         self.files.append(file)
+        self._file_index.update(self.files)
+
+    def get_package(self, spdx_id):
+        """Return the package with the SPDX id `spdx_id`, or None."""
+        return self._package_index.get(self.packages, spdx_id)
+
+    def get_file(self, spdx_id) -> Optional['File']:
+        """Return the file with the SPDX id `spdx_id`, or None."""
+        return self._file_index.get(self.files, spdx_id)
+
+    def get_snippet(self, spdx_id):
+        """Return the snippet with the SPDX id `spdx_id`, or None."""
+        return self._snippet_index.get(self.snippet, spdx_id)
+
+    def get_element(self, spdx_id):
+        """
+        Return the package, file or snippet with the SPDX id `spdx_id`, in
+        that order if the id is used more than once, or None. Lookups take
+        constant time: the elements are indexed by SPDX id as they are
+        added, and follow the changes of their SPDX ids.
+        """
+        for get in (self.get_package, self.get_file, self.get_snippet):
+            element = get(spdx_id)
+            if element is not None:
+                return element
+        return None
+
+    def get_relationship_graph(self) -> RelationshipGraph:
+        """
+        Return the relationships of the document as a RelationshipGraph,
+        updated with the changes to the relationships since the last call.
+        """
+        self._relationship_graph.update(self.relationships)
+        return self._relationship_graph
+
+    def get_contained_files(self, spdx_id) -> List['File']:
+        """
+        Return the files the package with the SPDX id `spdx_id` CONTAINS or
+        that are CONTAINED_BY it, in the order of the relationships.
+        """
+        files = map(self.get_file, self.get_relationship_graph().contained(spdx_id))
+        return [file for file in files if file is not None]
 
     # For backwards compatibility with older versions, we support a
     # mode where the first package in a document may be referred to as
@@ -16,6 +16,7 @@ from enum import Enum, auto
 from functools import total_ordering
 from typing import Optional
 
+from spdx import changes
 from spdx import utils
 from spdx.checksum import Checksum, ChecksumAlgorithm
 from spdx.license import License
@@ -79,9 +80,30 @@ class File(object):
     -attribution_text: optional string.
     """
 
+    __slots__ = (
+        "name",
+        "_spdx_id",
+        "_indexes",
+        "comment",
+        "file_types",
+        "checksums",
+        "conc_lics",
+        "licenses_in_file",
+        "license_comment",
+        "copyright",
+        "notice",
+        "attribution_text",
+        "contributors",
+        "dependencies",
+        "artifact_of_project_name",
+        "artifact_of_project_home",
+        "artifact_of_project_uri",
+    )
+
     def __init__(self, name, spdx_id=None):
         self.name = name
-        self.spdx_id = spdx_id
+        self._spdx_id = spdx_id
+        self._indexes = None
         self.comment = None
         self.file_types = []
         self.checksums = {}
@@ -100,6 +122,15 @@ class File(object):
     def __eq__(self, other):
         return isinstance(other, File) and self.name == other.name
 
+    @property
+    def spdx_id(self):
+        return self._spdx_id
+
+    @spdx_id.setter
+    def spdx_id(self, value):
+        old_spdx_id, self._spdx_id = self._spdx_id, value
+        changes.changed(self, old_spdx_id)
+
     def __lt__(self, other):
         return self.name < other.name
 
@@ -0,0 +1,35 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The formats of SPDX documents, as told by the names of their files, for
+spdx.parsers.parse_anything and spdx.writers.write_anything.
+"""
+
+from spdx import compression
+from spdx.parsers.builderexceptions import FileTypeError
+
+
+def format_of_name(fn):
+    """Return the format of the file `fn` from its name, without compression suffix."""
+    name = compression.split_suffix(fn)[0]
+    if name.endswith(".rdf") or name.endswith(".rdf.xml"):
+        return "rdf"
+    elif name.endswith(".tag") or name.endswith(".spdx"):
+        return "tag"
+    elif name.endswith(".json"):
+        return "json"
+    elif name.endswith(".xml"):
+        return "xml"
+    elif name.endswith(".yaml") or name.endswith(".yml"):
+        return "yaml"
+    raise FileTypeError("FileType Not Supported" + str(fn))
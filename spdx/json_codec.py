@@ -0,0 +1,174 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+JSON encoding and decoding for the JSON parser and writer. Documents are
+decoded with the fastest of the supported libraries that is installed:
+orjson, msgspec, ujson, or else the standard library's json module.
+
+All of them decode to the same values. The encoded documents are
+equivalent, but the layout differs: orjson only indents by two spaces, and
+the standard library and ujson escape non-ASCII characters. So documents
+are encoded with the standard library unless another backend is chosen
+with set_backend, and the output does not depend on what is installed.
+"""
+
+import datetime
+import importlib
+import json
+
+# in order of preference
+BACKENDS = ("orjson", "msgspec", "ujson", "json")
+
+
+class JsonCodec(object):
+    """The standard library's json module."""
+
+    name = "json"
+    # number of spaces per level of pretty output
+    indent = 4
+
+    def loads(self, data):
+        """Return the value of the JSON text or UTF-8 bytes `data`."""
+        return json.loads(data)
+
+    def dumps(self, obj, pretty=False, default=None):
+        """
+        Return `obj` as JSON text, indented by `indent` spaces if `pretty`
+        and without any whitespace otherwise. `default` is called for
+        objects which cannot be encoded, like json.dumps' default.
+        """
+        if pretty:
+            return json.dumps(obj, indent=self.indent, default=default)
+        return json.dumps(obj, separators=(",", ":"), default=default)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+    indent = 2
+
+    def __init__(self):
+        self.orjson = importlib.import_module("orjson")
+
+    def loads(self, data):
+        return self.orjson.loads(data)
+
+    def dumps(self, obj, pretty=False, default=None):
+        # hand datetimes to `default` like the json module does
+        option = self.orjson.OPT_PASSTHROUGH_DATETIME
+        if pretty:
+            option |= self.orjson.OPT_INDENT_2
+        return self.orjson.dumps(obj, default=default, option=option).decode("utf-8")
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        self.msgspec = importlib.import_module("msgspec")
+        self.decoder = self.msgspec.json.Decoder()
+
+    def loads(self, data):
+        return self.decoder.decode(data)
+
+    def dumps(self, obj, pretty=False, default=None):
+        if default is not None:
+            # msgspec encodes datetimes itself, without calling enc_hook
+            obj = with_datetimes_converted(obj, default)
+        data = self.msgspec.json.encode(obj, enc_hook=default)
+        if pretty:
+            data = self.msgspec.json.format(data, indent=self.indent)
+        return data.decode("utf-8")
+
+
+def with_datetimes_converted(obj, default):
+    """Return `obj` with the datetimes it contains replaced by default(datetime)."""
+    if isinstance(obj, dict):
+        return {key: with_datetimes_converted(value, default) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [with_datetimes_converted(value, default) for value in obj]
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return default(obj)
+    return obj
+
+
+class UjsonCodec(JsonCodec):
+    name = "ujson"
+
+    def __init__(self):
+        self.ujson = importlib.import_module("ujson")
+
+    def loads(self, data):
+        return self.ujson.loads(data)
+
+    def dumps(self, obj, pretty=False, default=None):
+        return self.ujson.dumps(
+            obj, indent=self.indent if pretty else 0, escape_forward_slashes=False, default=default
+        )
+
+
+CODECS = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "ujson": UjsonCodec,
+    "json": JsonCodec,
+}
+
+_codec = None
+_backend_set = False
+
+
+def get_codec(name=None):
+    """
+    Return the codec for the backend `name`, or the active one if None.
+    Raise ValueError for an unknown backend and ImportError if it is not
+    installed.
+    """
+    global _codec
+    if name is not None:
+        if name not in CODECS:
+            raise ValueError("Unknown JSON backend {0}, expected one of {1}".format(name, ", ".join(BACKENDS)))
+        return CODECS[name]()
+    if _codec is None:
+        for name in BACKENDS:
+            try:
+                _codec = CODECS[name]()
+                break
+            except ImportError:
+                continue
+    return _codec
+
+
+def get_encoder():
+    """
+    Return the codec the writers encode with: the backend chosen with
+    set_backend, or else the standard library's json module.
+    """
+    if not _backend_set:
+        return JsonCodec()
+    return _codec
+
+
+def set_backend(name=None):
+    """
+    Use the backend `name` for JSON from now on, for decoding and encoding,
+    or the preferred one installed for decoding and the standard library
+    for encoding if None. Raise like get_codec.
+    """
+    global _codec, _backend_set
+    _codec = get_codec(name) if name is not None else None
+    _backend_set = name is not None
+
+
+def backend():
+    """Return the name of the active backend."""
+    return get_codec().name
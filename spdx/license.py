@@ -14,9 +14,17 @@ from functools import total_ordering
 
 from spdx import config
 
+MAX_INTERNED_LICENSES = 4096
+
+_interned_licenses = dict()
+
 
 @total_ordering
 class License(object):
+    # _frozen is set on license trees shared through the license expression
+    # cache, see `spdx.utils.CachedLicenseListParser`.
+    __slots__ = ("_full_name", "_identifier", "_frozen")
+
     def __init__(self, full_name, identifier):
         """if one of the argument is None, we try to map as much as possible
         """
@@ -33,6 +41,20 @@ class License(object):
         """
         return cls(None, identifier)
 
+    @classmethod
+    def interned(cls, identifier):
+        """
+        Return a frozen License for identifier like from_identifier does,
+        the same one every time for up to MAX_INTERNED_LICENSES identifiers.
+        The parsers use it so that every "MIT" of a document is one object.
+        """
+        lic = _interned_licenses.get(identifier)
+        if lic is None:
+            lic = cls.from_identifier(identifier).freeze()
+            if len(_interned_licenses) < MAX_INTERNED_LICENSES:
+                lic = _interned_licenses.setdefault(identifier, lic)
+        return lic
+
     @classmethod
     def from_full_name(cls, full_name):
         """
@@ -84,6 +106,22 @@ class License(object):
 
         self._identifier = value
 
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(
+                "License {0} is shared and cannot be modified".format(self.identifier)
+            )
+        super(License, self).__setattr__(name, value)
+
+    def freeze(self):
+        """
+        Make this license, and the licenses it is composed of, read-only.
+        """
+        for value in (getattr(self, "license_1", None), getattr(self, "license_2", None)):
+            if isinstance(value, License):
+                value.freeze()
+        object.__setattr__(self, "_frozen", True)
+        return self
 
     def __eq__(self, other):
         return (
@@ -107,6 +145,8 @@ class LicenseConjunction(License):
     A conjunction of two licenses.
     """
 
+    __slots__ = ("license_1", "license_2")
+
     def __init__(self, license_1, license_2):
         self.license_1 = license_1
         self.license_2 = license_2
@@ -138,6 +178,8 @@ class LicenseDisjunction(License):
     A disjunction of two licenses.
     """
 
+    __slots__ = ("license_1", "license_2")
+
     def __init__(self, license_1, license_2):
         self.license_1 = license_1
         self.license_2 = license_2
@@ -174,6 +216,8 @@ class ExtractedLicense(License):
     - full_name: license name. str or utils.NoAssert.
     """
 
+    __slots__ = ("text", "cross_ref", "comment")
+
     def __init__(self, identifier):
         super(ExtractedLicense, self).__init__(None, identifier)
         self.text = None
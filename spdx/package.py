@@ -15,6 +15,7 @@ from enum import Enum
 from functools import reduce
 from typing import Optional, Union
 
+from spdx import changes
 from spdx import creationinfo
 from spdx import license
 from spdx import utils
@@ -84,6 +85,40 @@ class Package(object):
      - primary_package_purpose: Optional one. Type: PackagePurpose
     """
 
+    __slots__ = (
+        "name",
+        "_spdx_id",
+        "_indexes",
+        "version",
+        "file_name",
+        "supplier",
+        "originator",
+        "download_location",
+        "files_analyzed",
+        "homepage",
+        "verif_code",
+        "checksums",
+        "source_info",
+        "conc_lics",
+        "license_declared",
+        "license_comment",
+        "licenses_from_files",
+        "cr_text",
+        "summary",
+        "description",
+        "comment",
+        "attribution_text",
+        "verif_exc_files",
+        "pkg_ext_refs",
+        "primary_package_purpose",
+        "release_date",
+        "built_date",
+        "valid_until_date",
+        # packages are few; other attributes set on them, like the former
+        # files_verified, still go to __dict__
+        "__dict__",
+    )
+
     def __init__(
         self,
         name=None,
@@ -95,7 +130,8 @@ class Package(object):
         originator=None,
     ):
         self.name = name
-        self.spdx_id = spdx_id
+        self._spdx_id = spdx_id
+        self._indexes = None
         self.version = version
         self.file_name = file_name
         self.supplier: Optional[Union[Creator, NoAssert]] = supplier
@@ -122,6 +158,15 @@ class Package(object):
         self.built_date: Optional[datetime] = None
         self.valid_until_date: Optional[datetime] = None
 
+    @property
+    def spdx_id(self):
+        return self._spdx_id
+
+    @spdx_id.setter
+    def spdx_id(self, value):
+        old_spdx_id, self._spdx_id = self._spdx_id, value
+        changes.changed(self, old_spdx_id)
+
     @property
     def checksum(self):
         """
@@ -0,0 +1,55 @@
+# Copyright (c) 2014 Ahmed H. Ismail
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Messages for the value errors of the RDF parser and of the JSON, YAML and
+XML parsers, by key.
+"""
+
+ERROR_MESSAGES = {
+    "DOC_VERS_VALUE": "Invalid specVersion '{0}' must be SPDX-M.N where M and N are numbers.",
+    "DOC_D_LICS": "Invalid dataLicense '{0}' must be http://spdx.org/licenses/CC0-1.0.",
+    "DOC_SPDX_ID_VALUE": "Invalid SPDXID value, SPDXID must be the document namespace appended "
+    'by "#SPDXRef-DOCUMENT", line: {0}',
+    "DOC_NAMESPACE_VALUE": 'Invalid DocumentNamespace value {0}, must contain a scheme (e.g. "https:") '
+    'and should not contain the "#" delimiter.',
+    "LL_VALUE": "Invalid licenseListVersion '{0}' must be of the format N.N where N is a number",
+    "CREATED_VALUE": "Invalid created value '{0}' must be date in ISO 8601 format.",
+    "CREATOR_VALUE": "Invalid creator value '{0}' must be Organization, Tool or Person.",
+    "EXT_DOC_REF_VALUE": "Failed to extract {0} from ExternalDocumentRef.",
+    "PKG_SPDX_ID_VALUE": 'SPDXID must be "SPDXRef-[idstring]" where [idstring] is a unique string containing '
+    'letters, numbers, ".", "-".',
+    "PKG_SUPPL_VALUE": "Invalid package supplier value '{0}' must be Organization, Person or NOASSERTION.",
+    "PKG_ORIGINATOR_VALUE": "Invalid package supplier value '{0}'  must be Organization, Person or NOASSERTION.",
+    "PKG_DOWN_LOC": "Invalid package download location value '{0}'  must be a url or NONE or NOASSERTION",
+    "PKG_FILES_ANALYZED_VALUE": "FilesAnalyzed must be a boolean value, line: {0}",
+    "PKG_CONC_LIST": "Package concluded license list must have more than one member",
+    "LICS_LIST_MEMBER": "Declarative or Conjunctive license set member must be a license url or identifier",
+    "PKG_SINGLE_LICS": "Package concluded license must be a license url or spdx:noassertion or spdx:none.",
+    "PKG_LICS_INFO_FILES": "Package licenseInfoFromFiles must be a license or spdx:none or spdx:noassertion",
+    "FILE_SPDX_ID_VALUE": 'SPDXID must be "SPDXRef-[idstring]" where [idstring] is a unique string containing '
+    'letters, numbers, ".", "-".',
+    "PKG_EXT_REF_CATEGORY": '\'{0}\' must be "SECURITY", "PACKAGE-MANAGER", or "OTHER".',
+    "PKG_EXT_REF_TYPE": '{0} must be a unique string containing letters, numbers, ".", or "-".',
+    "FILE_TYPE": "Unknown file type.",
+    "FILE_SINGLE_LICS": "File concluded license must be a license url or spdx:noassertion or spdx:none.",
+    "REVIEWER_VALUE": "Invalid reviewer value '{0}' must be Organization, Tool or Person.",
+    "REVIEW_DATE": "Invalid review date value '{0}' must be date in ISO 8601 format.",
+    "ANNOTATOR_VALUE": "Invalid annotator value '{0}' must be Organization, Tool or Person.",
+    "ANNOTATION_DATE": "Invalid annotation date value '{0}' must be date in ISO 8601 format.",
+    "SNIPPET_SPDX_ID_VALUE": 'SPDXID must be "SPDXRef-[idstring]" where [idstring] is a unique string '
+    'containing letters, numbers, ".", "-".',
+    "SNIPPET_SINGLE_LICS": "Snippet Concluded License must be a license url or spdx:noassertion or spdx:none.",
+    "SNIPPET_LIC_INFO": "License Information in Snippet must be a license url or a reference "
+    "to the license, denoted by LicenseRef-[idstring] or spdx:noassertion or spdx:none.",
+    "RELATIONSHIP": "relationship type must be of supported type",
+}
@@ -0,0 +1,144 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Read a JSON document incrementally, one member of the top level object or
+one element of an array at a time, so that a large document never has to
+be decoded into a single tree.
+
+The input is read in chunks and each value is decoded with
+json.JSONDecoder.raw_decode once enough of it has been read, so the values
+are the same as json.load gives for them.
+"""
+
+import codecs
+import json
+import re
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+WHITESPACE_REGEX = re.compile(r"[ \t\n\r]*")
+NUMBER_CHARACTERS = frozenset("0123456789+-.eE")
+
+
+class JsonReader(object):
+    """
+    Incremental reader for the JSON text read from the file like object
+    `fil`, opened in text or binary mode. Malformed JSON raises
+    json.JSONDecodeError, with positions relative to the data read so far.
+    """
+
+    def __init__(self, fil, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.fil = fil
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = None
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def read(self, size):
+        """Append at least `size` more characters to the buffer unless at the end."""
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        chunks = []
+        length = 0
+        while length < size:
+            chunk = self.fil.read(max(size - length, self.chunk_size))
+            if not chunk:
+                self.eof = True
+                if self.text_decoder is not None:
+                    chunks.append(self.text_decoder.decode(b"", final=True))
+                break
+            if isinstance(chunk, bytes):
+                if self.text_decoder is None:
+                    self.text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+                chunk = self.text_decoder.decode(chunk)
+            chunks.append(chunk)
+            length += len(chunk)
+        self.buffer += "".join(chunks)
+
+    def peek(self):
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            self.pos = WHITESPACE_REGEX.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self.read(self.chunk_size)
+
+    def expect(self, characters):
+        """Consume the next character, which must be one of `characters`."""
+        char = self.peek()
+        if not char or char not in characters:
+            raise json.JSONDecodeError(
+                "Expecting {0}".format(" or ".join(repr(c) for c in characters)),
+                self.buffer,
+                self.pos,
+            )
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode and return the next value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # a number may go on in the part not read yet
+                if self.eof or self.buffer[end - 1] in '"]}' or (
+                    end < len(self.buffer) and self.buffer[end] not in NUMBER_CHARACTERS
+                ):
+                    self.pos = end
+                    return obj
+            # read as much again as is buffered so that a long value is
+            # decoded a bounded number of times
+            self.read(max(len(self.buffer) - self.pos, self.chunk_size))
+
+    def members(self):
+        """
+        Iterate over the keys of the object starting at the next character.
+        After each key the caller consumes its value, with `value` or
+        `elements`, before asking for the next one.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                self.expect('"')
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+    def elements(self):
+        """Iterate over the decoded elements of the array starting at the next character."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+    def end(self):
+        """Raise json.JSONDecodeError if anything but whitespace is left."""
+        if self.peek():
+            raise json.JSONDecodeError("Extra data", self.buffer, self.pos)
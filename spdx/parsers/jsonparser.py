@@ -10,10 +10,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-
+from spdx import document
+from spdx import json_codec
 from spdx.parsers import jsonyamlxml
-
+from spdx.parsers.json_streaming import DEFAULT_CHUNK_SIZE, JsonReader
 
 class Parser(jsonyamlxml.Parser):
     """
@@ -26,5 +26,50 @@ class Parser(jsonyamlxml.Parser):
         super(Parser, self).__init__(builder, logger)
 
     def parse(self, file):
-        self.json_yaml_set_document(json.load(file))
+        """
+        Parse the JSON document read from `file`, decoded as a whole with
+        the active json_codec backend.
+        """
+        self.json_yaml_set_document(json_codec.get_codec().loads(file.read()))
         return super(Parser, self).parse()
+
+    def parse_stream(self, file, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Parse the JSON document read from the file-like `file` without
+        decoding it into memory at once. The elements of the relationships,
+        snippets, packages and files arrays are parsed one at a time as soon
+        as they are read; the document is the same as the one `parse` gives.
+        """
+        reader = JsonReader(file, chunk_size)
+        if reader.peek() != "{":
+            data = reader.value()
+            reader.end()
+            self.json_yaml_set_document(data)
+            return super(Parser, self).parse()
+
+        self.error = False
+        self.document = document.Document()
+        self.document_object = dict()
+        streamed = False
+        for key in reader.members():
+            # only stream once the object is known to be the document
+            if key in jsonyamlxml.STREAMED_FIELDS and self.document_object.get("spdxVersion") and reader.peek() == "[":
+                section = jsonyamlxml.ParsedSection(key)
+                for element in reader.elements():
+                    self.parse_section_element(section, element)
+                self.document_object[key] = section
+                streamed = True
+            else:
+                self.document_object[key] = reader.value()
+        reader.end()
+
+        if not streamed:
+            self.json_yaml_set_document(self.document_object)
+            return super(Parser, self).parse()
+        for key in ("packages", "files"):
+            # arrays read before "spdxVersion"
+            if isinstance(self.document_object.get(key), list):
+                for element in self.document_object[key]:
+                    if isinstance(element, dict):
+                        jsonyamlxml.set_sha1(element, element.get("checksums", []))
+        return self.parse_document_object()
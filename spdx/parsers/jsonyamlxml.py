@@ -13,18 +13,17 @@ from datetime import datetime
 from enum import Enum, auto
 from typing import List, Dict, Tuple, Callable, Optional
 
+from spdx import changes
 from spdx import document
 from spdx import utils
-from spdx.license import LicenseConjunction, LicenseDisjunction
+from spdx.license import License, LicenseConjunction, LicenseDisjunction
 from spdx.package import ExternalPackageRef, PackagePurpose, Package
-from spdx.parsers import rdf
 from spdx.parsers.builderexceptions import SPDXValueError, CardinalityError, OrderError
+from spdx.parsers.error_messages import ERROR_MESSAGES
 from spdx.parsers.loggers import ErrorMessages
 from spdx.snippet import Snippet
 from spdx.utils import UnKnown, NoAssert
 
-ERROR_MESSAGES = rdf.ERROR_MESSAGES
-
 
 class BaseParser(object):
     def __init__(self, builder, logger):
@@ -648,8 +647,7 @@ class SnippetParser(BaseParser):
         - concluded_license: Python str/unicode
         """
         if isinstance(concluded_license, str):
-            lic_parser = utils.LicenseListParser()
-            lic_parser.build(write_tables=0, debug=0)
+            lic_parser = utils.get_license_list_parser()
             license_object = self.replace_license(lic_parser.parse(concluded_license))
             try:
                 return self.builder.set_snip_concluded_license(
@@ -670,8 +668,7 @@ class SnippetParser(BaseParser):
         if isinstance(license_info_from_snippet, list):
             for lic_in_snippet in license_info_from_snippet:
                 if isinstance(lic_in_snippet, str):
-                    lic_parser = utils.LicenseListParser()
-                    lic_parser.build(write_tables=0, debug=0)
+                    lic_parser = utils.get_license_list_parser()
                     license_object = self.replace_license(
                         lic_parser.parse(lic_in_snippet)
                     )
@@ -901,8 +898,7 @@ class FileParser(BaseParser):
         - concluded_license: Python str/unicode
         """
         if isinstance(concluded_license, str):
-            lic_parser = utils.LicenseListParser()
-            lic_parser.build(write_tables=0, debug=0)
+            lic_parser = utils.get_license_list_parser()
             license_object = self.replace_license(lic_parser.parse(concluded_license))
             try:
                 return self.builder.set_concluded_license(self.document, license_object)
@@ -923,8 +919,7 @@ class FileParser(BaseParser):
         if isinstance(license_info_in_files, list):
             for license_info_in_file in license_info_in_files:
                 if isinstance(license_info_in_file, str):
-                    lic_parser = utils.LicenseListParser()
-                    lic_parser.build(write_tables=0, debug=0)
+                    lic_parser = utils.get_license_list_parser()
                     license_object = self.replace_license(
                         lic_parser.parse(license_info_in_file)
                     )
@@ -1417,8 +1412,7 @@ class PackageParser(BaseParser):
         - pkg_concluded_license: Python str/unicode
         """
         if isinstance(pkg_concluded_license, str):
-            lic_parser = utils.LicenseListParser()
-            lic_parser.build(write_tables=0, debug=0)
+            lic_parser = utils.get_license_list_parser()
             license_object = self.replace_license(
                 lic_parser.parse(pkg_concluded_license)
             )
@@ -1447,8 +1441,7 @@ class PackageParser(BaseParser):
         if isinstance(license_info_from_files, list):
             for license_info_from_file in license_info_from_files:
                 if isinstance(license_info_from_file, str):
-                    lic_parser = utils.LicenseListParser()
-                    lic_parser.build(write_tables=0, debug=0)
+                    lic_parser = utils.get_license_list_parser()
                     license_object = self.replace_license(
                         lic_parser.parse(license_info_from_file)
                     )
@@ -1491,8 +1484,7 @@ class PackageParser(BaseParser):
         - pkg_declared_license: Python str/unicode
         """
         if isinstance(pkg_declared_license, str):
-            lic_parser = utils.LicenseListParser()
-            lic_parser.build(write_tables=0, debug=0)
+            lic_parser = utils.get_license_list_parser()
             license_object = self.replace_license(
                 lic_parser.parse(pkg_declared_license)
             )
@@ -1688,10 +1680,7 @@ def flatten_document(document):
     files_by_id = {}
     if "files" in document:
         for f in document.get("files"):
-            for checksum in f["checksums"]:
-                if checksum["algorithm"] == "SHA1" or "sha1" in checksum["algorithm"]:
-                    f["sha1"] = checksum["checksumValue"]
-                    break
+            set_sha1(f, f["checksums"])
             files_by_id[f["SPDXID"]] = f
     if "packages" in document:
         packages = document.get("packages")
@@ -1700,14 +1689,48 @@ def flatten_document(document):
                 package["files"] = [{
                     "File": files_by_id[spdxid.split("#")[-1]]} for spdxid in package["hasFiles"]
                 ]
-            for checksum in package.get("checksums", []):
-                if checksum["algorithm"] == "SHA1" or "sha1" in checksum["algorithm"]:
-                    package["sha1"] = checksum["checksumValue"]
-                    break
+            set_sha1(package, package.get("checksums", []))
 
     return document
 
 
+def set_sha1(element, checksums):
+    """
+    Set the "sha1" field of a file or package dict from its first SHA1 checksum.
+    """
+    for checksum in checksums:
+        if checksum["algorithm"] == "SHA1" or "sha1" in checksum["algorithm"]:
+            element["sha1"] = checksum["checksumValue"]
+            break
+
+
+# arrays of the document parsed element by element while they are read
+STREAMED_FIELDS = ("relationships", "snippets", "packages", "files")
+
+# the license fields of the elements of a streamed array, by document list
+LICENSE_FIELDS = {
+    "snippets": ("snippet", ("conc_lics", "licenses_in_snippet")),
+    "packages": ("packages", ("conc_lics", "license_declared", "licenses_from_files")),
+    "files": ("files", ("conc_lics", "licenses_in_file")),
+}
+
+
+class ParsedSection(object):
+    """
+    A streamed array of the document, already parsed. Its elements were
+    added to the document directly, but the relationships and annotations
+    they created are kept aside until the array's turn comes in
+    Parser.parse_document_object.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        # set as the document's relationships while the elements are parsed,
+        # which a Document would otherwise copy into a TrackedList
+        self.relationships = changes.TrackedList()
+        self.annotations = []
+
+
 class Parser(
     CreationInfoParser,
     ExternalDocumentRefsParser,
@@ -1722,6 +1745,67 @@ class Parser(
     def __init__(self, builder, logger):
         super(Parser, self).__init__(builder, logger)
 
+    def parse_section_element(self, section, element):
+        """
+        Parse `element` of the streamed array of `section`, a
+        ParsedSection, which stands in for the array in
+        self.document_object once all elements are parsed.
+        """
+        relationships, annotations = self.document.relationships, self.document.annotations
+        self.document.relationships, self.document.annotations = section.relationships, section.annotations
+        try:
+            if section.key == "packages":
+                if isinstance(element, dict):
+                    set_sha1(element, element.get("checksums", []))
+                self.parse_packages([element])
+            elif section.key == "files":
+                if isinstance(element, dict):
+                    set_sha1(element, element["checksums"])
+                self.parse_files([element])
+            elif section.key == "snippets":
+                self.parse_snippets([element])
+            else:
+                self.parse_relationships([element])
+        finally:
+            self.document.relationships, self.document.annotations = relationships, annotations
+
+    def add_section(self, section):
+        """
+        Add the relationships and annotations of `section` to the document,
+        as if its elements were parsed at this point.
+        """
+        for relationship in section.relationships:
+            # equal relationships of earlier arrays are replaced or kept
+            # like when the builder adds them in this order
+            self.builder.add_relationship_object(self.document, relationship)
+        self.document.annotations.extend(section.annotations)
+
+        # the extracted licenses may have been read after the elements
+        if section.key in LICENSE_FIELDS and self.document.extracted_licenses:
+            name, fields = LICENSE_FIELDS[section.key]
+            for element in getattr(self.document, name):
+                for field in fields:
+                    value = getattr(element, field)
+                    if isinstance(value, list):
+                        value[:] = [self.replace_license(lic) if isinstance(lic, License) else lic for lic in value]
+                    elif isinstance(value, License):
+                        setattr(element, field, self.replace_license(value))
+
+    def parse_relationships(self, relationships):
+        if isinstance(relationships, ParsedSection):
+            return self.add_section(relationships)
+        return super(Parser, self).parse_relationships(relationships)
+
+    def parse_snippets(self, snippets):
+        if isinstance(snippets, ParsedSection):
+            return self.add_section(snippets)
+        return super(Parser, self).parse_snippets(snippets)
+
+    def parse_files(self, files):
+        if isinstance(files, ParsedSection):
+            return self.add_section(files)
+        return super(Parser, self).parse_files(files)
+
     def json_yaml_set_document(self, data):
         # we could verify that the spdxVersion >= 2.2, but we try to be resilient in parsing
         if data.get("spdxVersion"):
@@ -1736,6 +1820,13 @@ class Parser(
         self.error = False
         self.document = document.Document()
         self.document_object = flatten_document(self.document_object)
+        return self.parse_document_object()
+
+    def parse_document_object(self):
+        """
+        Parse the fields of self.document_object into self.document, in a
+        fixed order, and validate the result.
+        """
         if not isinstance(self.document_object, dict):
             self.logger.log("Empty or not valid SPDX Document")
             self.error = True
@@ -1882,6 +1973,8 @@ class Parser(
         """
         if packages is None:
             return
+        if isinstance(packages, ParsedSection):
+            return self.add_section(packages)
         if isinstance(packages, list):
             for package in packages:
                 self.parse_package(package, self.parse_relationship)
@@ -11,6 +11,7 @@
 # limitations under the License.
 from typing import Dict, Union
 
+from spdx import utils
 from spdx.document import Document
 from spdx.parsers import rdfbuilders
 from spdx.parsers import tagvaluebuilders
@@ -216,7 +217,7 @@ class FileBuilder(rdfbuilders.FileBuilder):
         if self.file_copytext_set:
             raise CardinalityError("File::CopyRight")
         self.file_copytext_set = True
-        self.file(doc).copyright = text
+        self.file(doc).copyright = utils.shared_text(self, text)
         return True
 
     def set_file_license_comment(self, doc, text):
@@ -323,6 +324,7 @@ class Builder(
         Must be called between usage with different documents.
         """
         # FIXME: this state does not make sense
+        self.shared_texts = dict()
         self.reset_creation_info()
         self.reset_document()
         self.reset_package()
@@ -12,6 +12,83 @@
 import re
 
 from ply import lex
+from ply.lex import LexToken
+
+# Size in characters above which `Lexer.input_stream` hands the text read so
+# far to the lexer.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+TEXT_START_REGEX = re.compile(r":\s*<text>")
+TEXT_END = "</text>"
+# A line that starts a new tag, as opposed to a continuation such as an URL.
+TAG_LINE_REGEX = re.compile(r"[A-Za-z]+:")
+URL_LINE_REGEX = re.compile(r"(ht|f)tps?:")
+
+
+def scan_lines(stream):
+    """
+    Yield each line of the tag-value text read from `stream` together with a
+    flag telling whether the line starts outside of any token, that is not
+    inside a <text></text> block and not after a dangling colon: several
+    token rules start with optional whitespace and may span line breaks.
+    """
+    in_text = False
+    colon_pending = False
+    for line in stream:
+        yield line, not in_text and not colon_pending
+
+        pos = 0
+        if not in_text:
+            stripped = line.lstrip()
+            if colon_pending and stripped.startswith("<text>"):
+                in_text = True
+                pos = line.index("<text>") + len("<text>")
+            elif stripped.startswith("#"):
+                colon_pending = False
+                continue
+            elif not stripped:
+                continue
+        while True:
+            if in_text:
+                end = line.find(TEXT_END, pos)
+                if end == -1:
+                    break
+                in_text = False
+                pos = end + len(TEXT_END)
+            else:
+                match = TEXT_START_REGEX.search(line, pos)
+                if match is None:
+                    break
+                in_text = True
+                pos = match.end()
+        colon_pending = not in_text and line.rstrip().endswith(":")
+
+
+def is_tag_line(line):
+    """Return True if `line`, starting outside of any token, starts a new tag."""
+    return TAG_LINE_REGEX.match(line) is not None and URL_LINE_REGEX.match(line) is None
+
+
+def split_chunks(stream, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read the tag-value text of `stream` line by line and yield it in chunks
+    of at least `chunk_size` characters (the last one may be smaller).
+
+    Chunks only end right before a line that starts a new tag outside of any
+    token, see `scan_lines`, so that lexing the chunks one after the other
+    yields the same tokens as lexing the whole text at once.
+    """
+    lines = []
+    size = 0
+    for line, at_boundary in scan_lines(stream):
+        if size >= chunk_size and at_boundary and is_tag_line(line):
+            yield "".join(lines)
+            lines = []
+            size = 0
+        lines.append(line)
+        size += len(line)
+    if lines:
+        yield "".join(lines)
 
 
 class Lexer(object):
@@ -130,6 +207,9 @@ class Lexer(object):
     }
     states = (("text", "exclusive"),)
 
+    # Remaining chunks of the stream given to `input_stream`
+    chunks = None
+
     tokens = [
         "TEXT",
         "TOOL_VALUE",
@@ -239,12 +319,215 @@ class Lexer(object):
         self.lexer = lex.lex(module=self, **kwargs)
 
     def token(self):
-        return self.lexer.token()
+        token = self.lexer.token()
+        while token is None and self.chunks is not None:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.chunks = None
+                break
+            self.lexer.input(chunk)
+            token = self.lexer.token()
+        return token
 
     def input(self, data):
+        self.chunks = None
         self.lexer.input(data)
 
+    def set_lineno(self, lineno):
+        """Set the line number of the next token."""
+        self.lexer.lineno = lineno
+
+    def input_stream(self, stream, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Lex the text read from the file-like `stream` incrementally, holding
+        about `chunk_size` characters of it in memory at a time.
+        """
+        self.chunks = split_chunks(stream, chunk_size)
+        self.lexer.input("")
+
     def t_error(self, t):
         t.lexer.skip(1)
         t.value = "Lexer error"
         return t
+
+
+def _rules_regex(*rule_names):
+    """
+    Return a regex trying the given `Lexer` rules in order, the name of the
+    rule that matched is the `lastgroup` of a match.
+    """
+    return re.compile(
+        "|".join("(?P<{0}>{1})".format(name, getattr(Lexer, name).__doc__) for name in rule_names),
+        re.UNICODE,
+    )
+
+
+# Rules of `Lexer` in the order PLY tries them, grouped by the first
+# character they can match.
+COLON_RULES_REGEX = _rules_regex(
+    "t_text", "t_CHKSUM", "t_DOC_REF_ID", "t_TOOL_VALUE", "t_ORG_VALUE", "t_PERSON_VALUE", "t_DATE",
+    "t_LINE_OR_KEYWORD_VALUE",
+)
+LETTER_RULES_REGEX = _rules_regex("t_DOC_URI", "t_EXT_DOC_REF_CHKSUM", "t_KEYWORD_AS_TAG")
+OTHER_RULES_REGEX = _rules_regex("t_DOC_URI", "t_EXT_DOC_REF_CHKSUM", "t_newline", "t_whitespace")
+TEXT_END_REGEX = re.compile(Lexer.t_text_end.__doc__, re.UNICODE)
+
+
+def _not_rules(*rule_names):
+    return "(?!{0})".format("|".join(getattr(Lexer, name).__doc__ for name in rule_names))
+
+
+# A plain `Tag: value` line and the line breaks after it, matched only where
+# PLY would also lex it as KEYWORD_AS_TAG, LINE_OR_KEYWORD_VALUE and newline.
+TAG_VALUE_LINE_REGEX = re.compile(
+    _not_rules("t_DOC_URI", "t_EXT_DOC_REF_CHKSUM")
+    + r"(?P<tag>[a-zA-Z]+)"
+    + _not_rules("t_text", "t_CHKSUM", "t_DOC_REF_ID", "t_TOOL_VALUE", "t_ORG_VALUE", "t_PERSON_VALUE", "t_DATE")
+    + r":(?P<value>.+)"
+    + "(?:" + _not_rules("t_DOC_URI", "t_EXT_DOC_REF_CHKSUM") + r"(?P<newlines>\n+))?",
+    re.UNICODE,
+)
+ASCII_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+RULE_TOKEN_TYPES = {
+    "t_CHKSUM": "CHKSUM",
+    "t_DOC_REF_ID": "DOC_REF_ID",
+    "t_TOOL_VALUE": "TOOL_VALUE",
+    "t_ORG_VALUE": "ORG_VALUE",
+    "t_PERSON_VALUE": "PERSON_VALUE",
+    "t_DATE": "DATE",
+    "t_EXT_DOC_REF_CHKSUM": "EXT_DOC_REF_CHKSUM",
+}
+
+
+def _token(type_, value, lineno, lexpos):
+    token = LexToken()
+    token.type = type_
+    token.value = value
+    token.lineno = lineno
+    token.lexpos = lexpos
+    return token
+
+
+class FastLexer(object):
+    """
+    Hand-written scanner for tag-value producing the same tokens as the PLY
+    based `Lexer`, with the same `input`, `input_stream` and `token`
+    interface.
+
+    Instead of trying every rule at every position it dispatches on the
+    current character to the few rules of `Lexer` that can match there, and
+    it finds the end of <text></text> blocks with a plain string search.
+    """
+
+    tokens = Lexer.tokens
+    reserved = Lexer.reserved
+
+    def __init__(self):
+        self.lineno = 1
+        self._tokens = iter(())
+
+    def build(self, **kwargs):
+        """Nothing to build, present for compatibility with `Lexer`."""
+        pass
+
+    def token(self):
+        return next(self._tokens, None)
+
+    def input(self, data):
+        self._tokens = self._scan((data,))
+
+    def set_lineno(self, lineno):
+        """Set the line number of the next token."""
+        self.lineno = lineno
+
+    def input_stream(self, stream, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Lex the text read from the file-like `stream` incrementally, holding
+        about `chunk_size` characters of it in memory at a time.
+        """
+        self._tokens = self._scan(split_chunks(stream, chunk_size))
+
+    def _scan(self, chunks):
+        reserved = self.reserved
+        letters = ASCII_LETTERS
+        colon_match = COLON_RULES_REGEX.match
+        letter_match = LETTER_RULES_REGEX.match
+        other_match = OTHER_RULES_REGEX.match
+        line_match = TAG_VALUE_LINE_REGEX.match
+        for data in chunks:
+            pos = 0
+            end = len(data)
+            while pos < end:
+                char = data[pos]
+                if char in letters:
+                    match = line_match(data, pos)
+                    if match is not None:
+                        tag, value, newlines = match.group("tag", "value", "newlines")
+                        yield _token(reserved.get(tag, "UNKNOWN_TAG"), tag, self.lineno, pos)
+                        value = value.strip()
+                        yield _token(reserved.get(value, "LINE"), value, self.lineno, match.start("value") - 1)
+                        if newlines:
+                            self.lineno += len(newlines)
+                        pos = match.end()
+                        continue
+                    match = letter_match(data, pos)
+                    value = match.group()
+                    rule = match.lastgroup
+                    if rule == "t_KEYWORD_AS_TAG":
+                        yield _token(reserved.get(value, "UNKNOWN_TAG"), value, self.lineno, pos)
+                    elif rule == "t_DOC_URI":
+                        yield _token("DOC_URI", value.strip(), self.lineno, pos)
+                    else:
+                        yield _token("EXT_DOC_REF_CHKSUM", value[1:].strip(), self.lineno, pos)
+                    pos = match.end()
+                elif char == ":":
+                    match = colon_match(data, pos)
+                    if match is None:
+                        yield _token("error", "Lexer error", self.lineno, pos)
+                        pos += 1
+                        continue
+                    rule = match.lastgroup
+                    if rule == "t_LINE_OR_KEYWORD_VALUE":
+                        value = match.group()[1:].strip()
+                        yield _token(reserved.get(value, "LINE"), value, self.lineno, pos)
+                        pos = match.end()
+                    elif rule == "t_text":
+                        text_start = match.end() - len("<text>")
+                        text_end = data.find("</text>", match.end())
+                        if text_end == -1:
+                            # unterminated text block, nothing more to lex
+                            pos = end
+                            continue
+                        match = TEXT_END_REGEX.match(data, text_end)
+                        value = data[text_start:match.end()]
+                        yield _token("TEXT", value.strip(), self.lineno, text_end)
+                        self.lineno += value.count("\n")
+                        pos = match.end()
+                    else:
+                        yield _token(RULE_TOKEN_TYPES[rule], match.group()[1:].strip(), self.lineno, pos)
+                        pos = match.end()
+                elif char == "#":
+                    pos = data.find("\n", pos)
+                    if pos == -1:
+                        pos = end
+                else:
+                    match = other_match(data, pos)
+                    if match is None:
+                        yield _token("error", "Lexer error", self.lineno, pos)
+                        pos += 1
+                        continue
+                    rule = match.lastgroup
+                    if rule == "t_newline":
+                        self.lineno += match.end() - pos
+                    elif rule == "t_DOC_URI":
+                        yield _token("DOC_URI", match.group().strip(), self.lineno, pos)
+                    elif rule == "t_EXT_DOC_REF_CHKSUM":
+                        yield _token("EXT_DOC_REF_CHKSUM", match.group()[1:].strip(), self.lineno, pos)
+                    pos = match.end()
+
+
+LEXER_BACKENDS = {
+    "ply": Lexer,
+    "fast": FastLexer,
+}
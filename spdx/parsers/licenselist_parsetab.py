@@ -0,0 +1,36 @@
+
+# licenselist_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'AND LICENSE LP OR RPdisjunction : disjunction OR conjunction\n        disjunction : conjunction\n        conjunction : conjunction AND license_atom\n        conjunction : license_atom\n        license_atom : LICENSE\n        license_atom : LP disjunction RP\n        '
+    
+_lr_action_items = {'LICENSE':([0,5,6,7,],[4,4,4,4,]),'LP':([0,5,6,7,],[5,5,5,5,]),'$end':([1,2,3,4,9,10,11,],[0,-2,-4,-5,-1,-3,-6,]),'OR':([1,2,3,4,8,9,10,11,],[6,-2,-4,-5,6,-1,-3,-6,]),'RP':([2,3,4,8,9,10,11,],[-2,-4,-5,11,-1,-3,-6,]),'AND':([2,3,4,9,10,11,],[7,-4,-5,7,-3,-6,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'disjunction':([0,5,],[1,8,]),'conjunction':([0,5,6,],[2,2,9,]),'license_atom':([0,5,6,7,],[3,3,3,10,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> disjunction","S'",1,None,None,None),
+  ('disjunction -> disjunction OR conjunction','disjunction',3,'p_disjunction_1','utils.py',175),
+  ('disjunction -> conjunction','disjunction',1,'p_disjunction_2','utils.py',180),
+  ('conjunction -> conjunction AND license_atom','conjunction',3,'p_conjunction_1','utils.py',185),
+  ('conjunction -> license_atom','conjunction',1,'p_conjunction_2','utils.py',190),
+  ('license_atom -> LICENSE','license_atom',1,'p_license_atom_1','utils.py',195),
+  ('license_atom -> LP disjunction RP','license_atom',3,'p_license_atom_2','utils.py',200),
+]
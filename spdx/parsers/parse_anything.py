@@ -11,43 +11,134 @@
 # limitations under the License.
 
 
-import spdx.file as spdxfile
-from spdx.parsers import jsonparser
-from spdx.parsers import yamlparser
-from spdx.parsers import rdf
-from spdx.parsers import xmlparser
-from spdx.parsers import tagvalue
+import io
+import re
+
+from spdx import compression
+from spdx.formats import format_of_name
 from spdx.parsers.loggers import StandardLogger
-from spdx.parsers import jsonyamlxmlbuilders, tagvaluebuilders, rdfbuilders
 from spdx.parsers.builderexceptions import FileTypeError
 
 
-def parse_file(fn, encoding="utf-8"):
-    builder_module = jsonyamlxmlbuilders
-    read_data = False
-    if fn.endswith(".rdf") or fn.endswith(".rdf.xml"):
-        encoding = None
-        parsing_module = rdf
-        builder_module = rdfbuilders
-    elif fn.endswith(".tag") or fn.endswith(".spdx"):
-        parsing_module = tagvalue
-        builder_module = tagvaluebuilders
-        read_data = True
-    elif fn.endswith(".json"):
-        parsing_module = jsonparser
-    elif fn.endswith(".xml"):
-        parsing_module = xmlparser
-    elif fn.endswith(".yaml") or fn.endswith(".yml"):
-        parsing_module = yamlparser
+# number of bytes read to detect the format of a stream
+SNIFF_SIZE = 1 << 13
+
+RDF_REGEX = re.compile(r"<rdf:RDF\b|http://www\.w3\.org/1999/02/22-rdf-syntax-ns#")
+TAG_VALUE_REGEX = re.compile(r"^SPDXVersion\s*:", re.MULTILINE)
+YAML_REGEX = re.compile(r"^(---|\s*spdxVersion\s*:|Document\s*:\s*$)", re.MULTILINE)
+
+
+def sniff_format(head):
+    """
+    Return the format of the document starting with the text `head`: a
+    JSON object, an rdf:RDF or other XML root, tag-value tags, or YAML
+    with an spdxVersion key. Raise FileTypeError if it is none of them.
+    """
+    text = head.lstrip("\ufeff \t\r\n")
+    if text.startswith("{"):
+        return "json"
+    if text.startswith("<"):
+        return "rdf" if RDF_REGEX.search(text) else "xml"
+    if TAG_VALUE_REGEX.search(text):
+        return "tag"
+    if YAML_REGEX.search(text):
+        return "yaml"
+    raise FileTypeError("Unable to detect the format of the document")
+
+
+def parse_document(file_format, f):
+    """
+    Parse the document read from the text file `f` in `file_format`. The
+    parser and builder modules are only imported here, so that using one
+    format does not import the libraries of the others.
+    """
+    streaming = False
+    if file_format == "rdf":
+        from spdx.parsers import rdf as parsing_module
+        from spdx.parsers import rdfbuilders as builder_module
+    elif file_format == "tag":
+        from spdx.parsers import tagvalue as parsing_module
+        from spdx.parsers import tagvaluebuilders as builder_module
+        streaming = True
+    elif file_format == "json":
+        from spdx.parsers import jsonparser as parsing_module
+        from spdx.parsers import jsonyamlxmlbuilders as builder_module
+        streaming = True
+    elif file_format == "xml":
+        from spdx.parsers import xmlparser as parsing_module
+        from spdx.parsers import jsonyamlxmlbuilders as builder_module
+    elif file_format == "yaml":
+        from spdx.parsers import yamlparser as parsing_module
+        from spdx.parsers import jsonyamlxmlbuilders as builder_module
     else:
-        raise FileTypeError("FileType Not Supported" + str(fn))
+        raise FileTypeError("FileType Not Supported" + str(file_format))
 
     p = parsing_module.Parser(builder_module.Builder(), StandardLogger())
     if hasattr(p, "build"):
         p.build()
-    with open(fn, "r", encoding=encoding) as f:
-        if read_data:
-            data = f.read()
-            return p.parse(data)
+    if streaming:
+        return p.parse_stream(f)
+    else:
+        return p.parse(f)
+
+
+def parse_file(fn, encoding="utf-8"):
+    """
+    Parse the document in the file `fn` with the parser for the format its
+    name ends with, decompressing it if it is compressed, see
+    spdx.compression.
+    """
+    file_format = format_of_name(fn)
+    if file_format == "rdf":
+        encoding = None
+    with compression.open_file(fn, "r", encoding=encoding) as f:
+        return parse_document(file_format, f)
+
+
+class PrefixedReader(io.RawIOBase):
+    """Read the bytes `prefix`, then the rest of the binary file `fil`."""
+
+    def __init__(self, prefix, fil):
+        self.prefix = prefix
+        self.fil = fil
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.prefix:
+            data = self.prefix[: len(buffer)]
+            self.prefix = self.prefix[len(data):]
         else:
-            return p.parse(f)
+            data = self.fil.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def read_head(fil):
+    """
+    Return the first SNIFF_SIZE bytes of the binary file `fil`, and a file
+    reading it from the start, without seeking since it can be a pipe.
+    """
+    head = fil.read(SNIFF_SIZE)
+    return head, io.BufferedReader(PrefixedReader(head, fil))
+
+
+def parse_stream(fil, encoding="utf-8"):
+    """
+    Parse the document read from the binary file like object `fil`, for
+    instance sys.stdin.buffer, with the parser for the format detected
+    from its first bytes by sniff_format, decompressing it if it is
+    compressed, see spdx.compression.
+    """
+    head, fil = read_head(fil)
+    file_compression = compression.detect(head)
+    if file_compression is not None:
+        head, fil = read_head(compression.decompressed(fil, file_compression))
+    file_format = sniff_format(head.decode(encoding, errors="replace"))
+    return parse_document(file_format, io.TextIOWrapper(fil, encoding=encoding))
+
+
+def parse_bytes(data, encoding="utf-8"):
+    """Parse the document in the bytes `data`, like parse_stream."""
+    return parse_stream(io.BytesIO(data), encoding)
@@ -10,7 +10,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pathlib
 import re
+import tempfile
+from xml.sax import SAXException
 
 from functools import reduce
 
@@ -22,58 +25,31 @@ from rdflib import RDFS
 from spdx import document
 from spdx import license
 from spdx import utils
-from spdx.checksum import Checksum, ChecksumAlgorithm
+from spdx.checksum import Checksum
+from spdx.rdf_index import TripleIndex
 from spdx.parsers.builderexceptions import CardinalityError
 from spdx.parsers.builderexceptions import SPDXValueError
+from spdx.parsers import rdf_sax
 from spdx.parsers.loggers import ErrorMessages
+from spdx.parsers.error_messages import ERROR_MESSAGES
+from spdx.parsers.rdfbuilders import convert_rdf_checksum_algorithm
 
+SPOOL_SIZE = 1 << 24
 
-ERROR_MESSAGES = {
-    "DOC_VERS_VALUE": "Invalid specVersion '{0}' must be SPDX-M.N where M and N are numbers.",
-    "DOC_D_LICS": "Invalid dataLicense '{0}' must be http://spdx.org/licenses/CC0-1.0.",
-    "DOC_SPDX_ID_VALUE": "Invalid SPDXID value, SPDXID must be the document namespace appended "
-    'by "#SPDXRef-DOCUMENT", line: {0}',
-    "DOC_NAMESPACE_VALUE": 'Invalid DocumentNamespace value {0}, must contain a scheme (e.g. "https:") '
-    'and should not contain the "#" delimiter.',
-    "LL_VALUE": "Invalid licenseListVersion '{0}' must be of the format N.N where N is a number",
-    "CREATED_VALUE": "Invalid created value '{0}' must be date in ISO 8601 format.",
-    "CREATOR_VALUE": "Invalid creator value '{0}' must be Organization, Tool or Person.",
-    "EXT_DOC_REF_VALUE": "Failed to extract {0} from ExternalDocumentRef.",
-    "PKG_SPDX_ID_VALUE": 'SPDXID must be "SPDXRef-[idstring]" where [idstring] is a unique string containing '
-    'letters, numbers, ".", "-".',
-    "PKG_SUPPL_VALUE": "Invalid package supplier value '{0}' must be Organization, Person or NOASSERTION.",
-    "PKG_ORIGINATOR_VALUE": "Invalid package supplier value '{0}'  must be Organization, Person or NOASSERTION.",
-    "PKG_DOWN_LOC": "Invalid package download location value '{0}'  must be a url or NONE or NOASSERTION",
-    "PKG_FILES_ANALYZED_VALUE": "FilesAnalyzed must be a boolean value, line: {0}",
-    "PKG_CONC_LIST": "Package concluded license list must have more than one member",
-    "LICS_LIST_MEMBER": "Declarative or Conjunctive license set member must be a license url or identifier",
-    "PKG_SINGLE_LICS": "Package concluded license must be a license url or spdx:noassertion or spdx:none.",
-    "PKG_LICS_INFO_FILES": "Package licenseInfoFromFiles must be a license or spdx:none or spdx:noassertion",
-    "FILE_SPDX_ID_VALUE": 'SPDXID must be "SPDXRef-[idstring]" where [idstring] is a unique string containing '
-    'letters, numbers, ".", "-".',
-    "PKG_EXT_REF_CATEGORY": '\'{0}\' must be "SECURITY", "PACKAGE-MANAGER", or "OTHER".',
-    "PKG_EXT_REF_TYPE": '{0} must be a unique string containing letters, numbers, ".", or "-".',
-    "FILE_TYPE": "Unknown file type.",
-    "FILE_SINGLE_LICS": "File concluded license must be a license url or spdx:noassertion or spdx:none.",
-    "REVIEWER_VALUE": "Invalid reviewer value '{0}' must be Organization, Tool or Person.",
-    "REVIEW_DATE": "Invalid review date value '{0}' must be date in ISO 8601 format.",
-    "ANNOTATOR_VALUE": "Invalid annotator value '{0}' must be Organization, Tool or Person.",
-    "ANNOTATION_DATE": "Invalid annotation date value '{0}' must be date in ISO 8601 format.",
-    "SNIPPET_SPDX_ID_VALUE": 'SPDXID must be "SPDXRef-[idstring]" where [idstring] is a unique string '
-    'containing letters, numbers, ".", "-".',
-    "SNIPPET_SINGLE_LICS": "Snippet Concluded License must be a license url or spdx:noassertion or spdx:none.",
-    "SNIPPET_LIC_INFO": "License Information in Snippet must be a license url or a reference "
-    "to the license, denoted by LicenseRef-[idstring] or spdx:noassertion or spdx:none.",
-    "RELATIONSHIP": "relationship type must be of supported type",
-}
-
-
-def convert_rdf_checksum_algorithm(rdf_checksum_algorithm: str) -> ChecksumAlgorithm:
-    split_string = rdf_checksum_algorithm.split('#')
-    if len(split_string) != 2:
-        raise SPDXValueError('Unknown checksum algorithm {}'.format(rdf_checksum_algorithm))
-    checksum_algorithm = ChecksumAlgorithm.checksum_from_rdf(split_string[1])
-    return checksum_algorithm
+
+class IndexedGraph(Graph):
+    """
+    A Graph that also records every triple added to it, for instance while
+    parsing, in a TripleIndex.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(IndexedGraph, self).__init__(*args, **kwargs)
+        self.index = TripleIndex()
+
+    def add(self, triple):
+        self.index.add(triple)
+        return super(IndexedGraph, self).add(triple)
 
 
 class BaseParser(object):
@@ -144,7 +120,7 @@ class LicenseParser(BaseParser):
             lics,
             RDF.type,
             self.spdx_namespace["ExtractedLicensingInfo"],
-        ) in self.graph:
+        ) in self.index:
             return self.parse_only_extr_license(lics)
 
         # Assume resource, hence the path separator
@@ -155,7 +131,7 @@ class LicenseParser(BaseParser):
             if special == lics:
                 if self.LICS_REF_REGEX.match(lics):
                     # Is a license ref i.e LicenseRef-1
-                    return license.License.from_identifier(str(lics))
+                    return license.License.interned(str(lics))
                 else:
                     # Not a known license form
                     raise SPDXValueError("License")
@@ -164,14 +140,14 @@ class LicenseParser(BaseParser):
                 return special
         else:
             # license url
-            return license.License.from_identifier(lics[ident_start:])
+            return license.License.interned(str(lics[ident_start:]))
 
     def get_extr_license_ident(self, extr_lic):
         """
         Return a license identifier from an ExtractedLicense or None.
         """
         identifier_triples = list(
-            self.graph.triples((extr_lic, self.spdx_namespace["licenseId"], None))
+            self.index.triples((extr_lic, self.spdx_namespace["licenseId"], None))
         )
 
         if not identifier_triples:
@@ -193,7 +169,7 @@ class LicenseParser(BaseParser):
         Return extracted text from an ExtractedLicense or None.
         """
         text_triples = list(
-            self.graph.triples((extr_lic, self.spdx_namespace["extractedText"], None))
+            self.index.triples((extr_lic, self.spdx_namespace["extractedText"], None))
         )
         if not text_triples:
             self.error = True
@@ -214,7 +190,7 @@ class LicenseParser(BaseParser):
         Return the license name from an ExtractedLicense or None
         """
         extr_name_list = list(
-            self.graph.triples((extr_lic, self.spdx_namespace["licenseName"], None))
+            self.index.triples((extr_lic, self.spdx_namespace["licenseName"], None))
         )
         if len(extr_name_list) > 1:
             self.more_than_one_error("extracted license name")
@@ -227,14 +203,14 @@ class LicenseParser(BaseParser):
         """
         Return a list of cross references.
         """
-        xrefs = list(self.graph.triples((extr_lic, RDFS.seeAlso, None)))
+        xrefs = list(self.index.triples((extr_lic, RDFS.seeAlso, None)))
         return list(map(lambda xref_triple: xref_triple[2], xrefs))
 
     def get_extr_lics_comment(self, extr_lics):
         """
         Return license comment or None.
         """
-        comment_list = list(self.graph.triples((extr_lics, RDFS.comment, None)))
+        comment_list = list(self.index.triples((extr_lics, RDFS.comment, None)))
         if len(comment_list) > 1:
             self.more_than_one_error("extracted license comment")
             return
@@ -288,7 +264,7 @@ class LicenseParser(BaseParser):
         or LicenseDisjunction) from a list of license resources or None.
         """
         licenses = []
-        for _, _, lics_member in self.graph.triples(
+        for _, _, lics_member in self.index.triples(
             (lics_set, self.spdx_namespace["member"], None)
         ):
             try:
@@ -330,14 +306,14 @@ class PackageParser(LicenseParser):
         Parse package fields.
         """
         # Check there is a package name
-        if not (p_term, self.spdx_namespace["name"], None) in self.graph:
+        if not (p_term, self.spdx_namespace["name"], None) in self.index:
             self.error = True
             self.logger.log("Package must have a name.")
             # Create dummy package so that we may continue parsing the rest of
             # the package fields.
             self.builder.create_package(self.doc, "dummy_package")
         else:
-            for _s, _p, o in self.graph.triples(
+            for _s, _p, o in self.index.triples(
                 (p_term, self.spdx_namespace["name"], None)
             ):
                 try:
@@ -379,7 +355,7 @@ class PackageParser(LicenseParser):
 
     def p_pkg_cr_text(self, p_term, predicate):
         try:
-            for _, _, text in self.graph.triples((p_term, predicate, None)):
+            for _, _, text in self.index.triples((p_term, predicate, None)):
                 self.builder.set_pkg_cr_text(
                     self.doc, str(self.to_special_value(text))
                 )
@@ -388,28 +364,28 @@ class PackageParser(LicenseParser):
 
     def p_pkg_summary(self, p_term, predicate):
         try:
-            for _, _, summary in self.graph.triples((p_term, predicate, None)):
+            for _, _, summary in self.index.triples((p_term, predicate, None)):
                 self.builder.set_pkg_summary(self.doc, str(summary))
         except CardinalityError:
             self.more_than_one_error("package summary")
 
     def p_pkg_descr(self, p_term, predicate):
         try:
-            for _, _, desc in self.graph.triples((p_term, predicate, None)):
+            for _, _, desc in self.index.triples((p_term, predicate, None)):
                 self.builder.set_pkg_desc(self.doc, str(desc))
         except CardinalityError:
             self.more_than_one_error("package description")
 
     def p_pkg_comment(self, p_term, predicate):
         try:
-            for _, _, comment in self.graph.triples((p_term, predicate, None)):
+            for _, _, comment in self.index.triples((p_term, predicate, None)):
                 self.builder.set_pkg_comment(self.doc, str(comment))
         except CardinalityError:
             self.more_than_one_error("package comment")
 
     def p_pkg_attribution_text(self, p_term, predicate):
         try:
-            for _, _, attribute_text in self.graph.triples((p_term, predicate, None)):
+            for _, _, attribute_text in self.index.triples((p_term, predicate, None)):
                 self.builder.set_pkg_attribution_text(
                     self.doc, str(attribute_text)
                 )
@@ -417,7 +393,7 @@ class PackageParser(LicenseParser):
             self.more_than_one_error("package attribution text")
 
     def p_pkg_comments_on_lics(self, p_term, predicate):
-        for _, _, comment in self.graph.triples((p_term, predicate, None)):
+        for _, _, comment in self.index.triples((p_term, predicate, None)):
             try:
                 self.builder.set_pkg_license_comment(self.doc, str(comment))
             except CardinalityError:
@@ -425,13 +401,13 @@ class PackageParser(LicenseParser):
                 break
 
     def p_pkg_lics_info_from_files(self, p_term, predicate):
-        for _, _, lics in self.graph.triples((p_term, predicate, None)):
+        for _, _, lics in self.index.triples((p_term, predicate, None)):
             try:
                 if (
                     lics,
                     RDF.type,
                     self.spdx_namespace["ExtractedLicensingInfo"],
-                ) in self.graph:
+                ) in self.index:
                     self.builder.set_pkg_license_from_file(
                         self.doc, self.parse_only_extr_license(lics)
                     )
@@ -451,12 +427,12 @@ class PackageParser(LicenseParser):
         Handle package lics concluded or declared.
         """
         try:
-            for _, _, licenses in self.graph.triples((p_term, predicate, None)):
+            for _, _, licenses in self.index.triples((p_term, predicate, None)):
                 if (
                     licenses,
                     RDF.type,
                     self.spdx_namespace["ConjunctiveLicenseSet"],
-                ) in self.graph:
+                ) in self.index:
                     lics = self.handle_conjunctive_list(licenses)
                     builder_func(self.doc, lics)
 
@@ -464,7 +440,7 @@ class PackageParser(LicenseParser):
                     licenses,
                     RDF.type,
                     self.spdx_namespace["DisjunctiveLicenseSet"],
-                ) in self.graph:
+                ) in self.index:
                     lics = self.handle_disjunctive_list(licenses)
                     builder_func(self.doc, lics)
 
@@ -481,9 +457,9 @@ class PackageParser(LicenseParser):
         self.handle_pkg_lic(p_term, predicate, self.builder.set_pkg_licenses_concluded)
 
     def p_pkg_verif_code(self, p_term, predicate):
-        for _, _, verifcode in self.graph.triples((p_term, predicate, None)):
+        for _, _, verifcode in self.index.triples((p_term, predicate, None)):
             # Parse verification code
-            for _, _, code in self.graph.triples(
+            for _, _, code in self.index.triples(
                 (verifcode, self.spdx_namespace["packageVerificationCodeValue"], None)
             ):
                 try:
@@ -492,7 +468,7 @@ class PackageParser(LicenseParser):
                     self.more_than_one_error("package verification code")
                     break
             # Parse excluded file
-            for _, _, filename in self.graph.triples(
+            for _, _, filename in self.index.triples(
                 (
                     verifcode,
                     self.spdx_namespace["packageVerificationCodeExcludedFile"],
@@ -506,7 +482,7 @@ class PackageParser(LicenseParser):
                     break
 
     def p_pkg_src_info(self, p_term, predicate):
-        for _, _, o in self.graph.triples((p_term, predicate, None)):
+        for _, _, o in self.index.triples((p_term, predicate, None)):
             try:
                 self.builder.set_pkg_source_info(self.doc, str(o))
             except CardinalityError:
@@ -514,11 +490,11 @@ class PackageParser(LicenseParser):
                 break
 
     def p_pkg_checksum(self, p_term, predicate):
-        for _s, _p, pkg_checksum in self.graph.triples((p_term, predicate, None)):
-            for _, _, value in self.graph.triples(
+        for _s, _p, pkg_checksum in self.index.triples((p_term, predicate, None)):
+            for _, _, value in self.index.triples(
                 (pkg_checksum, self.spdx_namespace["checksumValue"], None)
             ):
-                for _, _, algo in self.graph.triples(
+                for _, _, algo in self.index.triples(
                         (pkg_checksum, self.spdx_namespace["algorithm"], None)
                 ):
                     algorithm_identifier = convert_rdf_checksum_algorithm(str(algo))
@@ -526,7 +502,7 @@ class PackageParser(LicenseParser):
                     self.builder.set_pkg_checksum(self.doc, checksum)
 
     def p_pkg_homepg(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+        for _s, _p, o in self.index.triples((p_term, predicate, None)):
             try:
                 self.builder.set_pkg_home(
                     self.doc, str(self.to_special_value(o))
@@ -538,7 +514,7 @@ class PackageParser(LicenseParser):
                 self.value_error("PKG_HOME_PAGE", o)
 
     def p_pkg_down_loc(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+        for _s, _p, o in self.index.triples((p_term, predicate, None)):
             try:
                 self.builder.set_pkg_down_location(
                     self.doc, str(self.to_special_value(o))
@@ -550,7 +526,7 @@ class PackageParser(LicenseParser):
                 self.value_error("PKG_DOWN_LOC", o)
 
     def p_pkg_files_analyzed(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+        for _s, _p, o in self.index.triples((p_term, predicate, None)):
             try:
                 self.builder.set_pkg_files_analyzed(self.doc, str(o))
             except CardinalityError:
@@ -560,7 +536,7 @@ class PackageParser(LicenseParser):
                 self.value_error("PKG_FILES_ANALYZED_VALUE", o)
 
     def p_pkg_originator(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+        for _s, _p, o in self.index.triples((p_term, predicate, None)):
             try:
                 originator = self.to_special_value(o)
                 if isinstance(originator, (utils.NoAssert, utils.SPDXNone, utils.UnKnown)):
@@ -575,7 +551,7 @@ class PackageParser(LicenseParser):
                 self.value_error("PKG_ORIGINATOR_VALUE", o)
 
     def p_pkg_suppl(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+        for _s, _p, o in self.index.triples((p_term, predicate, None)):
             try:
                 supplier = self.to_special_value(o)
                 if isinstance(supplier, (utils.NoAssert, utils.SPDXNone, utils.UnKnown)):
@@ -590,7 +566,7 @@ class PackageParser(LicenseParser):
                 self.value_error("PKG_SUPPL_VALUE", o)
 
     def p_pkg_fname(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+        for _s, _p, o in self.index.triples((p_term, predicate, None)):
             try:
                 self.builder.set_pkg_file_name(self.doc, str(o))
             except CardinalityError:
@@ -598,7 +574,7 @@ class PackageParser(LicenseParser):
                 break
 
     def p_pkg_vinfo(self, p_term, predicate):
-        for _s, _p, o in self.graph.triples((p_term, predicate, None)):
+        for _s, _p, o in self.index.triples((p_term, predicate, None)):
             try:
                 self.builder.set_pkg_vers(self.doc, str(o))
             except CardinalityError:
@@ -615,13 +591,13 @@ class FileParser(LicenseParser):
         super(FileParser, self).__init__(builder, logger)
 
     def parse_file(self, f_term):
-        if not (f_term, self.spdx_namespace["fileName"], None) in self.graph:
+        if not (f_term, self.spdx_namespace["fileName"], None) in self.index:
             self.error = True
             self.logger.log("File must have a name.")
             # Dummy name to continue
             self.builder.set_file_name(self.doc, "Dummy file")
         else:
-            for _, _, name in self.graph.triples(
+            for _, _, name in self.index.triples(
                 (f_term, self.spdx_namespace["fileName"], None)
             ):
                 self.builder.set_file_name(self.doc, str(name))
@@ -642,7 +618,7 @@ class FileParser(LicenseParser):
 
     def get_file_name(self, f_term):
         """Returns first found fileName property or None if not found."""
-        for _, _, name in self.graph.triples(
+        for _, _, name in self.index.triples(
             (f_term, self.spdx_namespace["fileName"], None)
         ):
             return name
@@ -652,7 +628,7 @@ class FileParser(LicenseParser):
         """
         Set file dependencies.
         """
-        for _, _, other_file in self.graph.triples((f_term, predicate, None)):
+        for _, _, other_file in self.index.triples((f_term, predicate, None)):
             name = self.get_file_name(other_file)
             if name is not None:
                 self.builder.add_file_dep(str(name))
@@ -665,7 +641,7 @@ class FileParser(LicenseParser):
         """
         Parse all file contributors and adds them to the model.
         """
-        for _, _, contributor in self.graph.triples((f_term, predicate, None)):
+        for _, _, contributor in self.index.triples((f_term, predicate, None)):
             self.builder.add_file_contribution(self.doc, str(contributor))
 
     def p_file_notice(self, f_term, predicate):
@@ -673,7 +649,7 @@ class FileParser(LicenseParser):
         Set file notice text.
         """
         try:
-            for _, _, notice in self.graph.triples((f_term, predicate, None)):
+            for _, _, notice in self.index.triples((f_term, predicate, None)):
                 self.builder.set_file_notice(self.doc, str(notice))
         except CardinalityError:
             self.more_than_one_error("file notice")
@@ -683,7 +659,7 @@ class FileParser(LicenseParser):
         Set file comment text.
         """
         try:
-            for _, _, comment in self.graph.triples((f_term, predicate, None)):
+            for _, _, comment in self.index.triples((f_term, predicate, None)):
                 self.builder.set_file_comment(self.doc, str(comment))
         except CardinalityError:
             self.more_than_one_error("file comment")
@@ -693,7 +669,7 @@ class FileParser(LicenseParser):
         Set file attribution text
         """
         try:
-            for _, _, attribute_text in self.graph.triples((f_term, predicate, None)):
+            for _, _, attribute_text in self.index.triples((f_term, predicate, None)):
                 self.builder.set_file_attribution_text(
                     self.doc, str(attribute_text)
                 )
@@ -705,7 +681,7 @@ class FileParser(LicenseParser):
         Handle file artifactOf.
         Note: does not handle artifact of project URI.
         """
-        for _, _, project in self.graph.triples((f_term, predicate, None)):
+        for _, _, project in self.index.triples((f_term, predicate, None)):
             if (project, RDF.type, self.doap_namespace["Project"]):
                 self.p_file_project(project)
             else:
@@ -718,13 +694,13 @@ class FileParser(LicenseParser):
         Helper function for parsing doap:project name and homepage.
         and setting them using the file builder.
         """
-        for _, _, name in self.graph.triples(
+        for _, _, name in self.index.triples(
             (project, self.doap_namespace["name"], None)
         ):
             self.builder.set_file_atrificat_of_project(
                 self.doc, "name", str(name)
             )
-        for _, _, homepage in self.graph.triples(
+        for _, _, homepage in self.index.triples(
             (project, self.doap_namespace["homepage"], None)
         ):
             self.builder.set_file_atrificat_of_project(
@@ -736,7 +712,7 @@ class FileParser(LicenseParser):
         Set file copyright text.
         """
         try:
-            for _, _, cr_text in self.graph.triples((f_term, predicate, None)):
+            for _, _, cr_text in self.index.triples((f_term, predicate, None)):
                 self.builder.set_file_copyright(self.doc, str(cr_text))
         except CardinalityError:
             self.more_than_one_error("file copyright text")
@@ -746,7 +722,7 @@ class FileParser(LicenseParser):
         Set file license comment.
         """
         try:
-            for _, _, comment in self.graph.triples((f_term, predicate, None)):
+            for _, _, comment in self.index.triples((f_term, predicate, None)):
                 self.builder.set_file_license_comment(self.doc, str(comment))
         except CardinalityError:
             self.more_than_one_error("file comments on license")
@@ -755,7 +731,7 @@ class FileParser(LicenseParser):
         """
         Set file license information.
         """
-        for _, _, info in self.graph.triples((f_term, predicate, None)):
+        for _, _, info in self.index.triples((f_term, predicate, None)):
             lic = self.handle_lics(info)
             if lic is not None:
                 self.builder.set_file_license_in_file(self.doc, lic)
@@ -774,7 +750,7 @@ class FileParser(LicenseParser):
         Set file type.
         """
         try:
-            for _, _, ftype in self.graph.triples((f_term, predicate, None)):
+            for _, _, ftype in self.index.triples((f_term, predicate, None)):
                 try:
                     self.builder.set_file_type(self.doc, ftype)
                 except SPDXValueError:
@@ -786,11 +762,11 @@ class FileParser(LicenseParser):
         """
         Set file checksum.
         """
-        for _s, _p, file_checksum in self.graph.triples((f_term, predicate, None)):
-            for _, _, value in self.graph.triples(
+        for _s, _p, file_checksum in self.index.triples((f_term, predicate, None)):
+            for _, _, value in self.index.triples(
                 (file_checksum, self.spdx_namespace["checksumValue"], None)
             ):
-                for _, _, algo in self.graph.triples(
+                for _, _, algo in self.index.triples(
                         (file_checksum, self.spdx_namespace["algorithm"], None)
                 ):
                     algorithm_identifier = convert_rdf_checksum_algorithm(str(algo))
@@ -802,12 +778,12 @@ class FileParser(LicenseParser):
         Set file licenses concluded.
         """
         try:
-            for _, _, licenses in self.graph.triples((f_term, predicate, None)):
+            for _, _, licenses in self.index.triples((f_term, predicate, None)):
                 if (
                     licenses,
                     RDF.type,
                     self.spdx_namespace["ConjunctiveLicenseSet"],
-                ) in self.graph:
+                ) in self.index:
                     lics = self.handle_conjunctive_list(licenses)
                     self.builder.set_concluded_license(self.doc, lics)
 
@@ -815,7 +791,7 @@ class FileParser(LicenseParser):
                     licenses,
                     RDF.type,
                     self.spdx_namespace["DisjunctiveLicenseSet"],
-                ) in self.graph:
+                ) in self.index:
                     lics = self.handle_disjunctive_list(licenses)
                     self.builder.set_concluded_license(self.doc, lics)
 
@@ -843,7 +819,7 @@ class SnippetParser(LicenseParser):
         except SPDXValueError:
             self.value_error("SNIPPET_SPDX_ID_VALUE", snippet_term)
 
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (snippet_term, self.spdx_namespace["name"], None)
         ):
             try:
@@ -852,7 +828,7 @@ class SnippetParser(LicenseParser):
                 self.more_than_one_error("snippetName")
                 break
 
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (snippet_term, self.spdx_namespace["licenseComments"], None)
         ):
             try:
@@ -861,14 +837,14 @@ class SnippetParser(LicenseParser):
                 self.more_than_one_error("licenseComments")
                 break
 
-        for _s, _p, o in self.graph.triples((snippet_term, RDFS.comment, None)):
+        for _s, _p, o in self.index.triples((snippet_term, RDFS.comment, None)):
             try:
                 self.builder.set_snippet_comment(self.doc, str(o))
             except CardinalityError:
                 self.more_than_one_error("comment")
                 break
 
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (snippet_term, self.spdx_namespace["copyrightText"], None)
         ):
             try:
@@ -880,14 +856,14 @@ class SnippetParser(LicenseParser):
                 break
 
         try:
-            for _, _, licenses in self.graph.triples(
+            for _, _, licenses in self.index.triples(
                 (snippet_term, self.spdx_namespace["licenseConcluded"], None)
             ):
                 if (
                     licenses,
                     RDF.type,
                     self.spdx_namespace["ConjunctiveLicenseSet"],
-                ) in self.graph:
+                ) in self.index:
                     lics = self.handle_conjunctive_list(licenses)
                     self.builder.set_snip_concluded_license(self.doc, lics)
 
@@ -895,7 +871,7 @@ class SnippetParser(LicenseParser):
                     licenses,
                     RDF.type,
                     self.spdx_namespace["DisjunctiveLicenseSet"],
-                ) in self.graph:
+                ) in self.index:
                     lics = self.handle_disjunctive_list(licenses)
                     self.builder.set_snip_concluded_license(self.doc, lics)
 
@@ -910,7 +886,7 @@ class SnippetParser(LicenseParser):
                 "package {0}".format(self.spdx_namespace["licenseConcluded"])
             )
 
-        for _, _, info in self.graph.triples(
+        for _, _, info in self.index.triples(
             (snippet_term, self.spdx_namespace["licenseInfoInSnippet"], None)
         ):
             lic = self.handle_lics(info)
@@ -920,7 +896,7 @@ class SnippetParser(LicenseParser):
                 except SPDXValueError:
                     self.value_error("SNIPPET_LIC_INFO", lic)
 
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (snippet_term, self.spdx_namespace["snippetFromFile"], None)
         ):
             try:
@@ -930,7 +906,7 @@ class SnippetParser(LicenseParser):
                 break
 
         try:
-            for _, _, attribute_text in self.graph.triples(
+            for _, _, attribute_text in self.index.triples(
                 (snippet_term, self.spdx_namespace["attributionText"], None)
             ):
                 self.builder.set_snippet_attribution_text(
@@ -967,7 +943,7 @@ class ReviewParser(BaseParser):
         Return review comment or None if found none or more than one.
         Report errors.
         """
-        comment_list = list(self.graph.triples((r_term, RDFS.comment, None)))
+        comment_list = list(self.index.triples((r_term, RDFS.comment, None)))
         if len(comment_list) > 1:
             self.error = True
             msg = "Review can have at most one comment"
@@ -983,7 +959,7 @@ class ReviewParser(BaseParser):
         Note does not check value format.
         """
         reviewed_list = list(
-            self.graph.triples((r_term, self.spdx_namespace["reviewDate"], None))
+            self.index.triples((r_term, self.spdx_namespace["reviewDate"], None))
         )
         if len(reviewed_list) != 1:
             self.error = True
@@ -998,7 +974,7 @@ class ReviewParser(BaseParser):
         Report errors on failure.
         """
         reviewer_list = list(
-            self.graph.triples((r_term, self.spdx_namespace["reviewer"], None))
+            self.index.triples((r_term, self.spdx_namespace["reviewer"], None))
         )
         if len(reviewer_list) != 1:
             self.error = True
@@ -1046,7 +1022,7 @@ class AnnotationParser(BaseParser):
         Return annotation type or None if found none or more than one.
         Report errors on failure.
         """
-        for _, _, typ in self.graph.triples(
+        for _, _, typ in self.index.triples(
             (r_term, self.spdx_namespace["annotationType"], None)
         ):
             if typ is not None:
@@ -1062,7 +1038,7 @@ class AnnotationParser(BaseParser):
         Return annotation comment or None if found none or more than one.
         Report errors.
         """
-        comment_list = list(self.graph.triples((r_term, RDFS.comment, None)))
+        comment_list = list(self.index.triples((r_term, RDFS.comment, None)))
         if len(comment_list) > 1:
             self.error = True
             msg = "Annotation can have at most one comment."
@@ -1078,7 +1054,7 @@ class AnnotationParser(BaseParser):
         Note does not check value format.
         """
         annotation_date_list = list(
-            self.graph.triples((r_term, self.spdx_namespace["annotationDate"], None))
+            self.index.triples((r_term, self.spdx_namespace["annotationDate"], None))
         )
         if len(annotation_date_list) != 1:
             self.error = True
@@ -1093,7 +1069,7 @@ class AnnotationParser(BaseParser):
         Report errors on failure.
         """
         annotator_list = list(
-            self.graph.triples((r_term, self.spdx_namespace["annotator"], None))
+            self.index.triples((r_term, self.spdx_namespace["annotator"], None))
         )
         if len(annotator_list) != 1:
             self.error = True
@@ -1130,7 +1106,7 @@ class RelationshipParser(BaseParser):
         """
         relation_subject = str(subject_term.split("#")[1])
 
-        for _, _, rtype in self.graph.triples(
+        for _, _, rtype in self.index.triples(
             (relation_term, self.spdx_namespace["relationshipType"], None)
         ):
             try:
@@ -1229,7 +1205,7 @@ class RelationshipParser(BaseParser):
                 self.value_error("RELATIONSHIP", rtype)
 
         try:
-            for sub, pre, rel_ele in self.graph.triples(
+            for sub, pre, rel_ele in self.index.triples(
                 (relation_term, self.spdx_namespace["relatedSpdxElement"], None)
             ):
                 related_element = str(rel_ele.split("#")[1]) if '#' in rel_ele else rel_ele
@@ -1253,7 +1229,7 @@ class RelationshipParser(BaseParser):
         Reports errors.
         """
 
-        comment_list = list(self.graph.triples((relation_term, RDFS.comment, None)))
+        comment_list = list(self.index.triples((relation_term, RDFS.comment, None)))
         if len(comment_list) == 0:
             return None
         else:
@@ -1266,6 +1242,23 @@ class RelationshipParser(BaseParser):
                 return str(comment_list[0][2])
 
 
+def spooled_copy(fil):
+    """
+    Return a seekable copy of the unseekable file `fil`, kept in memory up
+    to SPOOL_SIZE bytes and on disk beyond.
+    """
+    chunk = fil.read(rdf_sax.DEFAULT_CHUNK_SIZE)
+    if isinstance(chunk, str):
+        copy = tempfile.SpooledTemporaryFile(SPOOL_SIZE, mode="w+", encoding="utf-8")
+    else:
+        copy = tempfile.SpooledTemporaryFile(SPOOL_SIZE, mode="w+b")
+    while chunk:
+        copy.write(chunk)
+        chunk = fil.read(rdf_sax.DEFAULT_CHUNK_SIZE)
+    copy.seek(0)
+    return copy
+
+
 class Parser(
     PackageParser,
     FileParser,
@@ -1281,67 +1274,106 @@ class Parser(
     def __init__(self, builder, logger):
         super(Parser, self).__init__(builder, logger)
 
-    def parse(self, fil):
+    def parse(self, fil, sax=True):
         """
         Parse a file and returns a document object.
         fil is a file like object.
+        With `sax`, RDF/XML in the layout written by spdx.writers.rdf is read
+        with spdx.parsers.rdf_sax into a TripleIndex, without the store of
+        an rdflib Graph; other files are read with rdflib in any case. Both
+        hold all the triples of the document until it is built. Unseekable
+        files are copied to a temporary file first, to be read again by
+        rdflib if need be.
+        """
+        if sax and not fil.seekable():
+            with spooled_copy(fil) as copy:
+                return self.parse(copy, sax=True)
+
+        # file objects from os.fdopen are named by their descriptor
+        name = getattr(fil, "name", None)
+        named = isinstance(name, str)
+        if sax:
+            start = fil.tell()
+            index = TripleIndex()
+            # the base rdflib resolves relative references against
+            base = pathlib.Path(name).absolute().as_uri() if named else None
+            try:
+                rdf_sax.read(fil, index, base)
+                return self.parse_graph(None, index)
+            except (rdf_sax.UnsupportedRdfXml, SAXException):
+                fil.seek(start)
+
+        graph = IndexedGraph()
+        if named:
+            graph.parse(file=fil, format="xml")
+        else:
+            # rdflib needs a name for file objects, in memory ones have none
+            graph.parse(data=fil.read(), format="xml")
+        return self.parse_graph(graph, graph.index)
+
+    def parse_graph(self, graph, index=None):
+        """
+        Return a document object built from the triples of the rdflib `graph`.
+        The triples are read through `index`, a TripleIndex of the graph,
+        or by querying the graph if there is none. `graph` may be None if
+        there is an index.
         """
         self.error = False
-        self.graph = Graph()
-        self.graph.parse(file=fil, format="xml")
+        self.graph = graph
+        self.index = graph if index is None else index
         self.doc = document.Document()
 
-        for s, _p, o in self.graph.triples(
+        for s, _p, o in self.index.triples(
             (None, RDF.type, self.spdx_namespace["SpdxDocument"])
         ):
             self.parse_doc_fields(s)
 
-        for s, _p, o in self.graph.triples(
+        for s, _p, o in self.index.triples(
             (None, RDF.type, self.spdx_namespace["ExternalDocumentRef"])
         ):
             self.parse_ext_doc_ref(s)
 
-        for s, _p, o in self.graph.triples(
+        for s, _p, o in self.index.triples(
             (None, RDF.type, self.spdx_namespace["CreationInfo"])
         ):
             self.parse_creation_info(s)
 
-        for s, _p, o in self.graph.triples(
+        for s, _p, o in self.index.triples(
             (None, None, self.spdx_namespace["ExtractedLicensingInfo"])
         ):
             self.handle_extracted_license(s)
 
-        for s, _p, o in self.graph.triples(
+        for s, _p, o in self.index.triples(
             (None, RDF.type, self.spdx_namespace["Package"])
         ):
             self.parse_package(s)
 
-        for s, _p, o in self.graph.triples(
+        for s, _p, o in self.index.triples(
             (None, RDF.type, self.spdx_namespace["ExternalRef"])
         ):
             self.parse_pkg_ext_ref(s)
 
-        for s, _p, o in self.graph.triples(
+        for s, _p, o in self.index.triples(
             (None, self.spdx_namespace["referencesFile"], None)
         ):
             self.parse_file(o)
 
-        for s, _p, o in self.graph.triples(
+        for s, _p, o in self.index.triples(
             (None, RDF.type, self.spdx_namespace["Snippet"])
         ):
             self.parse_snippet(s)
 
-        for s, _p, o in self.graph.triples(
+        for s, _p, o in self.index.triples(
             (None, self.spdx_namespace["reviewed"], None)
         ):
             self.parse_review(o)
 
-        for s, _p, o in self.graph.triples(
+        for s, _p, o in self.index.triples(
             (None, self.spdx_namespace["annotation"], None)
         ):
             self.parse_annotation(o)
 
-        for s, _p, o in self.graph.triples(
+        for s, _p, o in self.index.triples(
             (None, self.spdx_namespace["relationship"], None)
         ):
             self.parse_relationship(s, o)
@@ -1361,7 +1393,7 @@ class Parser(
         """
         Parse creators, created and comment.
         """
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (ci_term, self.spdx_namespace["creator"], None)
         ):
             try:
@@ -1370,7 +1402,7 @@ class Parser(
             except SPDXValueError:
                 self.value_error("CREATOR_VALUE", o)
 
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (ci_term, self.spdx_namespace["created"], None)
         ):
             try:
@@ -1381,13 +1413,13 @@ class Parser(
                 self.more_than_one_error("created")
                 break
 
-        for _s, _p, o in self.graph.triples((ci_term, RDFS.comment, None)):
+        for _s, _p, o in self.index.triples((ci_term, RDFS.comment, None)):
             try:
                 self.builder.set_creation_comment(self.doc, str(o))
             except CardinalityError:
                 self.more_than_one_error("CreationInfo comment")
                 break
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (ci_term, self.spdx_namespace["licenseListVersion"], None)
         ):
             try:
@@ -1415,7 +1447,7 @@ class Parser(
                 self.value_error("DOC_NAMESPACE_VALUE", doc_term)
         except SPDXValueError:
             self.value_error("DOC_NAMESPACE_VALUE", doc_term)
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (doc_term, self.spdx_namespace["specVersion"], None)
         ):
             try:
@@ -1425,7 +1457,7 @@ class Parser(
             except CardinalityError:
                 self.more_than_one_error("specVersion")
                 break
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (doc_term, self.spdx_namespace["dataLicense"], None)
         ):
             try:
@@ -1435,7 +1467,7 @@ class Parser(
             except CardinalityError:
                 self.more_than_one_error("dataLicense")
                 break
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (doc_term, self.spdx_namespace["name"], None)
         ):
             try:
@@ -1443,7 +1475,7 @@ class Parser(
             except CardinalityError:
                 self.more_than_one_error("name")
                 break
-        for _s, _p, o in self.graph.triples((doc_term, RDFS.comment, None)):
+        for _s, _p, o in self.index.triples((doc_term, RDFS.comment, None)):
             try:
                 self.builder.set_doc_comment(self.doc, str(o))
             except CardinalityError:
@@ -1454,7 +1486,7 @@ class Parser(
         """
         Parse the External Document ID, SPDX Document URI and Checksum.
         """
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (ext_doc_ref_term, self.spdx_namespace["externalDocumentId"], None)
         ):
             try:
@@ -1463,7 +1495,7 @@ class Parser(
                 self.value_error("EXT_DOC_REF_VALUE", "External Document ID")
                 break
 
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (ext_doc_ref_term, self.spdx_namespace["spdxDocument"], None)
         ):
             try:
@@ -1472,10 +1504,10 @@ class Parser(
                 self.value_error("EXT_DOC_REF_VALUE", "SPDX Document URI")
                 break
 
-        for _s, _p, checksum in self.graph.triples(
+        for _s, _p, checksum in self.index.triples(
             (ext_doc_ref_term, self.spdx_namespace["checksum"], None)
         ):
-            for _, _, value in self.graph.triples(
+            for _, _, value in self.index.triples(
                 (checksum, self.spdx_namespace["checksumValue"], None)
             ):
                 try:
@@ -1488,7 +1520,7 @@ class Parser(
         """
         Parse the category, type, locator, and comment.
         """
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (pkg_ext_term, self.spdx_namespace["referenceCategory"], None)
         ):
             try:
@@ -1499,7 +1531,7 @@ class Parser(
                 )
                 break
 
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (pkg_ext_term, self.spdx_namespace["referenceType"], None)
         ):
             try:
@@ -1508,12 +1540,12 @@ class Parser(
                 self.value_error("PKG_EXT_REF_TYPE", "Package External Reference Type")
                 break
 
-        for _s, _p, o in self.graph.triples(
+        for _s, _p, o in self.index.triples(
             (pkg_ext_term, self.spdx_namespace["referenceLocator"], None)
         ):
             self.builder.set_pkg_ext_ref_locator(self.doc, str(o))
 
-        for _s, _p, o in self.graph.triples((pkg_ext_term, RDFS.comment, None)):
+        for _s, _p, o in self.index.triples((pkg_ext_term, RDFS.comment, None)):
             try:
                 self.builder.set_pkg_ext_ref_comment(self.doc, str(o))
             except CardinalityError:
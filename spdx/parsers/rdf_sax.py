@@ -0,0 +1,191 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Read RDF/XML straight into a TripleIndex with the SAX parser, without an
+rdflib Graph and its store. The triples are all kept: the SPDX elements
+are built from the index once the whole document is read.
+
+Only the RDF/XML layout written by spdx.writers.rdf is understood: typed
+or rdf:Description node elements identified by rdf:about or rdf:nodeID,
+and property elements with rdf:resource, rdf:nodeID, a nested node
+element or a literal with an optional rdf:datatype or xml:lang. Anything
+else raises UnsupportedRdfXml, and the caller should use rdflib instead.
+The triples are added in the same order as rdflib's RDF/XML parser adds
+them.
+"""
+
+import re
+import xml.sax
+from xml.sax.handler import ContentHandler, feature_namespaces
+
+from rdflib import BNode, Literal, RDF, URIRef
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+RDF_NS = str(RDF)
+XML_NS = "http://www.w3.org/XML/1998/namespace"
+
+RDF_ROOT = (RDF_NS, "RDF")
+RDF_DESCRIPTION = (RDF_NS, "Description")
+RDF_TYPE = (RDF_NS, "type")
+RDF_ABOUT = (RDF_NS, "about")
+RDF_NODE_ID = (RDF_NS, "nodeID")
+RDF_RESOURCE = (RDF_NS, "resource")
+RDF_DATATYPE = (RDF_NS, "datatype")
+XML_LANG = (XML_NS, "lang")
+
+NODE_ATTRIBUTES = frozenset([RDF_ABOUT, RDF_NODE_ID])
+PROPERTY_ATTRIBUTES = frozenset([RDF_RESOURCE, RDF_NODE_ID, RDF_DATATYPE, XML_LANG])
+
+ABSOLUTE_URI_REGEX = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:")
+
+
+class UnsupportedRdfXml(Exception):
+    """The RDF/XML uses a construct the SAX reader does not handle."""
+
+
+class NodeElement(object):
+    def __init__(self, subject):
+        self.subject = subject
+
+
+class PropertyElement(object):
+    def __init__(self, predicate, obj, datatype, language):
+        self.predicate = predicate
+        self.object = obj
+        self.datatype = datatype
+        self.language = language
+        self.data = []
+
+
+class RdfXmlHandler(ContentHandler):
+    """
+    SAX handler adding the triples of the RDF/XML document to `sink`, an
+    object with an `add(triple)` method. Relative URI references are
+    resolved against `base`, like rdflib does with the document location.
+    """
+
+    def __init__(self, sink, base=None):
+        super(RdfXmlHandler, self).__init__()
+        self.sink = sink
+        self.base = base
+        self.bnodes = dict()
+        self.stack = []
+
+    def uri(self, value):
+        if ABSOLUTE_URI_REGEX.match(value):
+            return URIRef(value)
+        if self.base is None:
+            raise UnsupportedRdfXml("relative URI reference {0}".format(value))
+        return URIRef(value, base=self.base)
+
+    def bnode(self, node_id):
+        if node_id not in self.bnodes:
+            self.bnodes[node_id] = BNode()
+        return self.bnodes[node_id]
+
+    def startElementNS(self, name, qname, attrs):
+        if not self.stack:
+            if name != RDF_ROOT or attrs.getLength():
+                raise UnsupportedRdfXml("document element is not a plain rdf:RDF")
+            self.stack.append(None)
+            return
+
+        parent = self.stack[-1]
+        if isinstance(parent, NodeElement):
+            self.stack.append(self.property_element(name, attrs))
+        else:
+            self.stack.append(self.node_element(name, attrs, parent))
+
+    def node_element(self, name, attrs, parent):
+        if parent is not None and (parent.object is not None or "".join(parent.data).strip()):
+            raise UnsupportedRdfXml("property element with more than one value")
+        names = set(attrs.getNames())
+        if not names <= NODE_ATTRIBUTES or len(names) > 1:
+            raise UnsupportedRdfXml("node element attributes {0}".format(sorted(names)))
+        if name[0] == RDF_NS and name != RDF_DESCRIPTION:
+            raise UnsupportedRdfXml("node element {0}".format(name[1]))
+
+        if RDF_ABOUT in names:
+            subject = self.uri(attrs.getValue(RDF_ABOUT))
+        elif RDF_NODE_ID in names:
+            subject = self.bnode(attrs.getValue(RDF_NODE_ID))
+        else:
+            subject = BNode()
+        if name != RDF_DESCRIPTION:
+            self.sink.add((subject, RDF.type, URIRef("".join(name))))
+        if parent is not None:
+            parent.object = subject
+        return NodeElement(subject)
+
+    def property_element(self, name, attrs):
+        names = set(attrs.getNames())
+        if not names <= PROPERTY_ATTRIBUTES:
+            raise UnsupportedRdfXml("property element attributes {0}".format(sorted(names)))
+        if name[0] == RDF_NS and name != RDF_TYPE:
+            raise UnsupportedRdfXml("property element {0}".format(name[1]))
+
+        obj = None
+        if RDF_RESOURCE in names:
+            if len(names) > 1:
+                raise UnsupportedRdfXml("rdf:resource with other attributes")
+            obj = self.uri(attrs.getValue(RDF_RESOURCE))
+        elif RDF_NODE_ID in names:
+            if len(names) > 1:
+                raise UnsupportedRdfXml("rdf:nodeID with other attributes")
+            obj = self.bnode(attrs.getValue(RDF_NODE_ID))
+        datatype = attrs.getValue(RDF_DATATYPE) if RDF_DATATYPE in names else None
+        language = attrs.getValue(XML_LANG) if XML_LANG in names else None
+        return PropertyElement(URIRef("".join(name)), obj, datatype, language)
+
+    def characters(self, content):
+        current = self.stack[-1] if self.stack else None
+        if isinstance(current, PropertyElement):
+            current.data.append(content)
+        elif content.strip():
+            raise UnsupportedRdfXml("text outside of a property element")
+
+    def endElementNS(self, name, qname):
+        current = self.stack.pop()
+        if not isinstance(current, PropertyElement):
+            return
+        obj = current.object
+        if obj is None:
+            if current.datatype is not None:
+                obj = Literal("".join(current.data), datatype=current.datatype)
+            else:
+                obj = Literal("".join(current.data), lang=current.language)
+        elif "".join(current.data).strip():
+            raise UnsupportedRdfXml("property element with more than one value")
+        self.sink.add((self.stack[-1].subject, current.predicate, obj))
+
+    def ignorableWhitespace(self, whitespace):
+        pass
+
+
+def read(fil, sink, base=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Add the triples of the RDF/XML read from the file like object `fil` to
+    `sink`, resolving relative URI references against `base`. Raise
+    UnsupportedRdfXml if the layout is not understood and
+    xml.sax.SAXException if the XML is malformed. Unlike xml.sax.parse,
+    this leaves `fil` open.
+    """
+    parser = xml.sax.make_parser()
+    parser.setFeature(feature_namespaces, True)
+    parser.setContentHandler(RdfXmlHandler(sink, base))
+    chunk = fil.read(chunk_size)
+    while chunk:
+        parser.feed(chunk)
+        chunk = fil.read(chunk_size)
+    parser.close()
@@ -16,6 +16,7 @@ from typing import Dict, Union
 from spdx import file
 from spdx import license
 from spdx import package
+from spdx import utils
 from spdx import version
 from spdx.checksum import Checksum, ChecksumAlgorithm
 from spdx.document import Document
@@ -24,7 +25,14 @@ from spdx.parsers.builderexceptions import OrderError
 from spdx.parsers.builderexceptions import SPDXValueError
 from spdx.parsers import tagvaluebuilders
 from spdx.parsers import validations
-from spdx.parsers.rdf import convert_rdf_checksum_algorithm
+
+
+def convert_rdf_checksum_algorithm(rdf_checksum_algorithm: str) -> ChecksumAlgorithm:
+    split_string = rdf_checksum_algorithm.split('#')
+    if len(split_string) != 2:
+        raise SPDXValueError('Unknown checksum algorithm {}'.format(rdf_checksum_algorithm))
+    checksum_algorithm = ChecksumAlgorithm.checksum_from_rdf(split_string[1])
+    return checksum_algorithm
 
 
 class DocBuilder(object):
@@ -280,7 +288,7 @@ class PackageBuilder(tagvaluebuilders.PackageBuilder):
         self.assert_package_exists()
         if not self.package_cr_text_set:
             self.package_cr_text_set = True
-            doc.packages[-1].cr_text = text
+            doc.packages[-1].cr_text = utils.shared_text(self, text)
         else:
             raise CardinalityError("Package::CopyrightText")
 
@@ -443,7 +451,7 @@ class FileBuilder(tagvaluebuilders.FileBuilder):
         if self.has_package(doc) and self.has_file(doc):
             if not self.file_copytext_set:
                 self.file_copytext_set = True
-                self.file(doc).copyright = text
+                self.file(doc).copyright = utils.shared_text(self, text)
                 return True
             else:
                 raise CardinalityError("File::CopyRight")
@@ -547,7 +555,7 @@ class SnippetBuilder(tagvaluebuilders.SnippetBuilder):
         self.assert_snippet_exists()
         if not self.snippet_copyright_set:
             self.snippet_copyright_set = True
-            doc.snippet[-1].copyright = copyright
+            doc.snippet[-1].copyright = utils.shared_text(self, copyright)
         else:
             raise CardinalityError("Snippet::copyrightText")
 
@@ -661,6 +669,7 @@ class Builder(
         Must be called between usage with different documents.
         """
         # FIXME: this state does not make sense
+        self.shared_texts = dict()
         self.reset_creation_info()
         self.reset_document()
         self.reset_package()
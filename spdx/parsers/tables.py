@@ -0,0 +1,99 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Maintenance of the precompiled PLY parser tables shipped with spdx.
+
+The tag-value and license list grammars are turned into LALR tables once
+and stored as `spdx/parsers/tagvalue_parsetab.py` and
+`spdx/parsers/licenselist_parsetab.py`. Each table records the signature of
+the grammar it was built from; PLY compares it at build time and rebuilds
+the table when the grammar has changed, so a stale table is never used.
+
+Run `python -m spdx.parsers.tables` after changing a grammar to refresh the
+shipped tables.
+"""
+
+import importlib
+import os
+import sys
+
+from ply import yacc
+
+from spdx import utils
+from spdx.parsers import tagvalue
+from spdx.parsers.loggers import StandardLogger
+from spdx.parsers.tagvaluebuilders import Builder
+
+
+def _grammar_modules():
+    """Return (tabmodule, parser instance) pairs of all shipped grammars."""
+    return [
+        (tagvalue.TABMODULE, tagvalue.Parser(Builder(), StandardLogger())),
+        (utils.LICENSE_LIST_TABMODULE, utils.LicenseListParser()),
+    ]
+
+
+def grammar_signature(parser):
+    """Return the PLY signature of the grammar defined by the `parser` instance."""
+    pinfo = yacc.ParserReflect(
+        {name: getattr(parser, name) for name in dir(parser)},
+        log=yacc.NullLogger(),
+    )
+    pinfo.get_all()
+    return pinfo.signature()
+
+
+def stale_tables():
+    """Return the names of the shipped table modules that do not match their grammar."""
+    stale = []
+    for tabmodule, parser in _grammar_modules():
+        try:
+            table = importlib.import_module(tabmodule)
+        except ImportError:
+            stale.append(tabmodule)
+            continue
+        if (
+            getattr(table, "_tabversion", None) != yacc.__tabversion__
+            or getattr(table, "_lr_signature", None) != grammar_signature(parser)
+        ):
+            stale.append(tabmodule)
+    return stale
+
+
+def write_tables():
+    """Regenerate the stale shipped table modules from the current grammars."""
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for tabmodule, parser in _grammar_modules():
+        # PLY rewrites the table module whenever it is missing or its
+        # signature does not match the grammar.
+        yacc.yacc(
+            module=parser,
+            tabmodule=tabmodule,
+            outputdir=package_dir,
+            debug=False,
+            errorlog=yacc.NullLogger(),
+        )
+        sys.modules.pop(tabmodule, None)
+
+
+def main():
+    write_tables()
+    stale = stale_tables()
+    if stale:
+        print("Failed to refresh: " + ", ".join(stale), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,10 +20,18 @@ from spdx import utils
 from spdx.parsers.builderexceptions import CardinalityError
 from spdx.parsers.builderexceptions import OrderError
 from spdx.parsers.builderexceptions import SPDXValueError
+from spdx.parsers.lexers.tagvalue import DEFAULT_CHUNK_SIZE
+from spdx.parsers.lexers.tagvalue import LEXER_BACKENDS
 from spdx.parsers.lexers.tagvalue import Lexer
 from spdx.parsers.loggers import ErrorMessages
+from spdx.parsers.tagvalue_parallel import DEFAULT_SHARD_SIZE
+from spdx.parsers import tagvalue_events
+from spdx.parsers import tagvalue_parallel
 from spdx import document
 
+# Precompiled parser tables, regenerated by `python -m spdx.parsers.tables`.
+TABMODULE = "spdx.parsers.tagvalue_parsetab"
+
 ERROR_MESSAGES = {
     "TOOL_VALUE": "Invalid tool value {0} at line: {1}",
     "ORG_VALUE": "Invalid organization value {0} at line: {1}",
@@ -147,8 +155,7 @@ class Parser(object):
         self.builder = builder
         self.logger = logger
         self.error = False
-        self.license_list_parser = utils.LicenseListParser()
-        self.license_list_parser.build(write_tables=0, debug=0)
+        self.license_list_parser = utils.get_license_list_parser()
 
     def p_start_1(self, p):
         "start : start attrib "
@@ -554,7 +561,7 @@ class Parser(object):
     def p_file_lic_info_value_3(self, p):
         """file_lic_info_value : LINE"""
         value = p[1]
-        p[0] = license.License.from_identifier(value)
+        p[0] = license.License.interned(value)
 
     def p_conc_license_1(self, p):
         """conc_license : NO_ASSERT"""
@@ -569,7 +576,7 @@ class Parser(object):
         value = p[1]
         ref_re = re.compile("LicenseRef-.+", re.UNICODE)
         if (p[1] in config.LICENSE_MAP.keys()) or (ref_re.match(p[1]) is not None):
-            p[0] = license.License.from_identifier(value)
+            p[0] = license.License.interned(value)
         else:
             p[0] = self.license_list_parser.parse(value)
 
@@ -890,7 +897,7 @@ class Parser(object):
     def p_pkg_lic_ff_value_3(self, p):
         """pkg_lic_ff_value : LINE"""
         value = p[1]
-        p[0] = license.License.from_identifier(value)
+        p[0] = license.License.interned(value)
 
     def p_pkg_lic_ff_2(self, p):
         """pkg_lic_ff : PKG_LICS_FFILE error"""
@@ -1440,7 +1447,7 @@ class Parser(object):
     def p_snip_lic_info_value_3(self, p):
         """snip_lic_info_value : LINE"""
         value = p[1]
-        p[0] = license.License.from_identifier(value)
+        p[0] = license.License.interned(value)
 
     def p_reviewer_1(self, p):
         """reviewer : REVIEWER entity"""
@@ -1802,15 +1809,68 @@ class Parser(object):
     def p_error(self, p):
         pass
 
-    def build(self, **kwargs):
-        self.lex = Lexer()
+    def build(self, lexer_backend="ply", **kwargs):
+        """Must be called before parse.
+        `lexer_backend` selects the tokenizer from `LEXER_BACKENDS`: "ply"
+        for the PLY based `Lexer` or "fast" for the hand-written `FastLexer`,
+        both yield the same tokens.
+        Uses the LALR tables shipped in `TABMODULE` unless told otherwise;
+        PLY regenerates them if the grammar signature changed.
+        """
+        kwargs.setdefault("tabmodule", TABMODULE)
+        kwargs.setdefault("debug", False)
+        self.lexer_backend = lexer_backend
+        self.lex = LEXER_BACKENDS[lexer_backend]()
         self.lex.build(reflags=re.UNICODE)
         self.yacc = yacc.yacc(module=self, **kwargs)
 
     def parse(self, text):
+        self.lex.input(text)
+        return self._parse()
+
+    def parse_stream(self, stream, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Parse the tag-value text read from the file-like `stream` without
+        reading it into memory at once, see `Lexer.input_stream`.
+        """
+        self.lex.input_stream(stream, chunk_size)
+        return self._parse()
+
+    def parse_events(self, stream, handler, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Parse the tag-value text read from `stream` and report its elements
+        to `handler`, a tagvalue_events.TagValueHandler, instead of keeping
+        them in the returned document.
+        """
+        self.lex.input_stream(stream, chunk_size)
+        self.document = tagvalue_events.EventDocument(handler)
+        self.error = False
+        self.yacc.parse(lexer=self.lex)
+        self.document.report_all()
+        self.finish_parse()
+        handler.on_document(self.document)
+        return self.document, self.error
+
+    def parse_parallel(self, text, max_workers=None, shard_size=DEFAULT_SHARD_SIZE):
+        """
+        Parse `text` like `parse`, splitting large documents into shards that
+        are parsed in up to `max_workers` processes.
+        """
+        return tagvalue_parallel.parse(self, text, max_workers, shard_size)
+
+    def parse_part(self, text, lineno):
+        """Parse `text`, starting at line `lineno`, into the current document."""
+        self.lex.input(text)
+        self.lex.set_lineno(lineno)
+        self.yacc.parse(lexer=self.lex)
+
+    def _parse(self):
         self.document = document.Document()
         self.error = False
-        self.yacc.parse(text, lexer=self.lex)
+        self.yacc.parse(lexer=self.lex)
+        return self.finish_parse()
+
+    def finish_parse(self):
         # FIXME: this state does not make sense
         self.builder.reset()
         validation_messages = ErrorMessages()
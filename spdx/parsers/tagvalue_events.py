@@ -0,0 +1,151 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Event-driven parsing of tag-value documents.
+
+Parser.parse_events does not keep the packages, files, snippets and other
+elements of a document. Each element is handed to a TagValueHandler as
+soon as the builder can no longer change it, that is when the next element
+of the same kind starts or the document ends, and is dropped once the
+handler returns. Memory use thus does not grow with the size of the
+document.
+
+Elements are validated as they are reported. The messages are logged at
+the end of the parse, like Parser.parse does. A relationship equal to one
+already reported is not reported again unless it has a comment; for this
+the text of the reported relationships is kept.
+"""
+
+from spdx.document import Document
+from spdx.parsers.loggers import ErrorMessages
+
+# Handler method and Document validation method per Document element list,
+# in the order pending elements are reported at the end.
+ELEMENTS = {
+    "files": ("on_file", "validate_files"),
+    "snippet": ("on_snippet", "validate_snippet"),
+    "packages": ("on_package", "validate_packages"),
+    "extracted_licenses": ("on_extracted_license", "validate_extracted_licenses"),
+    "relationships": ("on_relationship", "validate_relationships"),
+    "annotations": ("on_annotation", "validate_annotations"),
+    "reviews": ("on_review", "validate_reviews"),
+}
+# Order of the element messages in Document.validate
+VALIDATION_ORDER = (
+    "files", "packages", "extracted_licenses", "reviews", "snippet", "annotations", "relationships",
+)
+
+
+class TagValueHandler(object):
+    """
+    Receive the elements of a tag-value document. Subclasses override the
+    methods for the elements they are interested in.
+    """
+
+    def on_package(self, package):
+        pass
+
+    def on_file(self, file):
+        pass
+
+    def on_snippet(self, snippet):
+        pass
+
+    def on_relationship(self, relationship):
+        pass
+
+    def on_annotation(self, annotation):
+        pass
+
+    def on_review(self, review):
+        pass
+
+    def on_extracted_license(self, extracted_license):
+        pass
+
+    def on_document(self, document):
+        """
+        Called last with the document information, after all elements were
+        reported; the element lists of `document` are empty.
+        """
+        pass
+
+
+class EventDocument(Document):
+    """
+    A Document that keeps only the element of each kind that is being built
+    and reports the others to `handler`.
+    """
+
+    def __init__(self, handler):
+        super(EventDocument, self).__init__()
+        self.handler = handler
+        self.element_messages = dict((name, []) for name in VALIDATION_ORDER)
+        self.reported_relationships = set()
+
+    def report(self, name):
+        """Validate the pending element of list `name` and hand it to the handler."""
+        elements = getattr(self, name)
+        if not elements:
+            return
+        method, validator = ELEMENTS[name]
+        if name == "relationships":
+            relationship = elements[0]
+            if relationship.relationship in self.reported_relationships and not relationship.has_comment:
+                del elements[:]
+                return
+            self.reported_relationships.add(relationship.relationship)
+        messages = ErrorMessages()
+        messages.push_context(self.name)
+        getattr(self, validator)(messages)
+        self.element_messages[name].extend(messages)
+        getattr(self.handler, method)(elements[0])
+        del elements[:]
+
+    def report_all(self):
+        for name in ELEMENTS:
+            self.report(name)
+
+    def add_file(self, file):
+        self.report("files")
+        super(EventDocument, self).add_file(file)
+
+    def add_snippet(self, snip):
+        self.report("snippet")
+        super(EventDocument, self).add_snippet(snip)
+
+    def add_package(self, package):
+        self.report("packages")
+        super(EventDocument, self).add_package(package)
+
+    def add_extr_lic(self, lic):
+        self.report("extracted_licenses")
+        super(EventDocument, self).add_extr_lic(lic)
+
+    def add_relationship(self, relationship):
+        self.report("relationships")
+        super(EventDocument, self).add_relationship(relationship)
+
+    def add_annotation(self, annotation):
+        self.report("annotations")
+        super(EventDocument, self).add_annotation(annotation)
+
+    def add_review(self, review):
+        self.report("reviews")
+        super(EventDocument, self).add_review(review)
+
+    def validate(self, messages=None):
+        messages = super(EventDocument, self).validate(messages)
+        for name in VALIDATION_ORDER:
+            messages.messages.extend(self.element_messages[name])
+        return messages
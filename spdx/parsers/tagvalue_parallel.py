@@ -0,0 +1,259 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parse large tag-value documents in several processes.
+
+The text is split into shards at `PackageName`, `FileName` and
+`SnippetSPDXID` lines. Every shard is parsed by its own Parser after the
+document header (and, for a shard starting in the middle of a package, the
+lines describing that package) so that the builder is in the same state as
+in a serial parse. The elements each shard adds are then merged in order.
+
+A split is only made where this is known to give the same result as a
+serial parse. Text that cannot be split that way, and any text for which a
+shard reports an error, is parsed serially, so that error messages are
+exactly those of a serial parse.
+"""
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from spdx import document
+from spdx.parsers.lexers.tagvalue import Lexer, is_tag_line, scan_lines
+
+# Shards smaller than this, in characters, are not worth a process.
+DEFAULT_SHARD_SIZE = 1 << 20
+
+SECTION_TAGS = frozenset(["PackageName", "FileName", "SnippetSPDXID"])
+
+
+def _tags(*tokens):
+    return frozenset(tag for tag, token in Lexer.reserved.items() if token in tokens)
+
+
+DOCUMENT_TAGS = _tags(
+    "DOC_VERSION", "DOC_LICENSE", "DOC_NAME", "DOC_COMMENT", "DOC_NAMESPACE", "EXT_DOC_REF", "CREATOR",
+    "CREATED", "CREATOR_COMMENT", "LIC_LIST_VER",
+)
+# Tags that start an element the following tags of the group refer to.
+BLOCK_TAGS = frozenset(["Relationship", "Annotator", "Reviewer", "LicenseID"])
+# The tag that has to come first for each tag that refers to the last element.
+OPENING_TAGS = dict(
+    [(tag, "PackageName") for tag, token in Lexer.reserved.items()
+     if token.startswith("PKG_") and token != "PKG_NAME"]
+    + [(tag, "PackageName") for tag in _tags(
+        "PRIMARY_PACKAGE_PURPOSE", "BUILT_DATE", "RELEASE_DATE", "VALID_UNTIL_DATE")]
+    + [(tag, "FileName") for tag, token in Lexer.reserved.items()
+       if token.startswith(("FILE_", "ART_PRJ_")) and token != "FILE_NAME"]
+    + [(tag, "SnippetSPDXID") for tag, token in Lexer.reserved.items()
+       if token.startswith("SNIPPET_") and token != "SNIPPET_SPDX_ID"]
+    + [(tag, "Relationship") for tag in _tags("RELATIONSHIP_COMMENT")]
+    + [(tag, "Annotator") for tag in _tags(
+        "ANNOTATION_DATE", "ANNOTATION_COMMENT", "ANNOTATION_TYPE", "ANNOTATION_SPDX_ID")]
+    + [(tag, "Reviewer") for tag in _tags("REVIEW_DATE", "REVIEW_COMMENT")]
+    + [(tag, "LicenseID") for tag in _tags("LICS_TEXT", "LICS_NAME", "LICS_CRS_REF", "LICS_COMMENT")]
+)
+
+# Document lists the shards add elements to, besides the relationships.
+ELEMENT_LISTS = ("packages", "files", "snippet", "annotations", "reviews", "extracted_licenses")
+
+
+class Section(object):
+    """A part of the text starting with one of the SECTION_TAGS."""
+
+    def __init__(self, tag, start, lineno, package):
+        self.tag = tag
+        self.start = start
+        self.lineno = lineno
+        self.end = None
+        # The package section this section belongs to, if any
+        self.package = package
+        self.can_start_shard = True
+        self.has_spdx_id = False
+        self.has_late_package_tags = False
+
+
+def plan_shards(text, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    Return a list of shards for parsing `text` or None if it should be
+    parsed serially. Each shard is a list of (start, end, lineno, keep) parts
+    of `text` to parse one after the other, only the elements added by the
+    parts with keep set belong to the shard.
+    """
+    sections = []
+    header_has_spdx_id = False
+    package = None
+    opened = set()
+    offset = 0
+    lineno = 1
+    for line, at_boundary in scan_lines(io.StringIO(text)):
+        if at_boundary:
+            stripped = line.strip()
+            if stripped and not stripped.startswith("#"):
+                if not is_tag_line(line):
+                    return None
+                tag = line[:line.index(":")]
+                if tag in SECTION_TAGS:
+                    if sections:
+                        sections[-1].end = offset
+                    section = Section(tag, offset, lineno, package)
+                    if tag == "PackageName":
+                        package = section.package = section
+                    sections.append(section)
+                    opened = {tag}
+                elif not sections:
+                    if tag == "SPDXID":
+                        header_has_spdx_id = True
+                    elif tag not in DOCUMENT_TAGS and tag not in BLOCK_TAGS and tag not in OPENING_TAGS:
+                        return None
+                elif tag == "SPDXID":
+                    sections[-1].has_spdx_id = True
+                elif tag in DOCUMENT_TAGS:
+                    return None
+                elif tag in BLOCK_TAGS:
+                    opened.add(tag)
+                elif tag in OPENING_TAGS:
+                    if OPENING_TAGS[tag] not in opened:
+                        sections[-1].can_start_shard = False
+                        if OPENING_TAGS[tag] == "PackageName" and package is not None:
+                            package.has_late_package_tags = True
+                else:
+                    return None
+        offset += len(line)
+        lineno += line.count("\n")
+
+    if not sections or not header_has_spdx_id:
+        return None
+    sections[-1].end = offset
+
+    for section in sections:
+        package = section.package
+        if package is not None and package is not section:
+            # The package is replayed from its own section before this one,
+            # which needs to give the builder its final state.
+            if package.has_late_package_tags or not package.has_spdx_id:
+                section.can_start_shard = False
+
+    shard_sections = []
+    shard_start = 0
+    for section in sections[1:]:
+        if section.can_start_shard and section.start - shard_start >= shard_size:
+            shard_sections.append(section)
+            shard_start = section.start
+    if not shard_sections:
+        return None
+
+    ends = [section.start for section in shard_sections] + [len(text)]
+    shards = [[(0, ends[0], 1, True)]]
+    for section, end in zip(shard_sections, ends[1:]):
+        shard = [(0, sections[0].start, 1, False)]
+        package = section.package
+        if package is not None and package is not section:
+            shard.append((package.start, package.end, package.lineno, False))
+        shard.append((section.start, end, section.lineno, True))
+        shards.append(shard)
+    return shards
+
+
+class _DiscardingLogger(object):
+    def log(self, msg):
+        pass
+
+
+def parse_shard(builder_class, lexer_backend, parts):
+    """
+    Parse the (text, lineno, keep) `parts` one after the other into one
+    Document. Return None if that fails, else a dictionary mapping the names
+    of the Document lists to the elements the parts with keep set added.
+    """
+    from spdx.parsers.tagvalue import Parser
+
+    parser = Parser(builder_class(), _DiscardingLogger())
+    parser.build(lexer_backend=lexer_backend)
+    parser.document = document.Document()
+    parser.error = False
+    doc = parser.document
+    if len(parts) == 1:
+        parser.parse_part(*parts[0][:2])
+        return None if parser.error else {"document": doc}
+
+    known = dict()
+    for text, lineno, keep in parts:
+        if keep:
+            # map the ids to the elements to keep them alive: a relationship
+            # replaced by an equal one could otherwise be freed and its id
+            # reused for the new one
+            known = {
+                name: {id(element): element for element in getattr(doc, name)}
+                for name in ELEMENT_LISTS + ("relationships",)
+            }
+        parser.parse_part(text, lineno)
+    if parser.error:
+        return None
+    return {
+        name: [element for element in getattr(doc, name) if id(element) not in known[name]]
+        for name in known
+    }
+
+
+def _parse_shard(args):
+    return parse_shard(*args)
+
+
+def merge_relationships(doc, relationships):
+    """
+    Add `relationships` to `doc` like the tag-value builder would add them
+    one by one: a relationship equal to one already present replaces it at
+    the end of the list unless the present one has a comment.
+    """
+    merged = {relationship.relationship: relationship for relationship in doc.relationships}
+    for relationship in relationships:
+        existing = merged.get(relationship.relationship)
+        if existing is not None:
+            if existing.has_comment:
+                continue
+            del merged[relationship.relationship]
+        merged[relationship.relationship] = relationship
+    doc.relationships = list(merged.values())
+
+
+def parse(parser, text, max_workers=None, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    Parse `text` with the tag-value `parser`, in up to `max_workers`
+    processes (default: number of CPUs) when it is large enough. Return the
+    same (document, error) tuple as Parser.parse.
+    """
+    shards = plan_shards(text, shard_size)
+    if shards is None or max_workers == 1:
+        return parser.parse(text)
+
+    tasks = [
+        (type(parser.builder), parser.lexer_backend, [(text[start:end], lineno, keep)
+                                                       for start, end, lineno, keep in shard])
+        for shard in shards
+    ]
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        results = list(executor.map(_parse_shard, tasks))
+    if any(result is None for result in results):
+        return parser.parse(text)
+
+    doc = results[0]["document"]
+    for result in results[1:]:
+        for name in ELEMENT_LISTS:
+            getattr(doc, name).extend(result[name])
+        merge_relationships(doc, result["relationships"])
+
+    parser.document = doc
+    parser.error = False
+    return parser.finish_parse()
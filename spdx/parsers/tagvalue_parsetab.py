@@ -0,0 +1,337 @@
+
+# tagvalue_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ANNOTATION_COMMENT ANNOTATION_DATE ANNOTATION_SPDX_ID ANNOTATION_TYPE ANNOTATOR APPLICATION ARCHIVE ART_PRJ_HOME ART_PRJ_NAME ART_PRJ_URI AUDIO BINARY BUILT_DATE CHKSUM CONTAINER CREATED CREATOR CREATOR_COMMENT DATE DEVICE DOCUMENTATION DOC_COMMENT DOC_LICENSE DOC_NAME DOC_NAMESPACE DOC_REF_ID DOC_URI DOC_VERSION EXT_DOC_REF EXT_DOC_REF_CHKSUM FILE FILETYPE_TEXT FILE_ATTRIBUTION_TEXT FILE_CHKSUM FILE_COMMENT FILE_CONTRIB FILE_CR_TEXT FILE_DEP FILE_LICS_COMMENT FILE_LICS_CONC FILE_LICS_INFO FILE_NAME FILE_NOTICE FILE_TYPE FIRMWARE FRAMEWORK IMAGE INSTALL LIBRARY LICS_COMMENT LICS_CRS_REF LICS_ID LICS_NAME LICS_TEXT LIC_LIST_VER LINE NONE NO_ASSERT OPERATING_SYSTEM ORG_VALUE OTHER PERSON_VALUE PKG_ATTRIBUTION_TEXT PKG_CHKSUM PKG_COMMENT PKG_CPY_TEXT PKG_DESC PKG_DOWN PKG_EXT_REF PKG_EXT_REF_COMMENT PKG_FILES_ANALYZED PKG_FILE_NAME PKG_HOME PKG_LICS_COMMENT PKG_LICS_CONC PKG_LICS_DECL PKG_LICS_FFILE PKG_NAME PKG_ORIG PKG_SRC_INFO PKG_SUM PKG_SUPPL PKG_VERF_CODE PKG_VERSION PRIMARY_PACKAGE_PURPOSE RELATIONSHIP RELATIONSHIP_COMMENT RELEASE_DATE REVIEW REVIEWER REVIEW_COMMENT REVIEW_DATE SNIPPET_ATTRIBUTION_TEXT SNIPPET_BYTE_RANGE SNIPPET_COMMENT SNIPPET_CR_TEXT SNIPPET_FILE_SPDXID SNIPPET_LICS_COMMENT SNIPPET_LICS_CONC SNIPPET_LICS_INFO SNIPPET_LINE_RANGE SNIPPET_NAME SNIPPET_SPDX_ID SOURCE SPDX SPDX_ID TEXT TOOL_VALUE UNKNOWN_TAG UN_KNOWN VALID_UNTIL_DATE VIDEOstart : start attrib start : attrib attrib : spdx_version\n                  | spdx_id\n                  | data_lics\n                  | doc_name\n                  | ext_doc_ref\n                  | doc_comment\n                  | doc_namespace\n                  | creator\n                  | created\n                  | creator_comment\n                  | locs_list_ver\n                  | reviewer\n                  | review_date\n                  | review_comment\n                  | annotator\n                  | annotation_date\n                  | annotation_comment\n                  | annotation_type\n                  | annotation_spdx_id\n                  | relationship\n                  | relationship_comment\n                  | package_name\n                  | package_version\n                  | pkg_down_location\n                  | pkg_files_analyzed\n                  | pkg_home\n                  | pkg_summary\n                  | pkg_src_info\n                  | pkg_file_name\n                  | pkg_supplier\n                  | pkg_orig\n                  | pkg_chksum\n                  | pkg_verif\n                  | pkg_desc\n                  | pkg_comment\n                  | pkg_attribution_text\n                  | pkg_lic_decl\n                  | pkg_lic_conc\n                  | pkg_lic_ff\n                  | pkg_lic_comment\n                  | pkg_cr_text\n                  | pkg_ext_ref\n                  | pkg_ext_ref_comment\n                  | primary_package_purpose\n                  | built_date\n                  | release_date\n                  | valid_until_date\n                  | file_name\n                  | file_type\n                  | file_chksum\n                  | file_conc\n                  | file_lics_info\n                  | file_cr_text\n                  | file_lics_comment\n                  | file_attribution_text\n                  | file_notice\n                  | file_comment\n                  | file_contrib\n                  | file_dep\n                  | file_artifact\n                  | snip_spdx_id\n                  | snip_name\n                  | snip_comment\n                  | snippet_attribution_text\n                  | snip_cr_text\n                  | snip_lic_comment\n                  | snip_file_spdx_id\n                  | snip_lics_conc\n                  | snip_lics_info\n                  | snip_byte_range\n                  | snip_line_range\n                  | extr_lic_id\n                  | extr_lic_text\n                  | extr_lic_name\n                  | lic_xref\n                  | lic_comment\n                  | unknown_tag\n        lic_xref : LICS_CRS_REF LINElic_xref : LICS_CRS_REF errorlic_comment : LICS_COMMENT text_or_linelic_comment : LICS_COMMENT errorextr_lic_name : LICS_NAME extr_lic_name_valueextr_lic_name : LICS_NAME errorextr_lic_name_value : LINEextr_lic_name_value : NO_ASSERTextr_lic_text : LICS_TEXT text_or_lineextr_lic_text : LICS_TEXT errorextr_lic_id : LICS_ID LINEextr_lic_id : LICS_ID errorunknown_tag : UNKNOWN_TAG LINEfile_artifact : prj_name_art file_art_rest\n                         | prj_name_art\n        file_artifact : prj_name_art errorfile_art_rest : prj_home_art prj_uri_art\n                         | prj_uri_art prj_home_art\n                         | prj_home_art\n                         | prj_uri_art\n        prj_uri_art : ART_PRJ_URI UN_KNOWNprj_uri_art : ART_PRJ_URI LINEprj_uri_art : ART_PRJ_URI errorprj_home_art : ART_PRJ_HOME LINEprj_home_art : ART_PRJ_HOME UN_KNOWNprj_home_art : ART_PRJ_HOME errorprj_name_art : ART_PRJ_NAME LINEprj_name_art : ART_PRJ_NAME errorfile_dep : FILE_DEP LINEfile_dep : FILE_DEP errorfile_contrib : FILE_CONTRIB LINEfile_contrib : FILE_CONTRIB errorfile_notice : FILE_NOTICE text_or_linefile_notice : FILE_NOTICE errorfile_cr_text : FILE_CR_TEXT file_cr_valuefile_cr_text : FILE_CR_TEXT errorfile_cr_value : text_or_linefile_cr_value : NONEfile_cr_value : NO_ASSERTfile_lics_comment : FILE_LICS_COMMENT text_or_linefile_lics_comment : FILE_LICS_COMMENT errorfile_attribution_text : FILE_ATTRIBUTION_TEXT text_or_linefile_attribution_text : FILE_ATTRIBUTION_TEXT errorfile_lics_info : FILE_LICS_INFO file_lic_info_valuefile_lics_info : FILE_LICS_INFO errorfile_lic_info_value : NONEfile_lic_info_value : NO_ASSERTfile_lic_info_value : LINEconc_license : NO_ASSERTconc_license : NONEconc_license : LINEfile_name : FILE_NAME LINEfile_name : FILE_NAME errorspdx_id : SPDX_ID LINEfile_comment : FILE_COMMENT text_or_linefile_comment : FILE_COMMENT errorfile_type : FILE_TYPE file_type_valuefile_type : FILE_TYPE errorfile_chksum : FILE_CHKSUM CHKSUMfile_chksum : FILE_CHKSUM errorfile_conc : FILE_LICS_CONC conc_licensefile_conc : FILE_LICS_CONC errorfile_type_value : SOURCE\n                           | BINARY\n                           | ARCHIVE\n                           | APPLICATION\n                           | AUDIO\n                           | IMAGE\n                           | FILETYPE_TEXT\n                           | VIDEO\n                           | DOCUMENTATION\n                           | SPDX\n                           | OTHER\n        annotation_type_value : OTHER\n                           | REVIEW\n        pkg_desc : PKG_DESC text_or_linepkg_desc : PKG_DESC errorpkg_comment : PKG_COMMENT text_or_linepkg_comment : PKG_COMMENT errorpkg_attribution_text : PKG_ATTRIBUTION_TEXT text_or_linepkg_attribution_text : PKG_ATTRIBUTION_TEXT errorpkg_summary : PKG_SUM text_or_linepkg_summary : PKG_SUM errorpkg_cr_text : PKG_CPY_TEXT pkg_cr_text_valuepkg_cr_text : PKG_CPY_TEXT errorpkg_ext_ref : PKG_EXT_REF LINEpkg_ext_ref : PKG_EXT_REF errorpkg_ext_ref_comment : PKG_EXT_REF_COMMENT text_or_linepkg_ext_ref_comment : PKG_EXT_REF_COMMENT errorpkg_cr_text_value : text_or_linepkg_cr_text_value : NONEpkg_cr_text_value : NO_ASSERTpkg_lic_comment : PKG_LICS_COMMENT text_or_linepkg_lic_comment : PKG_LICS_COMMENT errorpkg_lic_decl : PKG_LICS_DECL conc_licensepkg_lic_decl : PKG_LICS_DECL errorpkg_lic_ff : PKG_LICS_FFILE pkg_lic_ff_valuepkg_lic_ff_value : NONEpkg_lic_ff_value : NO_ASSERTpkg_lic_ff_value : LINEpkg_lic_ff : PKG_LICS_FFILE errorpkg_lic_conc : PKG_LICS_CONC conc_licensepkg_lic_conc : PKG_LICS_CONC errorpkg_src_info : PKG_SRC_INFO text_or_linepkg_src_info : PKG_SRC_INFO errorpkg_chksum : PKG_CHKSUM CHKSUMpkg_chksum : PKG_CHKSUM errorpkg_verif : PKG_VERF_CODE LINEpkg_verif : PKG_VERF_CODE errorpkg_home : PKG_HOME pkg_home_valuepkg_home : PKG_HOME errorpkg_home_value : LINEpkg_home_value : NONEpkg_home_value : NO_ASSERTpkg_down_location : PKG_DOWN pkg_down_valuepkg_down_location : PKG_DOWN errorpkg_files_analyzed : PKG_FILES_ANALYZED LINEpkg_files_analyzed : PKG_FILES_ANALYZED errorpkg_down_value : LINE pkg_down_value : NONEpkg_down_value : NO_ASSERTpkg_orig : PKG_ORIG pkg_supplier_valuespkg_orig : PKG_ORIG errorpkg_supplier : PKG_SUPPL pkg_supplier_valuespkg_supplier : PKG_SUPPL errorpkg_supplier_values : NO_ASSERTpkg_supplier_values : entitypkg_file_name : PKG_FILE_NAME LINEpkg_file_name : PKG_FILE_NAME errorpackage_version : PKG_VERSION LINEpackage_version : PKG_VERSION errorpackage_name : PKG_NAME LINEpackage_name : PKG_NAME errorprimary_package_purpose : PRIMARY_PACKAGE_PURPOSE primary_package_purpose_valueprimary_package_purpose : PRIMARY_PACKAGE_PURPOSE errorprimary_package_purpose_value : APPLICATION\n                                         | FRAMEWORK\n                                         | LIBRARY\n                                         | CONTAINER\n                                         | OPERATING_SYSTEM\n                                         | DEVICE\n                                         | FIRMWARE\n                                         | SOURCE\n                                         | ARCHIVE\n                                         | FILE\n                                         | INSTALL\n                                         | OTHER\n        built_date : BUILT_DATE DATEbuilt_date : BUILT_DATE errorrelease_date : RELEASE_DATE DATErelease_date : RELEASE_DATE errorvalid_until_date : VALID_UNTIL_DATE DATEvalid_until_date : VALID_UNTIL_DATE errorsnip_spdx_id : SNIPPET_SPDX_ID LINEsnip_spdx_id : SNIPPET_SPDX_ID errorsnip_name : SNIPPET_NAME LINEsnip_name : SNIPPET_NAME errorsnip_comment : SNIPPET_COMMENT text_or_linesnip_comment : SNIPPET_COMMENT errorsnippet_attribution_text : SNIPPET_ATTRIBUTION_TEXT text_or_linesnippet_attribution_text : SNIPPET_ATTRIBUTION_TEXT errorsnip_cr_text : SNIPPET_CR_TEXT snip_cr_valuesnip_cr_text : SNIPPET_CR_TEXT errorsnip_cr_value : text_or_linesnip_cr_value : NONEsnip_cr_value : NO_ASSERTsnip_lic_comment : SNIPPET_LICS_COMMENT text_or_linesnip_lic_comment : SNIPPET_LICS_COMMENT errortext_or_line : TEXTtext_or_line : LINEsnip_file_spdx_id : SNIPPET_FILE_SPDXID LINEsnip_file_spdx_id : SNIPPET_FILE_SPDXID errorsnip_lics_conc : SNIPPET_LICS_CONC conc_licensesnip_lics_conc : SNIPPET_LICS_CONC errorsnip_lics_info : SNIPPET_LICS_INFO snip_lic_info_valuesnip_lics_info : SNIPPET_LICS_INFO errorsnip_byte_range : SNIPPET_BYTE_RANGE LINEsnip_byte_range : SNIPPET_BYTE_RANGE errorsnip_line_range : SNIPPET_LINE_RANGE LINEsnip_line_range : SNIPPET_LINE_RANGE errorsnip_lic_info_value : NONEsnip_lic_info_value : NO_ASSERTsnip_lic_info_value : LINEreviewer : REVIEWER entityreviewer : REVIEWER errorreview_date : REVIEW_DATE DATEreview_date : REVIEW_DATE errorreview_comment : REVIEW_COMMENT text_or_linereview_comment : REVIEW_COMMENT errorannotator : ANNOTATOR entityannotator : ANNOTATOR errorannotation_date : ANNOTATION_DATE DATEannotation_date : ANNOTATION_DATE errorannotation_comment : ANNOTATION_COMMENT text_or_lineannotation_comment : ANNOTATION_COMMENT errorannotation_type : ANNOTATION_TYPE annotation_type_valueannotation_type : ANNOTATION_TYPE errorannotation_spdx_id : ANNOTATION_SPDX_ID LINEannotation_spdx_id : ANNOTATION_SPDX_ID errorrelationship : RELATIONSHIP relationship_valuerelationship : RELATIONSHIP errorrelationship_value : DOC_REF_ID LINErelationship_value : LINErelationship_comment : RELATIONSHIP_COMMENT text_or_linerelationship_comment : RELATIONSHIP_COMMENT errorlocs_list_ver : LIC_LIST_VER LINElocs_list_ver : LIC_LIST_VER errordoc_comment : DOC_COMMENT text_or_linedoc_comment : DOC_COMMENT errordoc_namespace : DOC_NAMESPACE LINEdoc_namespace : DOC_NAMESPACE errordata_lics : DOC_LICENSE LINEdata_lics : DOC_LICENSE errordoc_name : DOC_NAME LINEdoc_name : DOC_NAME errorext_doc_ref : EXT_DOC_REF DOC_REF_ID DOC_URI EXT_DOC_REF_CHKSUMext_doc_ref : EXT_DOC_REF errorspdx_version : DOC_VERSION LINEspdx_version : DOC_VERSION errorcreator_comment : CREATOR_COMMENT text_or_linecreator_comment : CREATOR_COMMENT errorcreator : CREATOR entitycreator : CREATOR errorcreated : CREATED DATEcreated : CREATED errorentity : TOOL_VALUE\n        entity : ORG_VALUE\n        entity : PERSON_VALUE\n        '
+    
+_lr_action_items = {'DOC_VERSION':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[80,80,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SPDX_ID':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[81,81,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'DOC_LICENSE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[82,82,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'DOC_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[83,83,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'EXT_DOC_REF':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[84,84,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'DOC_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[85,85,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'DOC_NAMESPACE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[86,86,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'CREATOR':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[87,87,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'CREATED':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[88,88,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'CREATOR_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[89,89,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'LIC_LIST_VER':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[90,90,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'REVIEWER':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[91,91,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'REVIEW_DATE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[92,92,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'REVIEW_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[93,93,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'ANNOTATOR':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[94,94,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'ANNOTATION_DATE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[95,95,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'ANNOTATION_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[96,96,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'ANNOTATION_TYPE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[97,97,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'ANNOTATION_SPDX_ID':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[98,98,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'RELATIONSHIP':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[99,99,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'RELATIONSHIP_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[100,100,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[101,101,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_VERSION':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[102,102,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_DOWN':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[103,103,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_FILES_ANALYZED':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[104,104,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_HOME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[105,105,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_SUM':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[106,106,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_SRC_INFO':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[107,107,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_FILE_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[108,108,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_SUPPL':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[109,109,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_ORIG':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[110,110,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_CHKSUM':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[111,111,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_VERF_CODE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[112,112,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_DESC':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[113,113,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[114,114,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_ATTRIBUTION_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[115,115,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_LICS_DECL':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[116,116,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_LICS_CONC':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[117,117,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_LICS_FFILE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[118,118,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_LICS_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[119,119,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_CPY_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[120,120,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_EXT_REF':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[121,121,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PKG_EXT_REF_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[122,122,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'PRIMARY_PACKAGE_PURPOSE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[123,123,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'BUILT_DATE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[124,124,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'RELEASE_DATE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[125,125,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'VALID_UNTIL_DATE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[126,126,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[127,127,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_TYPE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[128,128,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_CHKSUM':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[129,129,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_LICS_CONC':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[130,130,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_LICS_INFO':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[131,131,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_CR_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[132,132,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_LICS_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[133,133,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_ATTRIBUTION_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[134,134,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_NOTICE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[135,135,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[136,136,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_CONTRIB':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[137,137,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'FILE_DEP':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[138,138,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SNIPPET_SPDX_ID':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[140,140,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SNIPPET_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[141,141,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SNIPPET_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[142,142,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SNIPPET_ATTRIBUTION_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[143,143,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SNIPPET_CR_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[144,144,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SNIPPET_LICS_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[145,145,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SNIPPET_FILE_SPDXID':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[146,146,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SNIPPET_LICS_CONC':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[147,147,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SNIPPET_LICS_INFO':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[148,148,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SNIPPET_BYTE_RANGE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[149,149,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'SNIPPET_LINE_RANGE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[150,150,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'LICS_ID':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[151,151,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'LICS_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[152,152,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'LICS_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[153,153,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'LICS_CRS_REF':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[154,154,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'LICS_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[155,155,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'UNKNOWN_TAG':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[156,156,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'ART_PRJ_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[157,157,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,139,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,382,383,384,385,386,387,388,389,390,],[0,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-94,-1,-297,-298,-133,-291,-292,-293,-294,-296,-287,-288,-248,-249,-289,-290,-301,-302,-305,-306,-307,-303,-304,-299,-300,-285,-286,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-153,-154,-277,-278,-279,-280,-282,-283,-284,-211,-212,-209,-210,-194,-195,-198,-199,-200,-196,-197,-189,-190,-191,-192,-193,-161,-162,-183,-184,-207,-208,-203,-204,-205,-206,-201,-202,-185,-186,-187,-188,-155,-156,-157,-158,-159,-160,-174,-175,-128,-129,-130,-181,-182,-176,-180,-177,-178,-179,-172,-173,-163,-164,-169,-170,-171,-165,-166,-167,-168,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-226,-227,-228,-229,-230,-231,-232,-131,-132,-136,-137,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-138,-139,-140,-141,-123,-124,-125,-126,-127,-114,-115,-116,-117,-118,-119,-120,-121,-122,-112,-113,-134,-135,-110,-111,-108,-109,-93,-95,-98,-99,-233,-234,-235,-236,-237,-238,-239,-240,-241,-242,-243,-244,-245,-246,-247,-250,-251,-252,-253,-254,-255,-260,-261,-262,-256,-257,-258,-259,-90,-91,-88,-89,-84,-85,-86,-87,-80,-81,-82,-83,-92,-106,-107,-281,-96,-97,-103,-104,-105,-100,-101,-102,-295,]),'LINE':([80,81,82,83,85,86,89,90,93,96,98,99,100,101,102,103,104,105,106,107,108,112,113,114,115,116,117,118,119,120,121,122,127,130,131,132,133,134,135,136,137,138,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,205,335,336,],[159,161,162,164,171,172,171,183,171,171,201,206,171,209,211,215,218,222,171,171,229,239,171,171,171,251,251,258,171,171,266,171,290,251,313,171,171,171,171,171,327,329,337,339,171,171,171,171,352,251,360,361,363,365,171,371,373,171,377,378,381,384,388,]),'error':([80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,335,336,378,379,],[160,163,165,167,169,173,175,180,182,184,186,188,190,192,194,196,198,202,204,208,210,212,214,219,221,226,228,230,232,236,238,240,242,244,246,248,253,255,260,262,267,269,271,285,287,289,291,293,306,308,310,315,320,322,324,326,328,330,332,338,340,342,344,346,351,353,355,357,362,364,366,368,370,374,376,379,386,389,-106,-107,]),'DOC_REF_ID':([84,99,],[166,205,]),'TEXT':([85,89,93,96,100,106,107,113,114,115,119,120,122,132,133,134,135,136,142,143,144,145,152,155,],[170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,]),'TOOL_VALUE':([87,91,94,109,110,],[176,176,176,176,176,]),'ORG_VALUE':([87,91,94,109,110,],[177,177,177,177,177,]),'PERSON_VALUE':([87,91,94,109,110,],[178,178,178,178,178,]),'DATE':([88,92,95,124,125,126,],[179,187,193,284,286,288,]),'OTHER':([97,123,128,],[199,283,304,]),'REVIEW':([97,],[200,]),'NONE':([103,105,116,117,118,120,130,131,132,144,147,148,],[216,223,250,250,256,264,250,311,317,348,250,358,]),'NO_ASSERT':([103,105,109,110,116,117,118,120,130,131,132,144,147,148,153,],[217,224,233,233,249,249,257,265,249,312,318,349,249,359,372,]),'CHKSUM':([111,129,],[237,305,]),'APPLICATION':([123,128,],[272,297,]),'FRAMEWORK':([123,],[273,]),'LIBRARY':([123,],[274,]),'CONTAINER':([123,],[275,]),'OPERATING_SYSTEM':([123,],[276,]),'DEVICE':([123,],[277,]),'FIRMWARE':([123,],[278,]),'SOURCE':([123,128,],[279,294,]),'ARCHIVE':([123,128,],[280,296,]),'FILE':([123,],[281,]),'INSTALL':([123,],[282,]),'BINARY':([128,],[295,]),'AUDIO':([128,],[298,]),'IMAGE':([128,],[299,]),'FILETYPE_TEXT':([128,],[300,]),'VIDEO':([128,],[301,]),'DOCUMENTATION':([128,],[302,]),'SPDX':([128,],[303,]),'ART_PRJ_HOME':([139,334,378,379,387,388,389,],[335,335,-106,-107,-100,-101,-102,]),'ART_PRJ_URI':([139,333,378,379,384,385,386,],[336,336,-106,-107,-103,-104,-105,]),'DOC_URI':([166,],[380,]),'UN_KNOWN':([335,336,],[385,387,]),'EXT_DOC_REF_CHKSUM':([380,],[390,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'attrib':([0,1,],[2,158,]),'spdx_version':([0,1,],[3,3,]),'spdx_id':([0,1,],[4,4,]),'data_lics':([0,1,],[5,5,]),'doc_name':([0,1,],[6,6,]),'ext_doc_ref':([0,1,],[7,7,]),'doc_comment':([0,1,],[8,8,]),'doc_namespace':([0,1,],[9,9,]),'creator':([0,1,],[10,10,]),'created':([0,1,],[11,11,]),'creator_comment':([0,1,],[12,12,]),'locs_list_ver':([0,1,],[13,13,]),'reviewer':([0,1,],[14,14,]),'review_date':([0,1,],[15,15,]),'review_comment':([0,1,],[16,16,]),'annotator':([0,1,],[17,17,]),'annotation_date':([0,1,],[18,18,]),'annotation_comment':([0,1,],[19,19,]),'annotation_type':([0,1,],[20,20,]),'annotation_spdx_id':([0,1,],[21,21,]),'relationship':([0,1,],[22,22,]),'relationship_comment':([0,1,],[23,23,]),'package_name':([0,1,],[24,24,]),'package_version':([0,1,],[25,25,]),'pkg_down_location':([0,1,],[26,26,]),'pkg_files_analyzed':([0,1,],[27,27,]),'pkg_home':([0,1,],[28,28,]),'pkg_summary':([0,1,],[29,29,]),'pkg_src_info':([0,1,],[30,30,]),'pkg_file_name':([0,1,],[31,31,]),'pkg_supplier':([0,1,],[32,32,]),'pkg_orig':([0,1,],[33,33,]),'pkg_chksum':([0,1,],[34,34,]),'pkg_verif':([0,1,],[35,35,]),'pkg_desc':([0,1,],[36,36,]),'pkg_comment':([0,1,],[37,37,]),'pkg_attribution_text':([0,1,],[38,38,]),'pkg_lic_decl':([0,1,],[39,39,]),'pkg_lic_conc':([0,1,],[40,40,]),'pkg_lic_ff':([0,1,],[41,41,]),'pkg_lic_comment':([0,1,],[42,42,]),'pkg_cr_text':([0,1,],[43,43,]),'pkg_ext_ref':([0,1,],[44,44,]),'pkg_ext_ref_comment':([0,1,],[45,45,]),'primary_package_purpose':([0,1,],[46,46,]),'built_date':([0,1,],[47,47,]),'release_date':([0,1,],[48,48,]),'valid_until_date':([0,1,],[49,49,]),'file_name':([0,1,],[50,50,]),'file_type':([0,1,],[51,51,]),'file_chksum':([0,1,],[52,52,]),'file_conc':([0,1,],[53,53,]),'file_lics_info':([0,1,],[54,54,]),'file_cr_text':([0,1,],[55,55,]),'file_lics_comment':([0,1,],[56,56,]),'file_attribution_text':([0,1,],[57,57,]),'file_notice':([0,1,],[58,58,]),'file_comment':([0,1,],[59,59,]),'file_contrib':([0,1,],[60,60,]),'file_dep':([0,1,],[61,61,]),'file_artifact':([0,1,],[62,62,]),'snip_spdx_id':([0,1,],[63,63,]),'snip_name':([0,1,],[64,64,]),'snip_comment':([0,1,],[65,65,]),'snippet_attribution_text':([0,1,],[66,66,]),'snip_cr_text':([0,1,],[67,67,]),'snip_lic_comment':([0,1,],[68,68,]),'snip_file_spdx_id':([0,1,],[69,69,]),'snip_lics_conc':([0,1,],[70,70,]),'snip_lics_info':([0,1,],[71,71,]),'snip_byte_range':([0,1,],[72,72,]),'snip_line_range':([0,1,],[73,73,]),'extr_lic_id':([0,1,],[74,74,]),'extr_lic_text':([0,1,],[75,75,]),'extr_lic_name':([0,1,],[76,76,]),'lic_xref':([0,1,],[77,77,]),'lic_comment':([0,1,],[78,78,]),'unknown_tag':([0,1,],[79,79,]),'prj_name_art':([0,1,],[139,139,]),'text_or_line':([85,89,93,96,100,106,107,113,114,115,119,120,122,132,133,134,135,136,142,143,144,145,152,155,],[168,181,189,195,207,225,227,241,243,245,259,263,268,316,319,321,323,325,341,343,347,350,367,375,]),'entity':([87,91,94,109,110,],[174,185,191,234,234,]),'annotation_type_value':([97,],[197,]),'relationship_value':([99,],[203,]),'pkg_down_value':([103,],[213,]),'pkg_home_value':([105,],[220,]),'pkg_supplier_values':([109,110,],[231,235,]),'conc_license':([116,117,130,147,],[247,252,307,354,]),'pkg_lic_ff_value':([118,],[254,]),'pkg_cr_text_value':([120,],[261,]),'primary_package_purpose_value':([123,],[270,]),'file_type_value':([128,],[292,]),'file_lic_info_value':([131,],[309,]),'file_cr_value':([132,],[314,]),'file_art_rest':([139,],[331,]),'prj_home_art':([139,334,],[333,383,]),'prj_uri_art':([139,333,],[334,382,]),'snip_cr_value':([144,],[345,]),'snip_lic_info_value':([148,],[356,]),'extr_lic_name_value':([153,],[369,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> start attrib','start',2,'p_start_1','tagvalue.py',157),
+  ('start -> attrib','start',1,'p_start_2','tagvalue.py',161),
+  ('attrib -> spdx_version','attrib',1,'p_attrib','tagvalue.py',165),
+  ('attrib -> spdx_id','attrib',1,'p_attrib','tagvalue.py',166),
+  ('attrib -> data_lics','attrib',1,'p_attrib','tagvalue.py',167),
+  ('attrib -> doc_name','attrib',1,'p_attrib','tagvalue.py',168),
+  ('attrib -> ext_doc_ref','attrib',1,'p_attrib','tagvalue.py',169),
+  ('attrib -> doc_comment','attrib',1,'p_attrib','tagvalue.py',170),
+  ('attrib -> doc_namespace','attrib',1,'p_attrib','tagvalue.py',171),
+  ('attrib -> creator','attrib',1,'p_attrib','tagvalue.py',172),
+  ('attrib -> created','attrib',1,'p_attrib','tagvalue.py',173),
+  ('attrib -> creator_comment','attrib',1,'p_attrib','tagvalue.py',174),
+  ('attrib -> locs_list_ver','attrib',1,'p_attrib','tagvalue.py',175),
+  ('attrib -> reviewer','attrib',1,'p_attrib','tagvalue.py',176),
+  ('attrib -> review_date','attrib',1,'p_attrib','tagvalue.py',177),
+  ('attrib -> review_comment','attrib',1,'p_attrib','tagvalue.py',178),
+  ('attrib -> annotator','attrib',1,'p_attrib','tagvalue.py',179),
+  ('attrib -> annotation_date','attrib',1,'p_attrib','tagvalue.py',180),
+  ('attrib -> annotation_comment','attrib',1,'p_attrib','tagvalue.py',181),
+  ('attrib -> annotation_type','attrib',1,'p_attrib','tagvalue.py',182),
+  ('attrib -> annotation_spdx_id','attrib',1,'p_attrib','tagvalue.py',183),
+  ('attrib -> relationship','attrib',1,'p_attrib','tagvalue.py',184),
+  ('attrib -> relationship_comment','attrib',1,'p_attrib','tagvalue.py',185),
+  ('attrib -> package_name','attrib',1,'p_attrib','tagvalue.py',186),
+  ('attrib -> package_version','attrib',1,'p_attrib','tagvalue.py',187),
+  ('attrib -> pkg_down_location','attrib',1,'p_attrib','tagvalue.py',188),
+  ('attrib -> pkg_files_analyzed','attrib',1,'p_attrib','tagvalue.py',189),
+  ('attrib -> pkg_home','attrib',1,'p_attrib','tagvalue.py',190),
+  ('attrib -> pkg_summary','attrib',1,'p_attrib','tagvalue.py',191),
+  ('attrib -> pkg_src_info','attrib',1,'p_attrib','tagvalue.py',192),
+  ('attrib -> pkg_file_name','attrib',1,'p_attrib','tagvalue.py',193),
+  ('attrib -> pkg_supplier','attrib',1,'p_attrib','tagvalue.py',194),
+  ('attrib -> pkg_orig','attrib',1,'p_attrib','tagvalue.py',195),
+  ('attrib -> pkg_chksum','attrib',1,'p_attrib','tagvalue.py',196),
+  ('attrib -> pkg_verif','attrib',1,'p_attrib','tagvalue.py',197),
+  ('attrib -> pkg_desc','attrib',1,'p_attrib','tagvalue.py',198),
+  ('attrib -> pkg_comment','attrib',1,'p_attrib','tagvalue.py',199),
+  ('attrib -> pkg_attribution_text','attrib',1,'p_attrib','tagvalue.py',200),
+  ('attrib -> pkg_lic_decl','attrib',1,'p_attrib','tagvalue.py',201),
+  ('attrib -> pkg_lic_conc','attrib',1,'p_attrib','tagvalue.py',202),
+  ('attrib -> pkg_lic_ff','attrib',1,'p_attrib','tagvalue.py',203),
+  ('attrib -> pkg_lic_comment','attrib',1,'p_attrib','tagvalue.py',204),
+  ('attrib -> pkg_cr_text','attrib',1,'p_attrib','tagvalue.py',205),
+  ('attrib -> pkg_ext_ref','attrib',1,'p_attrib','tagvalue.py',206),
+  ('attrib -> pkg_ext_ref_comment','attrib',1,'p_attrib','tagvalue.py',207),
+  ('attrib -> primary_package_purpose','attrib',1,'p_attrib','tagvalue.py',208),
+  ('attrib -> built_date','attrib',1,'p_attrib','tagvalue.py',209),
+  ('attrib -> release_date','attrib',1,'p_attrib','tagvalue.py',210),
+  ('attrib -> valid_until_date','attrib',1,'p_attrib','tagvalue.py',211),
+  ('attrib -> file_name','attrib',1,'p_attrib','tagvalue.py',212),
+  ('attrib -> file_type','attrib',1,'p_attrib','tagvalue.py',213),
+  ('attrib -> file_chksum','attrib',1,'p_attrib','tagvalue.py',214),
+  ('attrib -> file_conc','attrib',1,'p_attrib','tagvalue.py',215),
+  ('attrib -> file_lics_info','attrib',1,'p_attrib','tagvalue.py',216),
+  ('attrib -> file_cr_text','attrib',1,'p_attrib','tagvalue.py',217),
+  ('attrib -> file_lics_comment','attrib',1,'p_attrib','tagvalue.py',218),
+  ('attrib -> file_attribution_text','attrib',1,'p_attrib','tagvalue.py',219),
+  ('attrib -> file_notice','attrib',1,'p_attrib','tagvalue.py',220),
+  ('attrib -> file_comment','attrib',1,'p_attrib','tagvalue.py',221),
+  ('attrib -> file_contrib','attrib',1,'p_attrib','tagvalue.py',222),
+  ('attrib -> file_dep','attrib',1,'p_attrib','tagvalue.py',223),
+  ('attrib -> file_artifact','attrib',1,'p_attrib','tagvalue.py',224),
+  ('attrib -> snip_spdx_id','attrib',1,'p_attrib','tagvalue.py',225),
+  ('attrib -> snip_name','attrib',1,'p_attrib','tagvalue.py',226),
+  ('attrib -> snip_comment','attrib',1,'p_attrib','tagvalue.py',227),
+  ('attrib -> snippet_attribution_text','attrib',1,'p_attrib','tagvalue.py',228),
+  ('attrib -> snip_cr_text','attrib',1,'p_attrib','tagvalue.py',229),
+  ('attrib -> snip_lic_comment','attrib',1,'p_attrib','tagvalue.py',230),
+  ('attrib -> snip_file_spdx_id','attrib',1,'p_attrib','tagvalue.py',231),
+  ('attrib -> snip_lics_conc','attrib',1,'p_attrib','tagvalue.py',232),
+  ('attrib -> snip_lics_info','attrib',1,'p_attrib','tagvalue.py',233),
+  ('attrib -> snip_byte_range','attrib',1,'p_attrib','tagvalue.py',234),
+  ('attrib -> snip_line_range','attrib',1,'p_attrib','tagvalue.py',235),
+  ('attrib -> extr_lic_id','attrib',1,'p_attrib','tagvalue.py',236),
+  ('attrib -> extr_lic_text','attrib',1,'p_attrib','tagvalue.py',237),
+  ('attrib -> extr_lic_name','attrib',1,'p_attrib','tagvalue.py',238),
+  ('attrib -> lic_xref','attrib',1,'p_attrib','tagvalue.py',239),
+  ('attrib -> lic_comment','attrib',1,'p_attrib','tagvalue.py',240),
+  ('attrib -> unknown_tag','attrib',1,'p_attrib','tagvalue.py',241),
+  ('lic_xref -> LICS_CRS_REF LINE','lic_xref',2,'p_lic_xref_1','tagvalue.py',259),
+  ('lic_xref -> LICS_CRS_REF error','lic_xref',2,'p_lic_xref_2','tagvalue.py',267),
+  ('lic_comment -> LICS_COMMENT text_or_line','lic_comment',2,'p_lic_comment_1','tagvalue.py',273),
+  ('lic_comment -> LICS_COMMENT error','lic_comment',2,'p_lic_comment_2','tagvalue.py',283),
+  ('extr_lic_name -> LICS_NAME extr_lic_name_value','extr_lic_name',2,'p_extr_lic_name_1','tagvalue.py',289),
+  ('extr_lic_name -> LICS_NAME error','extr_lic_name',2,'p_extr_lic_name_2','tagvalue.py',298),
+  ('extr_lic_name_value -> LINE','extr_lic_name_value',1,'p_extr_lic_name_value_1','tagvalue.py',304),
+  ('extr_lic_name_value -> NO_ASSERT','extr_lic_name_value',1,'p_extr_lic_name_value_2','tagvalue.py',308),
+  ('extr_lic_text -> LICS_TEXT text_or_line','extr_lic_text',2,'p_extr_lic_text_1','tagvalue.py',312),
+  ('extr_lic_text -> LICS_TEXT error','extr_lic_text',2,'p_extr_lic_text_2','tagvalue.py',322),
+  ('extr_lic_id -> LICS_ID LINE','extr_lic_id',2,'p_extr_lic_id_1','tagvalue.py',328),
+  ('extr_lic_id -> LICS_ID error','extr_lic_id',2,'p_extr_lic_id_2','tagvalue.py',338),
+  ('unknown_tag -> UNKNOWN_TAG LINE','unknown_tag',2,'p_unknown_tag','tagvalue.py',344),
+  ('file_artifact -> prj_name_art file_art_rest','file_artifact',2,'p_file_artifact_1','tagvalue.py',350),
+  ('file_artifact -> prj_name_art','file_artifact',1,'p_file_artifact_1','tagvalue.py',351),
+  ('file_artifact -> prj_name_art error','file_artifact',2,'p_file_artifact_2','tagvalue.py',356),
+  ('file_art_rest -> prj_home_art prj_uri_art','file_art_rest',2,'p_file_art_rest','tagvalue.py',362),
+  ('file_art_rest -> prj_uri_art prj_home_art','file_art_rest',2,'p_file_art_rest','tagvalue.py',363),
+  ('file_art_rest -> prj_home_art','file_art_rest',1,'p_file_art_rest','tagvalue.py',364),
+  ('file_art_rest -> prj_uri_art','file_art_rest',1,'p_file_art_rest','tagvalue.py',365),
+  ('prj_uri_art -> ART_PRJ_URI UN_KNOWN','prj_uri_art',2,'p_prj_uri_art_1','tagvalue.py',370),
+  ('prj_uri_art -> ART_PRJ_URI LINE','prj_uri_art',2,'p_prj_uri_art_2','tagvalue.py',379),
+  ('prj_uri_art -> ART_PRJ_URI error','prj_uri_art',2,'p_prj_uri_art_3','tagvalue.py',387),
+  ('prj_home_art -> ART_PRJ_HOME LINE','prj_home_art',2,'p_prj_home_art_1','tagvalue.py',393),
+  ('prj_home_art -> ART_PRJ_HOME UN_KNOWN','prj_home_art',2,'p_prj_home_art_2','tagvalue.py',400),
+  ('prj_home_art -> ART_PRJ_HOME error','prj_home_art',2,'p_prj_home_art_3','tagvalue.py',409),
+  ('prj_name_art -> ART_PRJ_NAME LINE','prj_name_art',2,'p_prj_name_art_1','tagvalue.py',415),
+  ('prj_name_art -> ART_PRJ_NAME error','prj_name_art',2,'p_prj_name_art_2','tagvalue.py',423),
+  ('file_dep -> FILE_DEP LINE','file_dep',2,'p_file_dep_1','tagvalue.py',429),
+  ('file_dep -> FILE_DEP error','file_dep',2,'p_file_dep_2','tagvalue.py',437),
+  ('file_contrib -> FILE_CONTRIB LINE','file_contrib',2,'p_file_contrib_1','tagvalue.py',443),
+  ('file_contrib -> FILE_CONTRIB error','file_contrib',2,'p_file_contrib_2','tagvalue.py',451),
+  ('file_notice -> FILE_NOTICE text_or_line','file_notice',2,'p_file_notice_1','tagvalue.py',457),
+  ('file_notice -> FILE_NOTICE error','file_notice',2,'p_file_notice_2','tagvalue.py',467),
+  ('file_cr_text -> FILE_CR_TEXT file_cr_value','file_cr_text',2,'p_file_cr_text_1','tagvalue.py',473),
+  ('file_cr_text -> FILE_CR_TEXT error','file_cr_text',2,'p_file_cr_text_2','tagvalue.py',482),
+  ('file_cr_value -> text_or_line','file_cr_value',1,'p_file_cr_value_1','tagvalue.py',488),
+  ('file_cr_value -> NONE','file_cr_value',1,'p_file_cr_value_2','tagvalue.py',492),
+  ('file_cr_value -> NO_ASSERT','file_cr_value',1,'p_file_cr_value_3','tagvalue.py',496),
+  ('file_lics_comment -> FILE_LICS_COMMENT text_or_line','file_lics_comment',2,'p_file_lics_comment_1','tagvalue.py',500),
+  ('file_lics_comment -> FILE_LICS_COMMENT error','file_lics_comment',2,'p_file_lics_comment_2','tagvalue.py',510),
+  ('file_attribution_text -> FILE_ATTRIBUTION_TEXT text_or_line','file_attribution_text',2,'p_file_attribution_text_1','tagvalue.py',516),
+  ('file_attribution_text -> FILE_ATTRIBUTION_TEXT error','file_attribution_text',2,'p_file_attribution_text_2','tagvalue.py',526),
+  ('file_lics_info -> FILE_LICS_INFO file_lic_info_value','file_lics_info',2,'p_file_lics_info_1','tagvalue.py',532),
+  ('file_lics_info -> FILE_LICS_INFO error','file_lics_info',2,'p_file_lics_info_2','tagvalue.py',543),
+  ('file_lic_info_value -> NONE','file_lic_info_value',1,'p_file_lic_info_value_1','tagvalue.py',549),
+  ('file_lic_info_value -> NO_ASSERT','file_lic_info_value',1,'p_file_lic_info_value_2','tagvalue.py',553),
+  ('file_lic_info_value -> LINE','file_lic_info_value',1,'p_file_lic_info_value_3','tagvalue.py',558),
+  ('conc_license -> NO_ASSERT','conc_license',1,'p_conc_license_1','tagvalue.py',563),
+  ('conc_license -> NONE','conc_license',1,'p_conc_license_2','tagvalue.py',567),
+  ('conc_license -> LINE','conc_license',1,'p_conc_license_3','tagvalue.py',571),
+  ('file_name -> FILE_NAME LINE','file_name',2,'p_file_name_1','tagvalue.py',580),
+  ('file_name -> FILE_NAME error','file_name',2,'p_file_name_2','tagvalue.py',591),
+  ('spdx_id -> SPDX_ID LINE','spdx_id',2,'p_spdx_id','tagvalue.py',597),
+  ('file_comment -> FILE_COMMENT text_or_line','file_comment',2,'p_file_comment_1','tagvalue.py',625),
+  ('file_comment -> FILE_COMMENT error','file_comment',2,'p_file_comment_2','tagvalue.py',635),
+  ('file_type -> FILE_TYPE file_type_value','file_type',2,'p_file_type_1','tagvalue.py',641),
+  ('file_type -> FILE_TYPE error','file_type',2,'p_file_type_2','tagvalue.py',650),
+  ('file_chksum -> FILE_CHKSUM CHKSUM','file_chksum',2,'p_file_chksum_1','tagvalue.py',656),
+  ('file_chksum -> FILE_CHKSUM error','file_chksum',2,'p_file_chksum_2','tagvalue.py',666),
+  ('file_conc -> FILE_LICS_CONC conc_license','file_conc',2,'p_file_conc_1','tagvalue.py',672),
+  ('file_conc -> FILE_LICS_CONC error','file_conc',2,'p_file_conc_2','tagvalue.py',685),
+  ('file_type_value -> SOURCE','file_type_value',1,'p_file_type_value','tagvalue.py',691),
+  ('file_type_value -> BINARY','file_type_value',1,'p_file_type_value','tagvalue.py',692),
+  ('file_type_value -> ARCHIVE','file_type_value',1,'p_file_type_value','tagvalue.py',693),
+  ('file_type_value -> APPLICATION','file_type_value',1,'p_file_type_value','tagvalue.py',694),
+  ('file_type_value -> AUDIO','file_type_value',1,'p_file_type_value','tagvalue.py',695),
+  ('file_type_value -> IMAGE','file_type_value',1,'p_file_type_value','tagvalue.py',696),
+  ('file_type_value -> FILETYPE_TEXT','file_type_value',1,'p_file_type_value','tagvalue.py',697),
+  ('file_type_value -> VIDEO','file_type_value',1,'p_file_type_value','tagvalue.py',698),
+  ('file_type_value -> DOCUMENTATION','file_type_value',1,'p_file_type_value','tagvalue.py',699),
+  ('file_type_value -> SPDX','file_type_value',1,'p_file_type_value','tagvalue.py',700),
+  ('file_type_value -> OTHER','file_type_value',1,'p_file_type_value','tagvalue.py',701),
+  ('annotation_type_value -> OTHER','annotation_type_value',1,'p_annotation_type_value','tagvalue.py',706),
+  ('annotation_type_value -> REVIEW','annotation_type_value',1,'p_annotation_type_value','tagvalue.py',707),
+  ('pkg_desc -> PKG_DESC text_or_line','pkg_desc',2,'p_pkg_desc_1','tagvalue.py',712),
+  ('pkg_desc -> PKG_DESC error','pkg_desc',2,'p_pkg_desc_2','tagvalue.py',722),
+  ('pkg_comment -> PKG_COMMENT text_or_line','pkg_comment',2,'p_pkg_comment_1','tagvalue.py',728),
+  ('pkg_comment -> PKG_COMMENT error','pkg_comment',2,'p_pkg_comment_2','tagvalue.py',738),
+  ('pkg_attribution_text -> PKG_ATTRIBUTION_TEXT text_or_line','pkg_attribution_text',2,'p_pkg_attribution_text_1','tagvalue.py',744),
+  ('pkg_attribution_text -> PKG_ATTRIBUTION_TEXT error','pkg_attribution_text',2,'p_pkg_attribution_text_2','tagvalue.py',756),
+  ('pkg_summary -> PKG_SUM text_or_line','pkg_summary',2,'p_pkg_summary_1','tagvalue.py',762),
+  ('pkg_summary -> PKG_SUM error','pkg_summary',2,'p_pkg_summary_2','tagvalue.py',772),
+  ('pkg_cr_text -> PKG_CPY_TEXT pkg_cr_text_value','pkg_cr_text',2,'p_pkg_cr_text_1','tagvalue.py',778),
+  ('pkg_cr_text -> PKG_CPY_TEXT error','pkg_cr_text',2,'p_pkg_cr_text_2','tagvalue.py',787),
+  ('pkg_ext_ref -> PKG_EXT_REF LINE','pkg_ext_ref',2,'p_pkg_ext_refs_1','tagvalue.py',793),
+  ('pkg_ext_ref -> PKG_EXT_REF error','pkg_ext_ref',2,'p_pkg_ext_refs_2','tagvalue.py',808),
+  ('pkg_ext_ref_comment -> PKG_EXT_REF_COMMENT text_or_line','pkg_ext_ref_comment',2,'p_pkg_ext_ref_comment_1','tagvalue.py',814),
+  ('pkg_ext_ref_comment -> PKG_EXT_REF_COMMENT error','pkg_ext_ref_comment',2,'p_pkg_ext_ref_comment_2','tagvalue.py',822),
+  ('pkg_cr_text_value -> text_or_line','pkg_cr_text_value',1,'p_pkg_cr_text_value_1','tagvalue.py',828),
+  ('pkg_cr_text_value -> NONE','pkg_cr_text_value',1,'p_pkg_cr_text_value_2','tagvalue.py',832),
+  ('pkg_cr_text_value -> NO_ASSERT','pkg_cr_text_value',1,'p_pkg_cr_text_value_3','tagvalue.py',836),
+  ('pkg_lic_comment -> PKG_LICS_COMMENT text_or_line','pkg_lic_comment',2,'p_pkg_lic_comment_1','tagvalue.py',840),
+  ('pkg_lic_comment -> PKG_LICS_COMMENT error','pkg_lic_comment',2,'p_pkg_lic_comment_2','tagvalue.py',850),
+  ('pkg_lic_decl -> PKG_LICS_DECL conc_license','pkg_lic_decl',2,'p_pkg_lic_decl_1','tagvalue.py',856),
+  ('pkg_lic_decl -> PKG_LICS_DECL error','pkg_lic_decl',2,'p_pkg_lic_decl_2','tagvalue.py',869),
+  ('pkg_lic_ff -> PKG_LICS_FFILE pkg_lic_ff_value','pkg_lic_ff',2,'p_pkg_lic_ff_1','tagvalue.py',875),
+  ('pkg_lic_ff_value -> NONE','pkg_lic_ff_value',1,'p_pkg_lic_ff_value_1','tagvalue.py',886),
+  ('pkg_lic_ff_value -> NO_ASSERT','pkg_lic_ff_value',1,'p_pkg_lic_ff_value_2','tagvalue.py',890),
+  ('pkg_lic_ff_value -> LINE','pkg_lic_ff_value',1,'p_pkg_lic_ff_value_3','tagvalue.py',894),
+  ('pkg_lic_ff -> PKG_LICS_FFILE error','pkg_lic_ff',2,'p_pkg_lic_ff_2','tagvalue.py',899),
+  ('pkg_lic_conc -> PKG_LICS_CONC conc_license','pkg_lic_conc',2,'p_pkg_lic_conc_1','tagvalue.py',905),
+  ('pkg_lic_conc -> PKG_LICS_CONC error','pkg_lic_conc',2,'p_pkg_lic_conc_2','tagvalue.py',918),
+  ('pkg_src_info -> PKG_SRC_INFO text_or_line','pkg_src_info',2,'p_pkg_src_info_1','tagvalue.py',924),
+  ('pkg_src_info -> PKG_SRC_INFO error','pkg_src_info',2,'p_pkg_src_info_2','tagvalue.py',934),
+  ('pkg_chksum -> PKG_CHKSUM CHKSUM','pkg_chksum',2,'p_pkg_chksum_1','tagvalue.py',940),
+  ('pkg_chksum -> PKG_CHKSUM error','pkg_chksum',2,'p_pkg_chksum_2','tagvalue.py',950),
+  ('pkg_verif -> PKG_VERF_CODE LINE','pkg_verif',2,'p_pkg_verif_1','tagvalue.py',956),
+  ('pkg_verif -> PKG_VERF_CODE error','pkg_verif',2,'p_pkg_verif_2','tagvalue.py',970),
+  ('pkg_home -> PKG_HOME pkg_home_value','pkg_home',2,'p_pkg_home_1','tagvalue.py',976),
+  ('pkg_home -> PKG_HOME error','pkg_home',2,'p_pkg_home_2','tagvalue.py',985),
+  ('pkg_home_value -> LINE','pkg_home_value',1,'p_pkg_home_value_1','tagvalue.py',991),
+  ('pkg_home_value -> NONE','pkg_home_value',1,'p_pkg_home_value_2','tagvalue.py',995),
+  ('pkg_home_value -> NO_ASSERT','pkg_home_value',1,'p_pkg_home_value_3','tagvalue.py',999),
+  ('pkg_down_location -> PKG_DOWN pkg_down_value','pkg_down_location',2,'p_pkg_down_location_1','tagvalue.py',1003),
+  ('pkg_down_location -> PKG_DOWN error','pkg_down_location',2,'p_pkg_down_location_2','tagvalue.py',1012),
+  ('pkg_files_analyzed -> PKG_FILES_ANALYZED LINE','pkg_files_analyzed',2,'p_pkg_files_analyzed_1','tagvalue.py',1018),
+  ('pkg_files_analyzed -> PKG_FILES_ANALYZED error','pkg_files_analyzed',2,'p_pkg_files_analyzed_2','tagvalue.py',1030),
+  ('pkg_down_value -> LINE','pkg_down_value',1,'p_pkg_down_value_1','tagvalue.py',1036),
+  ('pkg_down_value -> NONE','pkg_down_value',1,'p_pkg_down_value_2','tagvalue.py',1040),
+  ('pkg_down_value -> NO_ASSERT','pkg_down_value',1,'p_pkg_down_value_3','tagvalue.py',1044),
+  ('pkg_orig -> PKG_ORIG pkg_supplier_values','pkg_orig',2,'p_pkg_orig_1','tagvalue.py',1048),
+  ('pkg_orig -> PKG_ORIG error','pkg_orig',2,'p_pkg_orig_2','tagvalue.py',1061),
+  ('pkg_supplier -> PKG_SUPPL pkg_supplier_values','pkg_supplier',2,'p_pkg_supplier_1','tagvalue.py',1067),
+  ('pkg_supplier -> PKG_SUPPL error','pkg_supplier',2,'p_pkg_supplier_2','tagvalue.py',1080),
+  ('pkg_supplier_values -> NO_ASSERT','pkg_supplier_values',1,'p_pkg_supplier_values_1','tagvalue.py',1086),
+  ('pkg_supplier_values -> entity','pkg_supplier_values',1,'p_pkg_supplier_values_2','tagvalue.py',1090),
+  ('pkg_file_name -> PKG_FILE_NAME LINE','pkg_file_name',2,'p_pkg_file_name','tagvalue.py',1094),
+  ('pkg_file_name -> PKG_FILE_NAME error','pkg_file_name',2,'p_pkg_file_name_1','tagvalue.py',1104),
+  ('package_version -> PKG_VERSION LINE','package_version',2,'p_package_version_1','tagvalue.py',1110),
+  ('package_version -> PKG_VERSION error','package_version',2,'p_package_version_2','tagvalue.py',1120),
+  ('package_name -> PKG_NAME LINE','package_name',2,'p_package_name','tagvalue.py',1126),
+  ('package_name -> PKG_NAME error','package_name',2,'p_package_name_1','tagvalue.py',1138),
+  ('primary_package_purpose -> PRIMARY_PACKAGE_PURPOSE primary_package_purpose_value','primary_package_purpose',2,'p_primary_package_purpose_1','tagvalue.py',1144),
+  ('primary_package_purpose -> PRIMARY_PACKAGE_PURPOSE error','primary_package_purpose',2,'p_primary_package_purpose_2','tagvalue.py',1151),
+  ('primary_package_purpose_value -> APPLICATION','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1157),
+  ('primary_package_purpose_value -> FRAMEWORK','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1158),
+  ('primary_package_purpose_value -> LIBRARY','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1159),
+  ('primary_package_purpose_value -> CONTAINER','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1160),
+  ('primary_package_purpose_value -> OPERATING_SYSTEM','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1161),
+  ('primary_package_purpose_value -> DEVICE','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1162),
+  ('primary_package_purpose_value -> FIRMWARE','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1163),
+  ('primary_package_purpose_value -> SOURCE','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1164),
+  ('primary_package_purpose_value -> ARCHIVE','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1165),
+  ('primary_package_purpose_value -> FILE','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1166),
+  ('primary_package_purpose_value -> INSTALL','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1167),
+  ('primary_package_purpose_value -> OTHER','primary_package_purpose_value',1,'p_primary_package_purpose_value','tagvalue.py',1168),
+  ('built_date -> BUILT_DATE DATE','built_date',2,'p_built_date_1','tagvalue.py',1173),
+  ('built_date -> BUILT_DATE error','built_date',2,'p_built_date_2','tagvalue.py',1181),
+  ('release_date -> RELEASE_DATE DATE','release_date',2,'p_release_date_1','tagvalue.py',1187),
+  ('release_date -> RELEASE_DATE error','release_date',2,'p_release_date_2','tagvalue.py',1195),
+  ('valid_until_date -> VALID_UNTIL_DATE DATE','valid_until_date',2,'p_valid_until_date_1','tagvalue.py',1201),
+  ('valid_until_date -> VALID_UNTIL_DATE error','valid_until_date',2,'p_valid_until_date_2','tagvalue.py',1209),
+  ('snip_spdx_id -> SNIPPET_SPDX_ID LINE','snip_spdx_id',2,'p_snip_spdx_id','tagvalue.py',1215),
+  ('snip_spdx_id -> SNIPPET_SPDX_ID error','snip_spdx_id',2,'p_snip_spdx_id_1','tagvalue.py',1225),
+  ('snip_name -> SNIPPET_NAME LINE','snip_name',2,'p_snippet_name','tagvalue.py',1231),
+  ('snip_name -> SNIPPET_NAME error','snip_name',2,'p_snippet_name_1','tagvalue.py',1241),
+  ('snip_comment -> SNIPPET_COMMENT text_or_line','snip_comment',2,'p_snippet_comment','tagvalue.py',1247),
+  ('snip_comment -> SNIPPET_COMMENT error','snip_comment',2,'p_snippet_comment_1','tagvalue.py',1261),
+  ('snippet_attribution_text -> SNIPPET_ATTRIBUTION_TEXT text_or_line','snippet_attribution_text',2,'p_snippet_attribution_text_1','tagvalue.py',1267),
+  ('snippet_attribution_text -> SNIPPET_ATTRIBUTION_TEXT error','snippet_attribution_text',2,'p_snippet_attribution_text_2','tagvalue.py',1279),
+  ('snip_cr_text -> SNIPPET_CR_TEXT snip_cr_value','snip_cr_text',2,'p_snippet_cr_text','tagvalue.py',1285),
+  ('snip_cr_text -> SNIPPET_CR_TEXT error','snip_cr_text',2,'p_snippet_cr_text_1','tagvalue.py',1298),
+  ('snip_cr_value -> text_or_line','snip_cr_value',1,'p_snippet_cr_value_1','tagvalue.py',1304),
+  ('snip_cr_value -> NONE','snip_cr_value',1,'p_snippet_cr_value_2','tagvalue.py',1308),
+  ('snip_cr_value -> NO_ASSERT','snip_cr_value',1,'p_snippet_cr_value_3','tagvalue.py',1312),
+  ('snip_lic_comment -> SNIPPET_LICS_COMMENT text_or_line','snip_lic_comment',2,'p_snippet_lic_comment','tagvalue.py',1316),
+  ('snip_lic_comment -> SNIPPET_LICS_COMMENT error','snip_lic_comment',2,'p_snippet_lic_comment_1','tagvalue.py',1330),
+  ('text_or_line -> TEXT','text_or_line',1,'p_text_or_line_value_1','tagvalue.py',1336),
+  ('text_or_line -> LINE','text_or_line',1,'p_text_or_line_value_2','tagvalue.py',1340),
+  ('snip_file_spdx_id -> SNIPPET_FILE_SPDXID LINE','snip_file_spdx_id',2,'p_snip_from_file_spdxid','tagvalue.py',1344),
+  ('snip_file_spdx_id -> SNIPPET_FILE_SPDXID error','snip_file_spdx_id',2,'p_snip_from_file_spdxid_1','tagvalue.py',1358),
+  ('snip_lics_conc -> SNIPPET_LICS_CONC conc_license','snip_lics_conc',2,'p_snippet_concluded_license','tagvalue.py',1364),
+  ('snip_lics_conc -> SNIPPET_LICS_CONC error','snip_lics_conc',2,'p_snippet_concluded_license_1','tagvalue.py',1377),
+  ('snip_lics_info -> SNIPPET_LICS_INFO snip_lic_info_value','snip_lics_info',2,'p_snippet_lics_info','tagvalue.py',1383),
+  ('snip_lics_info -> SNIPPET_LICS_INFO error','snip_lics_info',2,'p_snippet_lics_info_1','tagvalue.py',1394),
+  ('snip_byte_range -> SNIPPET_BYTE_RANGE LINE','snip_byte_range',2,'p_snippet_byte_range','tagvalue.py',1400),
+  ('snip_byte_range -> SNIPPET_BYTE_RANGE error','snip_byte_range',2,'p_snippet_byte_range_1','tagvalue.py',1411),
+  ('snip_line_range -> SNIPPET_LINE_RANGE LINE','snip_line_range',2,'p_snippet_line_range','tagvalue.py',1418),
+  ('snip_line_range -> SNIPPET_LINE_RANGE error','snip_line_range',2,'p_snippet_line_range_1','tagvalue.py',1429),
+  ('snip_lic_info_value -> NONE','snip_lic_info_value',1,'p_snip_lic_info_value_1','tagvalue.py',1436),
+  ('snip_lic_info_value -> NO_ASSERT','snip_lic_info_value',1,'p_snip_lic_info_value_2','tagvalue.py',1440),
+  ('snip_lic_info_value -> LINE','snip_lic_info_value',1,'p_snip_lic_info_value_3','tagvalue.py',1444),
+  ('reviewer -> REVIEWER entity','reviewer',2,'p_reviewer_1','tagvalue.py',1449),
+  ('reviewer -> REVIEWER error','reviewer',2,'p_reviewer_2','tagvalue.py',1453),
+  ('review_date -> REVIEW_DATE DATE','review_date',2,'p_review_date_1','tagvalue.py',1459),
+  ('review_date -> REVIEW_DATE error','review_date',2,'p_review_date_2','tagvalue.py',1469),
+  ('review_comment -> REVIEW_COMMENT text_or_line','review_comment',2,'p_review_comment_1','tagvalue.py',1475),
+  ('review_comment -> REVIEW_COMMENT error','review_comment',2,'p_review_comment_2','tagvalue.py',1485),
+  ('annotator -> ANNOTATOR entity','annotator',2,'p_annotator_1','tagvalue.py',1491),
+  ('annotator -> ANNOTATOR error','annotator',2,'p_annotator_2','tagvalue.py',1495),
+  ('annotation_date -> ANNOTATION_DATE DATE','annotation_date',2,'p_annotation_date_1','tagvalue.py',1501),
+  ('annotation_date -> ANNOTATION_DATE error','annotation_date',2,'p_annotation_date_2','tagvalue.py',1511),
+  ('annotation_comment -> ANNOTATION_COMMENT text_or_line','annotation_comment',2,'p_annotation_comment_1','tagvalue.py',1517),
+  ('annotation_comment -> ANNOTATION_COMMENT error','annotation_comment',2,'p_annotation_comment_2','tagvalue.py',1527),
+  ('annotation_type -> ANNOTATION_TYPE annotation_type_value','annotation_type',2,'p_annotation_type_1','tagvalue.py',1533),
+  ('annotation_type -> ANNOTATION_TYPE error','annotation_type',2,'p_annotation_type_2','tagvalue.py',1547),
+  ('annotation_spdx_id -> ANNOTATION_SPDX_ID LINE','annotation_spdx_id',2,'p_annotation_spdx_id_1','tagvalue.py',1553),
+  ('annotation_spdx_id -> ANNOTATION_SPDX_ID error','annotation_spdx_id',2,'p_annotation_spdx_id_2','tagvalue.py',1563),
+  ('relationship -> RELATIONSHIP relationship_value','relationship',2,'p_relationship_1','tagvalue.py',1569),
+  ('relationship -> RELATIONSHIP error','relationship',2,'p_relationship_2','tagvalue.py',1581),
+  ('relationship_value -> DOC_REF_ID LINE','relationship_value',2,'p_relationship_value_with_doc_ref','tagvalue.py',1587),
+  ('relationship_value -> LINE','relationship_value',1,'p_relationship_value_without_doc_ref','tagvalue.py',1591),
+  ('relationship_comment -> RELATIONSHIP_COMMENT text_or_line','relationship_comment',2,'p_relationship_comment_1','tagvalue.py',1595),
+  ('relationship_comment -> RELATIONSHIP_COMMENT error','relationship_comment',2,'p_relationship_comment_2','tagvalue.py',1605),
+  ('locs_list_ver -> LIC_LIST_VER LINE','locs_list_ver',2,'p_lics_list_ver_1','tagvalue.py',1611),
+  ('locs_list_ver -> LIC_LIST_VER error','locs_list_ver',2,'p_lics_list_ver_2','tagvalue.py',1623),
+  ('doc_comment -> DOC_COMMENT text_or_line','doc_comment',2,'p_doc_comment_1','tagvalue.py',1629),
+  ('doc_comment -> DOC_COMMENT error','doc_comment',2,'p_doc_comment_2','tagvalue.py',1637),
+  ('doc_namespace -> DOC_NAMESPACE LINE','doc_namespace',2,'p_doc_namespace_1','tagvalue.py',1643),
+  ('doc_namespace -> DOC_NAMESPACE error','doc_namespace',2,'p_doc_namespace_2','tagvalue.py',1655),
+  ('data_lics -> DOC_LICENSE LINE','data_lics',2,'p_data_license_1','tagvalue.py',1661),
+  ('data_lics -> DOC_LICENSE error','data_lics',2,'p_data_license_2','tagvalue.py',1673),
+  ('doc_name -> DOC_NAME LINE','doc_name',2,'p_doc_name_1','tagvalue.py',1679),
+  ('doc_name -> DOC_NAME error','doc_name',2,'p_doc_name_2','tagvalue.py',1687),
+  ('ext_doc_ref -> EXT_DOC_REF DOC_REF_ID DOC_URI EXT_DOC_REF_CHKSUM','ext_doc_ref',4,'p_ext_doc_refs_1','tagvalue.py',1693),
+  ('ext_doc_ref -> EXT_DOC_REF error','ext_doc_ref',2,'p_ext_doc_refs_2','tagvalue.py',1708),
+  ('spdx_version -> DOC_VERSION LINE','spdx_version',2,'p_spdx_version_1','tagvalue.py',1714),
+  ('spdx_version -> DOC_VERSION error','spdx_version',2,'p_spdx_version_2','tagvalue.py',1726),
+  ('creator_comment -> CREATOR_COMMENT text_or_line','creator_comment',2,'p_creator_comment_1','tagvalue.py',1732),
+  ('creator_comment -> CREATOR_COMMENT error','creator_comment',2,'p_creator_comment_2','tagvalue.py',1740),
+  ('creator -> CREATOR entity','creator',2,'p_creator_1','tagvalue.py',1746),
+  ('creator -> CREATOR error','creator',2,'p_creator_2','tagvalue.py',1750),
+  ('created -> CREATED DATE','created',2,'p_created_1','tagvalue.py',1756),
+  ('created -> CREATED error','created',2,'p_created_2','tagvalue.py',1764),
+  ('entity -> TOOL_VALUE','entity',1,'p_entity_1','tagvalue.py',1770),
+  ('entity -> ORG_VALUE','entity',1,'p_entity_2','tagvalue.py',1782),
+  ('entity -> PERSON_VALUE','entity',1,'p_entity_3','tagvalue.py',1794),
+]
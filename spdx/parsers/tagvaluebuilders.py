@@ -228,10 +228,10 @@ class EntityBuilder(object):
         if not match or not validations.validate_org_name(match.group(self.ORG_NAME_GROUP)):
             raise SPDXValueError("Failed to extract Organization name")
 
-        name = match.group(self.ORG_NAME_GROUP).strip()
+        name = utils.shared_text(self, match.group(self.ORG_NAME_GROUP).strip())
         email = match.group(self.ORG_EMAIL_GROUP)
         if (email is not None) and (len(email) != 0):
-            return creationinfo.Organization(name=name, email=email.strip())
+            return creationinfo.Organization(name=name, email=utils.shared_text(self, email.strip()))
         else:
             return creationinfo.Organization(name=name, email=None)
 
@@ -244,10 +244,10 @@ class EntityBuilder(object):
         if not match or not validations.validate_person_name(match.group(self.PERSON_NAME_GROUP)):
             raise SPDXValueError("Failed to extract person name")
 
-        name = match.group(self.PERSON_NAME_GROUP).strip()
+        name = utils.shared_text(self, match.group(self.PERSON_NAME_GROUP).strip())
         email = match.group(self.PERSON_EMAIL_GROUP)
         if (email is not None) and (len(email) != 0):
-            return creationinfo.Person(name=name, email=email.strip())
+            return creationinfo.Person(name=name, email=utils.shared_text(self, email.strip()))
         else:
             return creationinfo.Person(name=name, email=None)
 
@@ -508,7 +508,66 @@ class AnnotationBuilder(object):
         return True
 
 
+class RelationshipIndex(object):
+    """
+    The relationships of a document by their relationship string, to find an
+    equal relationship without comparing with each one. The index notices
+    when the relationships were changed other than through `append` and
+    `replace` and is then rebuilt.
+    """
+
+    def __init__(self, doc: Document):
+        self.doc = doc
+        self.relationships = doc.relationships
+        self.by_string: Dict[str, Relationship] = dict()
+        for relationship in self.relationships:
+            self.by_string.setdefault(relationship.relationship, relationship)
+        self.mark()
+
+    def mark(self):
+        self.length = len(self.relationships)
+        self.last = self.relationships[-1] if self.relationships else None
+
+    def is_current(self, doc: Document) -> bool:
+        relationships = doc.relationships
+        return (
+            doc is self.doc
+            and relationships is self.relationships
+            and len(relationships) == self.length
+            and (relationships[-1] if relationships else None) is self.last
+        )
+
+    def find(self, relationship: Relationship) -> Relationship:
+        """Return the first relationship equal to `relationship` or None."""
+        return self.by_string.get(relationship.relationship)
+
+    def append(self, relationship: Relationship):
+        self.doc.add_relationship(relationship)
+        if len(self.relationships) == self.length + 1:
+            self.by_string.setdefault(relationship.relationship, relationship)
+            self.mark()
+        else:
+            # the document did more than appending
+            self.length = -1
+
+    def replace(self, existing: Relationship, relationship: Relationship):
+        """Remove `existing` and append the equal `relationship`."""
+        relationships = self.relationships
+        # remove by identity, comparing relationships is much slower
+        del relationships[list(map(id, relationships)).index(id(existing))]
+        self.doc.add_relationship(relationship)
+        if len(relationships) == self.length and len(self.by_string) == self.length:
+            self.by_string[relationship.relationship] = relationship
+            self.mark()
+        else:
+            # there are equal relationships which might come first now, or
+            # the document did more than appending
+            self.length = -1
+
+
 class RelationshipBuilder(object):
+    relationship_index = None
+
     def __init__(self):
         # FIXME: this state does not make sense
         self.reset_relationship()
@@ -520,26 +579,35 @@ class RelationshipBuilder(object):
         # FIXME: this state does not make sense
         self.relationship_comment_set = False
 
+    def get_relationship_index(self, doc: Document) -> RelationshipIndex:
+        if self.relationship_index is None or not self.relationship_index.is_current(doc):
+            self.relationship_index = RelationshipIndex(doc)
+        return self.relationship_index
+
     def add_relationship(self, doc: Document, relationship_term: str) -> bool:
         """
         Raise SPDXValueError if type is unknown.
         """
+        return self.add_relationship_object(doc, Relationship(relationship_term))
+
+    def add_relationship_object(self, doc: Document, relationship_to_add: Relationship) -> bool:
+        """
+        Add an already built relationship like add_relationship does.
+        Return False if an equal relationship with comment was kept instead.
+        """
         self.reset_relationship()
-        relationship_to_add = Relationship(relationship_term)
-        existing_relationships: List[Relationship] = doc.relationships
+        index = self.get_relationship_index(doc)
+        existing_relationship = index.find(relationship_to_add)
 
-        if relationship_to_add not in existing_relationships:
-            doc.add_relationship(relationship_to_add)
+        if existing_relationship is None:
+            index.append(relationship_to_add)
             return True
 
-        existing_relationship: Relationship = existing_relationships[existing_relationships.index(relationship_to_add)]
-
         # If the relationship already exists without comment, we remove the old one and re-append it at the end. This
         # allows to add a comment to the relationship (since a comment will always be added to the latest
         # relationship). If an equal relationship with comment already exists, we ignore the new relationship.
         if not existing_relationship.has_comment:
-            existing_relationships.remove(relationship_to_add)
-            doc.add_relationship(relationship_to_add)
+            index.replace(existing_relationship, relationship_to_add)
             return True
 
         return False
@@ -906,7 +974,7 @@ class PackageBuilder(object):
 
         self.package_cr_text_set = True
         if isinstance(text, str):
-            doc.packages[-1].cr_text = str_from_text(text)
+            doc.packages[-1].cr_text = utils.shared_text(self, str_from_text(text))
         else:
             doc.packages[-1].cr_text = text  # None or NoAssert
 
@@ -1112,7 +1180,7 @@ class FileBuilder(object):
         self.reset_file_stat()
 
     def set_file_name(self, doc, name):
-        doc.files.append(file.File(name))
+        doc.add_file(file.File(name))
         # A file name marks the start of a new file instance.
         # The builder must be reset
         # FIXME: this state does not make sense
@@ -1272,7 +1340,7 @@ class FileBuilder(object):
 
         self.file_copytext_set = True
         if isinstance(text, str):
-            self.file(doc).copyright = str_from_text(text)
+            self.file(doc).copyright = utils.shared_text(self, str_from_text(text))
         else:
             self.file(doc).copyright = text  # None or NoAssert
         return True
@@ -1538,7 +1606,7 @@ class SnippetBuilder(object):
 
         self.snippet_copyright_set = True
         if isinstance(text, str):
-            doc.snippet[-1].copyright = str_from_text(text)
+            doc.snippet[-1].copyright = utils.shared_text(self, str_from_text(text))
         else:
             doc.snippet[-1].copyright = text  # None or NoAssert
         return True
@@ -1713,6 +1781,7 @@ class Builder(
         Must be called between usage with different documents.
         """
         # FIXME: this state does not make sense
+        self.shared_texts = dict()
         self.reset_creation_info()
         self.reset_document()
         self.reset_package()
@@ -12,7 +12,6 @@
 
 import re
 
-import rdflib
 import uritools
 
 from spdx import creationinfo
@@ -257,7 +256,8 @@ def validate_extr_lic_name(value, optional=False):
     if value is None:
         return optional
     else:
-        return isinstance(value, (str, utils.NoAssert, rdflib.Literal))
+        # the rdflib Literals of the RDF parser are strs too
+        return isinstance(value, (str, utils.NoAssert))
 
 
 def validate_snippet_spdx_id(value, optional=False):
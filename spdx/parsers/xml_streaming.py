@@ -0,0 +1,136 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Read XML into the dicts and lists xmltodict.parse(strip_whitespace=False)
+gives, with an incremental ElementTree parser and without building an
+element tree.
+
+Elements named in `list_like_fields` always become lists, even when there
+is only one of them, which the XML parser otherwise had to fix up in a
+copy of the whole document. The children of the document element named
+in `streamed_fields` are handed to a callback as soon as they end instead
+of being collected, so that only one of them is held at a time.
+"""
+
+import xml.etree.ElementTree as ElementTree
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class Frame(object):
+    def __init__(self, name, items):
+        self.name = name
+        self.items = items
+        self.texts = []
+
+
+class XmlDictTarget(object):
+    """
+    ElementTree parser target building the value of the XML document.
+    `on_element(name, value)` is called for the children of the document
+    element `root` named in `streamed_fields`, which are then left out of
+    the value.
+    """
+
+    def __init__(self, list_like_fields, root=None, streamed_fields=(), on_element=None):
+        self.list_like_fields = list_like_fields
+        self.root = root
+        self.streamed_fields = streamed_fields
+        self.on_element = on_element
+        self.stack = []
+        self.scopes = [dict()]
+        self.declarations = []
+        self.result = None
+
+    def qname(self, name, scope):
+        # ElementTree resolves prefixes, xmltodict keeps them
+        if not name.startswith("{"):
+            return name
+        uri, local_name = name[1:].split("}", 1)
+        prefix = scope.get(uri)
+        if prefix is None:
+            return name
+        return prefix + ":" + local_name if prefix else local_name
+
+    def start_ns(self, prefix, uri):
+        self.declarations.append((prefix, uri))
+
+    def start(self, tag, attrib):
+        scope = self.scopes[-1]
+        items = dict()
+        if self.declarations:
+            scope = dict(scope)
+            for prefix, uri in self.declarations:
+                scope[uri] = prefix
+                items["@xmlns:" + prefix if prefix else "@xmlns"] = uri
+            self.declarations = []
+        self.scopes.append(scope)
+        for key, value in attrib.items():
+            items["@" + self.qname(key, scope)] = value
+        self.stack.append(Frame(self.qname(tag, scope), items))
+
+    def data(self, data):
+        frame = self.stack[-1]
+        if len(self.stack) == 1 and self.on_element is not None and not data.strip():
+            # the whitespace between the children of a streamed document
+            # element would pile up, and is of no use
+            return
+        frame.texts.append(data)
+
+    def end(self, tag):
+        frame = self.stack.pop()
+        self.scopes.pop()
+        text = "".join(frame.texts)
+        if frame.items:
+            if text:
+                frame.items["#text"] = text
+            value = frame.items
+        else:
+            value = text or None
+
+        if not self.stack:
+            self.result = {frame.name: value}
+            return
+        if (
+            len(self.stack) == 1
+            and self.on_element is not None
+            and self.stack[0].name == self.root
+            and frame.name in self.streamed_fields
+        ):
+            self.on_element(frame.name, value)
+            return
+
+        items = self.stack[-1].items
+        if frame.name not in items:
+            items[frame.name] = [value] if frame.name in self.list_like_fields else value
+        elif isinstance(items[frame.name], list):
+            items[frame.name].append(value)
+        else:
+            items[frame.name] = [items[frame.name], value]
+
+    def close(self):
+        return self.result
+
+
+def read(fil, target, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Feed the XML read from the file like object `fil` to the ElementTree
+    parser target `target` and return what its close method returns.
+    Raise xml.etree.ElementTree.ParseError if the XML is malformed.
+    """
+    parser = ElementTree.XMLParser(target=target)
+    chunk = fil.read(chunk_size)
+    while chunk:
+        parser.feed(chunk)
+        chunk = fil.read(chunk_size)
+    return parser.close()
@@ -10,11 +10,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import OrderedDict
-
-import xmltodict
-
+from spdx import document
 from spdx.parsers import jsonyamlxml
+from spdx.parsers import xml_streaming
 
 
 class Parser(jsonyamlxml.Parser):
@@ -53,30 +51,25 @@ class Parser(jsonyamlxml.Parser):
         }
 
     def parse(self, file):
-        parsed_xml = xmltodict.parse(
-            file.read(), strip_whitespace=False, encoding="utf-8"
-        )
-        fixed_object = self._set_in_list(parsed_xml, self.LIST_LIKE_FIELDS)
-        self.document_object = fixed_object.get("Document")
-        return super(Parser, self).parse()
-
-    def _set_in_list(self, data, keys):
         """
-        xmltodict parse list-like fields in different way when there is only one
-        of them than when there are several of them.
-        Set in lists those fields that are expected to be in them.
+        Parse the XML document read from `file`. The packages, files,
+        snippets and relationships are parsed one at a time as soon as they
+        are read.
         """
-        if isinstance(data, (dict, OrderedDict)):
-            new_data = OrderedDict()
-            for k, v in data.items():
-                if k in keys and not isinstance(v, list):
-                    new_data[k] = [self._set_in_list(v, keys)]
-                else:
-                    new_data[k] = self._set_in_list(v, keys)
-            return new_data
-        elif isinstance(data, list):
-            new_data = []
-            for element in data:
-                new_data.append(self._set_in_list(element, keys))
-            return new_data
-        return data
+        self.error = False
+        self.document = document.Document()
+        sections = dict()
+
+        def parse_element(name, value):
+            if name not in sections:
+                sections[name] = jsonyamlxml.ParsedSection(name)
+            self.parse_section_element(sections[name], value)
+
+        target = xml_streaming.XmlDictTarget(
+            self.LIST_LIKE_FIELDS, "Document", jsonyamlxml.STREAMED_FIELDS, parse_element
+        )
+        self.document_object = xml_streaming.read(file, target).get("Document")
+        if not sections:
+            return super(Parser, self).parse()
+        self.document_object.update(sections)
+        return self.parse_document_object()
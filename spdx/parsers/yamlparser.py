@@ -10,8 +10,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import yaml
-
+from spdx import yaml_engine
 from spdx.parsers import jsonyamlxml
 
 
@@ -26,5 +25,9 @@ class Parser(jsonyamlxml.Parser):
         super(Parser, self).__init__(builder, logger)
 
     def parse(self, file):
-        self.json_yaml_set_document(yaml.safe_load(file))
+        """
+        Parse the YAML document read from `file` with the active
+        yaml_engine, like yaml.safe_load.
+        """
+        self.json_yaml_set_document(yaml_engine.load(file))
         return super(Parser, self).parse()
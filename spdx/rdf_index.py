@@ -0,0 +1,72 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An index of RDF triples, filled by the RDF parser and the ordered RDF
+writer alike, without depending on either.
+"""
+
+
+class TripleIndex(object):
+    """
+    Triples indexed by subject, predicate and object in plain dictionaries.
+    Answers the `triples` patterns and `in` tests of the parsers like an
+    rdflib Graph with the default memory store would, in the same order,
+    without the overhead of a store query per lookup.
+    """
+
+    def __init__(self):
+        # subject -> predicate -> objects, predicate -> object -> subjects and
+        # object -> subject -> predicates; the innermost dictionaries are used
+        # as ordered sets
+        self.spo = {}
+        self.pos = {}
+        self.osp = {}
+
+    def add(self, triple):
+        subject, predicate, obj = triple
+        self.spo.setdefault(subject, {}).setdefault(predicate, {})[obj] = None
+        self.pos.setdefault(predicate, {}).setdefault(obj, {})[subject] = None
+        self.osp.setdefault(obj, {}).setdefault(subject, {})[predicate] = None
+
+    def triples(self, pattern):
+        """
+        Yield the triples matching `pattern`, a (subject, predicate, object)
+        tuple in which None matches anything.
+        """
+        subject, predicate, obj = pattern
+        if subject is not None:
+            by_predicate = self.spo.get(subject, {})
+            for pred in (predicate,) if predicate is not None else by_predicate:
+                objects = by_predicate.get(pred, {})
+                if obj is None:
+                    for o in objects:
+                        yield subject, pred, o
+                elif obj in objects:
+                    yield subject, pred, obj
+        elif predicate is not None:
+            by_object = self.pos.get(predicate, {})
+            for o in (obj,) if obj is not None else by_object:
+                for s in by_object.get(o, {}):
+                    yield s, predicate, o
+        elif obj is not None:
+            for s, predicates in self.osp.get(obj, {}).items():
+                for pred in predicates:
+                    yield s, pred, obj
+        else:
+            for s, by_predicate in self.spo.items():
+                for pred, objects in by_predicate.items():
+                    for o in objects:
+                        yield s, pred, o
+
+    def __contains__(self, pattern):
+        return next(self.triples(pattern), None) is not None
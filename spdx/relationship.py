@@ -10,8 +10,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
 from enum import auto, Enum
 
+from spdx import changes
 from spdx.parsers.loggers import ErrorMessages
 
 
@@ -63,17 +65,37 @@ class RelationshipType(Enum):
     SPECIFICATION_FOR = auto()
 
 
+RELATIONSHIP_TYPES = dict(RelationshipType.__members__)
+
+
 class Relationship(object):
     """
     Document relationship information
     Fields:
     - relationship:  provides information about the relationship between two SPDX elements.
     - relationship_comment:  place for the SPDX file creator to record any general comments. Optional, One
+
+    The relationship is split once into spdx_element_id, type, the
+    RelationshipType or None if unknown, and related_spdx_element, which
+    are what is stored; relationship and relationship_type are computed
+    from them, and are the fields to set to change the relationship. The
+    builders record relationship comments as comment.
     """
 
+    __slots__ = (
+        "_spdx_element_id",
+        "_type",
+        "_unknown_type",
+        "_related_spdx_element",
+        "_indexes",
+        "relationship_comment",
+        "comment",
+    )
+
     def __init__(self, relationship=None, relationship_comment=None):
-        self.relationship = relationship
+        self._split(relationship)
         self.relationship_comment = relationship_comment
+        self._indexes = None
 
     def __eq__(self, other):
         return (
@@ -82,30 +104,143 @@ class Relationship(object):
         )
 
     @property
-    def has_comment(self):
-        return self.relationship_comment is not None
+    def relationship(self):
+        parts = (self.spdx_element_id, self.relationship_type, self.related_spdx_element)
+        if parts[0] is None:
+            return None
+        return " ".join(part for part in parts if part is not None)
+
+    @relationship.setter
+    def relationship(self, relationship):
+        self._split(relationship)
+        changes.changed(self)
+
+    def _split(self, relationship):
+        parts = relationship.split(" ", 2) if relationship is not None else []
+        if len(parts) < 3:
+            parts.extend([None] * (3 - len(parts)))
+        spdx_element_id, relationship_type, related_spdx_element = parts
+        # the same few ids come up in many relationships
+        self._spdx_element_id = sys.intern(spdx_element_id) if spdx_element_id is not None else None
+        self._related_spdx_element = sys.intern(related_spdx_element) if related_spdx_element is not None else None
+        self._set_type(relationship_type)
+
+    def _set_type(self, relationship_type):
+        self._type = RELATIONSHIP_TYPES.get(relationship_type)
+        self._unknown_type = relationship_type if self._type is None else None
 
     @property
     def spdx_element_id(self):
-        return self.relationship.split(" ")[0]
+        return self._spdx_element_id
 
     @property
-    def relationship_type(self):
-        return self.relationship.split(" ")[1]
+    def type(self):
+        return self._type
+
+    @property
+    def unknown_type(self):
+        return self._unknown_type
 
     @property
     def related_spdx_element(self):
-        return self.relationship.split(" ")[2]
+        return self._related_spdx_element
+
+    @property
+    def relationship_type(self):
+        if self._type is not None:
+            return self._type.name
+        return self._unknown_type
+
+    @relationship_type.setter
+    def relationship_type(self, relationship_type):
+        self._set_type(relationship_type)
+        changes.changed(self)
+
+    @property
+    def has_comment(self):
+        return self.relationship_comment is not None
 
     def validate(self, messages: ErrorMessages) -> ErrorMessages:
         """
         Check that all the fields are valid.
         Appends any error messages to messages parameter shall be a ErrorMessages.
         """
-        r_type = self.relationship_type
-        if r_type not in [name for name, _ in RelationshipType.__members__.items()]:
+        if self.type is None:
             messages.append(
                 "Relationship type must be one of the constants defined in "
                 "class spdx.relationship.Relationship"
             )
         return messages
+
+
+class RelationshipGraph(changes.ListIndex):
+    """
+    The relationships of a document as edges between SPDX ids, parsed once
+    and grouped by RelationshipType, with the related ids of every element
+    and the ids relating to every element, in the order of the
+    relationships and without duplicates. Relationships with an unknown
+    type or missing a part are left out. Changing a relationship of the
+    graph has it rebuilt at the next update.
+    """
+
+    def __init__(self, relationships=()):
+        super(RelationshipGraph, self).__init__()
+        self.forward = dict()
+        self.reverse = dict()
+        for relationship in relationships:
+            self.add(relationship)
+
+    def clear(self):
+        self.forward = dict()
+        self.reverse = dict()
+
+    def add(self, relationship):
+        relationship_type = relationship.type
+        spdx_element_id = relationship.spdx_element_id
+        related_spdx_element = relationship.related_spdx_element
+        if relationship_type is None or related_spdx_element is None:
+            return
+        self.forward.setdefault(relationship_type, {}).setdefault(spdx_element_id, {})[related_spdx_element] = None
+        self.reverse.setdefault(relationship_type, {}).setdefault(related_spdx_element, {})[spdx_element_id] = None
+
+    def related(self, spdx_id, relationship_type):
+        """Return the ids of the elements `spdx_id` RELATIONSHIP_TYPE."""
+        return list(self.forward.get(relationship_type, {}).get(spdx_id, ()))
+
+    def relating(self, spdx_id, relationship_type):
+        """Return the ids of the elements that RELATIONSHIP_TYPE `spdx_id`."""
+        return list(self.reverse.get(relationship_type, {}).get(spdx_id, ()))
+
+    def closure(self, spdx_id, relationship_types, inverse_types=()):
+        """
+        Return the ids of the elements reachable from `spdx_id`, nearest
+        first, by following the relationships of `relationship_types` from
+        their element to the related element and the ones of
+        `inverse_types` the other way around.
+        """
+        steps = [self.forward.get(relationship_type, {}) for relationship_type in relationship_types]
+        steps.extend(self.reverse.get(relationship_type, {}) for relationship_type in inverse_types)
+        reached = {spdx_id: None}
+        queue = [spdx_id]
+        for current in queue:
+            for step in steps:
+                for next_id in step.get(current, ()):
+                    if next_id not in reached:
+                        reached[next_id] = None
+                        queue.append(next_id)
+        del reached[spdx_id]
+        return list(reached)
+
+    def contained(self, spdx_id):
+        """Return the ids of the elements `spdx_id` CONTAINS or that are CONTAINED_BY it."""
+        contained = dict.fromkeys(self.related(spdx_id, RelationshipType.CONTAINS))
+        contained.update(dict.fromkeys(self.relating(spdx_id, RelationshipType.CONTAINED_BY)))
+        return list(contained)
+
+    def dependencies(self, spdx_id):
+        """Return the ids of the elements `spdx_id` DEPENDS_ON, directly or not."""
+        return self.closure(spdx_id, (RelationshipType.DEPENDS_ON,), (RelationshipType.DEPENDENCY_OF,))
+
+    def dependents(self, spdx_id):
+        """Return the ids of the elements that DEPENDS_ON `spdx_id`, directly or not."""
+        return self.closure(spdx_id, (RelationshipType.DEPENDENCY_OF,), (RelationshipType.DEPENDS_ON,))
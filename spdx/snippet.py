@@ -11,6 +11,7 @@
 # limitations under the License.
 from typing import Tuple, Optional
 
+from spdx import changes
 from spdx import license
 from spdx import utils
 
@@ -46,7 +47,8 @@ class Snippet(object):
     def __init__(
         self, spdx_id=None, copyright=None, snip_from_file_spdxid=None, conc_lics=None, byte_range=None
     ):
-        self.spdx_id = spdx_id
+        self._spdx_id = spdx_id
+        self._indexes = None
         self.name = None
         self.comment = None
         self.copyright = copyright
@@ -58,6 +60,15 @@ class Snippet(object):
         self.byte_range: Optional[Tuple[int, int]] = byte_range
         self.line_range: Optional[Tuple[int, int]] = None
 
+    @property
+    def spdx_id(self):
+        return self._spdx_id
+
+    @spdx_id.setter
+    def spdx_id(self, value):
+        old_spdx_id, self._spdx_id = self._spdx_id, value
+        changes.changed(self, old_spdx_id)
+
     def add_lics(self, lics):
         self.licenses_in_snippet.append(lics)
 
@@ -13,6 +13,8 @@
 import datetime
 import hashlib
 import re
+import threading
+from collections import OrderedDict, namedtuple
 from typing import Dict, List, TYPE_CHECKING
 
 from ply import lex
@@ -23,7 +25,7 @@ from spdx.checksum import ChecksumAlgorithm
 if TYPE_CHECKING:
     from spdx.file import File
     from spdx.package import Package
-from spdx.relationship import Relationship
+from spdx.relationship import Relationship, RelationshipType
 from spdx import license
 
 
@@ -68,7 +70,40 @@ def datetime_from_iso_format(string):
         return None
 
 
-class NoAssert(object):
+def shared_text(builder, value):
+    """
+    Return the str `value`, or the equal str `builder` returned before, so
+    that texts repeated all over a document, like copyright texts and
+    supplier names, are one object each. The texts are kept in the
+    builder's `shared_texts` until it is reset for the next document,
+    rather than in the interpreter's table of interned strings. Return
+    other values, like NoAssert(), unchanged.
+    """
+    if type(value) is not str:
+        return value
+    texts = getattr(builder, "shared_texts", None)
+    if texts is None:
+        texts = builder.shared_texts = dict()
+    return texts.setdefault(value, value)
+
+
+class SpecialValue(object):
+    """
+    Base of the SPDX special values, each of which has a single instance:
+    NoAssert() and the like return the same object every time.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls):
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super(SpecialValue, cls).__new__(cls)
+            cls._instance = instance
+        return instance
+
+
+class NoAssert(SpecialValue):
     """
     Represent SPDX NOASSERTION value.
     """
@@ -83,7 +118,7 @@ class NoAssert(object):
         return self.to_value()
 
 
-class UnKnown(object):
+class UnKnown(SpecialValue):
     """
     Represent SPDX UNKNOWN value.
     """
@@ -101,7 +136,7 @@ class UnKnown(object):
         return self.to_value() == other.to_value()
 
 
-class SPDXNone(object):
+class SPDXNone(SpecialValue):
     """
     Represent SPDX None value.
     """
@@ -161,6 +196,10 @@ class LicenseListLexer(object):
         self.lexer = lex.lex(module=self, **kwargs)
 
 
+# Precompiled parser tables, regenerated by `python -m spdx.parsers.tables`.
+LICENSE_LIST_TABMODULE = "spdx.parsers.licenselist_parsetab"
+
+
 class LicenseListParser(object):
     def __init__(self):
         self.lex = LicenseListLexer()
@@ -190,7 +229,7 @@ class LicenseListParser(object):
     def p_license_atom_1(self, p):
         """license_atom : LICENSE
         """
-        p[0] = license.License.from_identifier(p[1])
+        p[0] = license.License.interned(p[1])
 
     def p_license_atom_2(self, p):
         """license_atom : LP disjunction RP
@@ -201,7 +240,12 @@ class LicenseListParser(object):
         pass
 
     def build(self, **kwargs):
-        """Must be called before parse."""
+        """Must be called before parse.
+        Uses the LALR tables shipped in `LICENSE_LIST_TABMODULE` unless told
+        otherwise; PLY regenerates them if the grammar signature changed.
+        """
+        kwargs.setdefault("tabmodule", LICENSE_LIST_TABMODULE)
+        kwargs.setdefault("debug", False)
         self.yacc = yacc.yacc(module=self, **kwargs)
 
     def parse(self, data):
@@ -212,6 +256,82 @@ class LicenseListParser(object):
             return None
 
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class CachedLicenseListParser(object):
+    """
+    Thread-safe license expression parser that memoizes the parsed trees.
+
+    The same expressions ("MIT", "Apache-2.0 OR MIT", ...) come up over and
+    over in a document, so the result of parsing each expression string is
+    kept in a least recently used cache of at most `maxsize` entries.
+    Cached License, LicenseConjunction and LicenseDisjunction trees are
+    shared between all callers and are therefore frozen.
+    """
+
+    DEFAULT_MAXSIZE = 4096
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._parser = LicenseListParser()
+        self._parser.build()
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, data):
+        """Parses a license list and returns a License or None if it failed."""
+        with self._lock:
+            try:
+                result = self._cache[data]
+            except KeyError:
+                pass
+            else:
+                self._cache.move_to_end(data)
+                self.hits += 1
+                return result
+
+            self.misses += 1
+            result = self._parser.parse(data)
+            if result is not None:
+                result.freeze()
+            if self.maxsize > 0:
+                self._cache[data] = result
+                if len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+            return result
+
+    def cache_info(self):
+        """Return the hit and miss counters and the size of the cache."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """Empty the cache and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_license_list_parser = None
+_license_list_parser_lock = threading.Lock()
+
+
+def get_license_list_parser():
+    """
+    Return the process-wide CachedLicenseListParser, creating it on first use.
+    """
+    global _license_list_parser
+    if _license_list_parser is None:
+        with _license_list_parser_lock:
+            if _license_list_parser is None:
+                _license_list_parser = CachedLicenseListParser()
+    return _license_list_parser
+
+
 def calc_verif_code(files: List['File']) -> str:
     list_of_file_hashes = []
     hash_algorithm_name = ChecksumAlgorithm.SHA1
@@ -231,15 +351,27 @@ def calc_verif_code(files: List['File']) -> str:
 
 
 def get_files_in_package(package: 'Package', files: List['File'], relationships: List[Relationship]) -> List['File']:
-    files_in_package = []
-    for file in files:
-        if file.spdx_id in [relationship.related_spdx_element for relationship in relationships
-                            if relationship.relationship_type == "CONTAINS" and relationship.spdx_element_id == package.spdx_id] \
-            or file.spdx_id in [relationship.spdx_element_id for relationship in relationships
-                                if relationship.relationship_type == "CONTAINED_BY" and relationship.related_spdx_element == package.spdx_id]:
-            files_in_package.append(file)
+    return get_files_by_package(files, relationships).get(package.spdx_id, [])
 
-    return files_in_package
+
+def get_files_by_package(files: List['File'], relationships: List[Relationship]) -> Dict[str, List['File']]:
+    """
+    Return the files of every package, by package SPDX id, in the order of
+    `files`, going through the files and the relationships only once.
+    """
+    packages_by_file = dict()
+    for relationship in relationships:
+        relationship_type = relationship.type
+        if relationship_type is RelationshipType.CONTAINS:
+            packages_by_file.setdefault(relationship.related_spdx_element, {})[relationship.spdx_element_id] = None
+        elif relationship_type is RelationshipType.CONTAINED_BY:
+            packages_by_file.setdefault(relationship.spdx_element_id, {})[relationship.related_spdx_element] = None
+
+    files_by_package = dict()
+    for file in files:
+        for package_spdx_id in packages_by_file.get(file.spdx_id, ()):
+            files_by_package.setdefault(package_spdx_id, []).append(file)
+    return files_by_package
 
 
 def update_dict_item_with_new_item(current_state: Dict, key: str, item_to_add: str) -> None:
@@ -10,8 +10,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+from collections.abc import Iterator
 
+from spdx import json_codec
 from spdx.writers.tagvalue import InvalidDocumentError
 from spdx.writers.jsonyamlxml import Writer
 from spdx.parsers.loggers import ErrorMessages
@@ -25,8 +26,64 @@ def json_converter(obj):
         raise TypeError("No implementation available to serialize objects of type " + type(obj).__name__)
 
 
-def write_document(document, out, validate=True):
+def dumps_indented(codec, obj, level):
+    """
+    Return `obj` as `codec` writes it with pretty=True when nested `level`
+    deep.
+    """
+    # newlines in strings are escaped, the remaining ones separate items
+    return codec.dumps(obj, pretty=True, default=json_converter).replace("\n", "\n" + " " * codec.indent * level)
 
+
+def write_document_object(pairs, out, codec=None, compact=False):
+    """
+    Write the (key, value) `pairs` of Writer.iter_document to `out` as
+    `codec`, by default json_codec.get_encoder(), writes dict(pairs) with
+    pretty=True, or with pretty=False if `compact`, writing the items of
+    iterator values one by one instead of holding the whole document.
+    """
+    codec = codec or json_codec.get_encoder()
+    if compact:
+        out.write("{")
+        separator = ""
+        for key, value in pairs:
+            out.write(separator + codec.dumps(key) + ":")
+            separator = ","
+            if isinstance(value, Iterator):
+                item_separator = "["
+                for item in value:
+                    out.write(item_separator + codec.dumps(item, default=json_converter))
+                    item_separator = ","
+                out.write("[]" if item_separator == "[" else "]")
+            else:
+                out.write(codec.dumps(value, default=json_converter))
+        out.write("}")
+        return
+
+    indent = " " * codec.indent
+    out.write("{")
+    separator = "\n"
+    for key, value in pairs:
+        out.write(separator + indent + codec.dumps(key) + ": ")
+        separator = ",\n"
+        if isinstance(value, Iterator):
+            item_separator = "[\n"
+            for item in value:
+                out.write(item_separator + indent * 2 + dumps_indented(codec, item, 2))
+                item_separator = ",\n"
+            out.write("[]" if item_separator == "[\n" else "\n" + indent + "]")
+        else:
+            out.write(dumps_indented(codec, value, 1))
+    out.write("}" if separator == "\n" else "\n}")
+
+
+def write_document(document, out, validate=True, streaming=True, compact=False):
+    """
+    Write `document` to `out` as JSON, with json_codec.get_encoder().
+    With `streaming`, the packages and files are serialized as they are
+    created instead of building the whole document object first; the
+    output is the same. With `compact`, the JSON has no whitespace.
+    """
     if validate:
         messages = ErrorMessages()
         messages = document.validate(messages)
@@ -34,5 +91,8 @@ def write_document(document, out, validate=True):
             raise InvalidDocumentError(messages)
 
     writer = Writer(document)
+    if streaming:
+        write_document_object(writer.iter_document(), out, compact=compact)
+        return
     document_object = writer.create_document()
-    json.dump(document_object, out, indent=4, default=json_converter)
+    out.write(json_codec.get_encoder().dumps(document_object, pretty=not compact, default=json_converter))
@@ -9,15 +9,37 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import sys
 from typing import Dict, List
 
-from rdflib import Literal
-
 from spdx import license, utils
 from spdx.checksum import Checksum
 from spdx.package import ExternalPackageRef
-from spdx.relationship import Relationship
-from spdx.utils import update_dict_item_with_new_item
+from spdx.relationship import Relationship, RelationshipType
+
+
+def is_literal(value):
+    """
+    Return whether `value` is an rdflib Literal, as the RDF parser may
+    leave in extracted licenses. rdflib is not imported for that: without
+    it there cannot be any.
+    """
+    rdflib = sys.modules.get("rdflib")
+    return rdflib is not None and isinstance(value, rdflib.Literal)
+
+
+def add_new_list_item(items_in_lists: Dict, current_state: Dict, key: str, item_to_add: str) -> None:
+    """
+    Like utils.update_dict_item_with_new_item, but with the items already in
+    each list kept in a set in `items_in_lists`, as a package can have many
+    thousand files.
+    """
+    items = items_in_lists.get((id(current_state), key))
+    if items is None:
+        items = items_in_lists[(id(current_state), key)] = set(current_state.get(key, ()))
+    if item_to_add not in items:
+        items.add(item_to_add)
+        current_state.setdefault(key, []).append(item_to_add)
 
 
 class BaseWriter(object):
@@ -441,14 +463,14 @@ class ExtractedLicenseWriter(BaseWriter):
         for extracted_license in unique_extracted_licenses.values():
             extracted_license_object = dict()
 
-            if isinstance(extracted_license.identifier, Literal):
+            if is_literal(extracted_license.identifier):
                 extracted_license_object[
                     "licenseId"
                 ] = extracted_license.identifier.toPython()
             else:
                 extracted_license_object["licenseId"] = extracted_license.identifier
 
-            if isinstance(extracted_license.text, Literal):
+            if is_literal(extracted_license.text):
                 extracted_license_object[
                     "extractedText"
                 ] = extracted_license.text.toPython()
@@ -456,7 +478,7 @@ class ExtractedLicenseWriter(BaseWriter):
                 extracted_license_object["extractedText"] = extracted_license.text
 
             if extracted_license.full_name:
-                if isinstance(extracted_license.full_name, Literal):
+                if is_literal(extracted_license.full_name):
                     extracted_license_object[
                         "name"
                     ] = extracted_license.full_name.toPython()
@@ -464,7 +486,7 @@ class ExtractedLicenseWriter(BaseWriter):
                     extracted_license_object["name"] = extracted_license.full_name
 
             if extracted_license.cross_ref:
-                if isinstance(extracted_license.cross_ref, Literal):
+                if is_literal(extracted_license.cross_ref):
                     extracted_license_object[
                         "seeAlsos"
                     ] = extracted_license.cross_ref.toPython()
@@ -472,7 +494,7 @@ class ExtractedLicenseWriter(BaseWriter):
                     extracted_license_object["seeAlsos"] = extracted_license.cross_ref
 
             if extracted_license.comment:
-                if isinstance(extracted_license.comment, Literal):
+                if is_literal(extracted_license.comment):
                     extracted_license_object[
                         "comment"
                     ] = extracted_license.comment.toPython()
@@ -528,8 +550,6 @@ class Writer(
         return ext_document_reference_objects
 
     def create_relationships(self) -> List[Dict]:
-        packages_spdx_ids = [package.spdx_id for package in self.document.packages]
-        files_spdx_ids = [file.spdx_id for file in self.document.files]
         # we take the package_objects from document_object if any exist because we will modify them to add
         # jsonyamlxml-specific fields
         if "packages" in self.document_object:
@@ -537,31 +557,34 @@ class Writer(
         else:
             packages_by_spdx_id = {}
 
+        items_in_lists = dict()
         relationship_objects = []
         for relationship in self.document.relationships:
-            if relationship.relationship_type == "CONTAINS" and relationship.spdx_element_id in packages_spdx_ids \
-                    and relationship.related_spdx_element in files_spdx_ids:
-                update_dict_item_with_new_item(packages_by_spdx_id[relationship.spdx_element_id], "hasFiles",
-                                               relationship.related_spdx_element)
+            if relationship.type is RelationshipType.CONTAINS \
+                    and self.document.get_package(relationship.spdx_element_id) is not None \
+                    and self.document.get_file(relationship.related_spdx_element) is not None:
+                add_new_list_item(items_in_lists, packages_by_spdx_id[relationship.spdx_element_id], "hasFiles",
+                                  relationship.related_spdx_element)
                 if relationship.has_comment:
                     relationship_objects.append(self.create_relationship_info(relationship))
 
-            elif relationship.relationship_type == "CONTAINED_BY" and relationship.spdx_element_id in files_spdx_ids \
-                    and relationship.related_spdx_element in packages_spdx_ids:
-                update_dict_item_with_new_item(packages_by_spdx_id[relationship.related_spdx_element],
-                                                    "hasFiles", relationship.spdx_element_id)
+            elif relationship.type is RelationshipType.CONTAINED_BY \
+                    and self.document.get_file(relationship.spdx_element_id) is not None \
+                    and self.document.get_package(relationship.related_spdx_element) is not None:
+                add_new_list_item(items_in_lists, packages_by_spdx_id[relationship.related_spdx_element],
+                                  "hasFiles", relationship.spdx_element_id)
                 if relationship.has_comment:
                     relationship_objects.append(self.create_relationship_info(relationship))
 
-            elif relationship.relationship_type == "DESCRIBES" and relationship.spdx_element_id == self.document.spdx_id:
-                update_dict_item_with_new_item(self.document_object, "documentDescribes",
-                                               relationship.related_spdx_element)
+            elif relationship.type is RelationshipType.DESCRIBES and relationship.spdx_element_id == self.document.spdx_id:
+                add_new_list_item(items_in_lists, self.document_object, "documentDescribes",
+                                  relationship.related_spdx_element)
                 if relationship.has_comment:
                     relationship_objects.append(self.create_relationship_info(relationship))
 
-            elif relationship.relationship_type == "DESCRIBED_BY" and relationship.related_spdx_element == self.document.spdx_id:
-                update_dict_item_with_new_item(self.document_object, "documentDescribes",
-                                               relationship.spdx_element_id)
+            elif relationship.type is RelationshipType.DESCRIBED_BY and relationship.related_spdx_element == self.document.spdx_id:
+                add_new_list_item(items_in_lists, self.document_object, "documentDescribes",
+                                  relationship.spdx_element_id)
                 if relationship.has_comment:
                     relationship_objects.append(self.create_relationship_info(relationship))
 
@@ -570,59 +593,78 @@ class Writer(
 
         return relationship_objects
 
-    def create_document(self):
+    def iter_document(self):
+        """
+        Yield the (key, value) pairs of the document, in the order they are
+        written. The "packages" and "files" values are iterators creating
+        each object only when it is reached, so that a writer can serialize
+        one object at a time; create_document turns them into lists.
+        """
         self.document_object = dict()
-
-        self.document_object["spdxVersion"] = self.document.version.__str__()
-        self.document_object["documentNamespace"] = self.document.namespace.__str__()
-        self.document_object["creationInfo"] = self.create_creation_info()
-        self.document_object["dataLicense"] = self.license(self.document.data_license)
-        self.document_object["SPDXID"] = self.doc_spdx_id
-        self.document_object["name"] = self.document.name
         annotations_by_spdx_id = self.create_annotations_by_spdx_id()
 
         unique_doc_packages = {}
         for doc_package in self.document.packages:
             if doc_package.spdx_id not in unique_doc_packages.keys():
                 unique_doc_packages[doc_package.spdx_id] = doc_package
-        if unique_doc_packages:
-            package_objects = []
-            for package in unique_doc_packages.values():
+
+        # the relationships add "hasFiles" to the packages and
+        # "documentDescribes" to the document: collect them up front, with
+        # placeholders for the package objects
+        placeholders = [{"SPDXID": self.spdx_id(spdx_id)} for spdx_id in unique_doc_packages]
+        relationship_objects = None
+        if self.document.relationships:
+            self.document_object["packages"] = placeholders
+            relationship_objects = self.create_relationships()
+        document_describes = self.document_object.get("documentDescribes")
+
+        def package_objects():
+            for package, placeholder in zip(unique_doc_packages.values(), placeholders):
                 package_info_object = self.create_package_info(package, annotations_by_spdx_id)
-                package_objects.append(package_info_object)
-            self.document_object["packages"] = package_objects
+                if "hasFiles" in placeholder:
+                    package_info_object["hasFiles"] = placeholder["hasFiles"]
+                yield package_info_object
+
+        yield "spdxVersion", self.document.version.__str__()
+        yield "documentNamespace", self.document.namespace.__str__()
+        yield "creationInfo", self.create_creation_info()
+        yield "dataLicense", self.license(self.document.data_license)
+        yield "SPDXID", self.doc_spdx_id
+        yield "name", self.document.name
+
+        if unique_doc_packages:
+            yield "packages", package_objects()
         if self.document.files:
-            file_objects = []
-            for file in self.document.files:
-                file_object = self.create_file_info(file, annotations_by_spdx_id)
-                file_objects.append(file_object)
-            self.document_object["files"] = file_objects
+            yield "files", (self.create_file_info(file, annotations_by_spdx_id) for file in self.document.files)
 
         if self.document.has_comment:
-            self.document_object["comment"] = self.document.comment
+            yield "comment", self.document.comment
 
         if self.document.ext_document_references:
-            self.document_object[
-                "externalDocumentRefs"
-            ] = self.create_ext_document_references()
+            yield "externalDocumentRefs", self.create_ext_document_references()
 
         if self.document.extracted_licenses:
-            self.document_object[
-                "hasExtractedLicensingInfos"
-            ] = self.create_extracted_license()
+            yield "hasExtractedLicensingInfos", self.create_extracted_license()
 
         if self.document.reviews:
-            self.document_object["reviewers"] = self.create_review_info()
+            yield "reviewers", self.create_review_info()
 
         if self.document.snippet:
-            self.document_object["snippets"] = self.create_snippet_info(annotations_by_spdx_id)
+            yield "snippets", self.create_snippet_info(annotations_by_spdx_id)
 
         if self.doc_spdx_id in annotations_by_spdx_id:
-            self.document_object["annotations"] = annotations_by_spdx_id[self.doc_spdx_id]
+            yield "annotations", annotations_by_spdx_id[self.doc_spdx_id]
 
-        if self.document.relationships:
-            relationship_objects = self.create_relationships()
-            if relationship_objects:
-                self.document_object["relationships"] = relationship_objects
+        if document_describes is not None:
+            yield "documentDescribes", document_describes
+
+        if relationship_objects:
+            yield "relationships", relationship_objects
 
+    def create_document(self):
+        """Return the document as a dictionary, built from iter_document."""
+        self.document_object = {
+            key: list(value) if key in ("packages", "files") else value
+            for key, value in self.iter_document()
+        }
         return self.document_object
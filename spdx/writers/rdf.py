@@ -10,6 +10,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+
 from rdflib import BNode
 from rdflib import Graph
 from rdflib import Literal
@@ -27,7 +29,8 @@ from spdx.checksum import Checksum
 from spdx.package import Package
 from spdx.parsers.loggers import ErrorMessages
 from spdx.relationship import Relationship
-from spdx.utils import get_files_in_package
+from spdx.utils import get_files_by_package
+from spdx.writers.rdf_ordered import OrderedGraph, OrderedXMLSerializer
 from spdx.writers.tagvalue import InvalidDocumentError
 
 import warnings
@@ -45,13 +48,27 @@ class BaseWriter(object):
         self.doap_namespace = Namespace("http://usefulinc.com/ns/doap#")
         self.spdx_namespace = Namespace("http://spdx.org/rdf/terms#")
         self.graph = Graph()
+        self.node_ids = None
+        # file nodes by file name and by SPDX id, filled by create_file_node
+        self.file_nodes_by_name = dict()
+        self.file_nodes_by_spdx_id = dict()
+        self.files_by_package = None
+
+    def create_node(self) -> BNode:
+        """
+        Return a new blank node, numbered in creation order when writing
+        deterministically.
+        """
+        if self.node_ids is None:
+            return BNode()
+        return BNode("N{0}".format(next(self.node_ids)))
 
     def create_checksum_node(self, checksum: Checksum) -> BNode:
         """
         Return a node representing spdx.checksum.
         """
         algo = checksum.identifier.algorithm_to_rdf_representation() or 'checksumAlgorithm_sha1'
-        checksum_node = BNode()
+        checksum_node = self.create_node()
         type_triple = (checksum_node, RDF.type, self.spdx_namespace.Checksum)
         self.graph.add(type_triple)
         algorithm_triple = (
@@ -95,23 +112,23 @@ class LicenseWriter(BaseWriter):
             self.licenses_from_tree_helper(current.license_1, licenses)
             self.licenses_from_tree_helper(current.license_2, licenses)
         else:
-            licenses.add(self.create_license_helper(current))
+            licenses[self.create_license_helper(current)] = None
 
     def licenses_from_tree(self, tree):
         """
         Traverse conjunctions and disjunctions like trees and return a
-        set of all licenses in it as nodes.
+        list of all licenses in it as nodes, without duplicates, in the
+        order they appear.
         """
-        # FIXME: this is unordered!
-        licenses = set()
+        licenses = dict()
         self.licenses_from_tree_helper(tree, licenses)
-        return licenses
+        return list(licenses)
 
     def create_conjunction_node(self, conjunction):
         """
         Return a node representing a conjunction of licenses.
         """
-        node = BNode()
+        node = self.create_node()
         type_triple = (node, RDF.type, self.spdx_namespace.ConjunctiveLicenseSet)
         self.graph.add(type_triple)
         licenses = self.licenses_from_tree(conjunction)
@@ -124,7 +141,7 @@ class LicenseWriter(BaseWriter):
         """
         Return a node representing a disjunction of licenses.
         """
-        node = BNode()
+        node = self.create_node()
         type_triple = (node, RDF.type, self.spdx_namespace.DisjunctiveLicenseSet)
         self.graph.add(type_triple)
         licenses = self.licenses_from_tree(disjunction)
@@ -168,7 +185,7 @@ class LicenseWriter(BaseWriter):
         if len(licenses) != 0:
             return licenses[0][0]  # return subject in first triple
         else:
-            license_node = BNode()
+            license_node = self.create_node()
             type_triple = (
                 license_node,
                 RDF.type,
@@ -251,6 +268,8 @@ class FileWriter(LicenseWriter):
         file_node = URIRef(
             "http://www.spdx.org/files#{id}".format(id=str(doc_file.spdx_id))
         )
+        self.file_nodes_by_name.setdefault(doc_file.name, {})[file_node] = None
+        self.file_nodes_by_spdx_id[doc_file.spdx_id] = file_node
         type_triple = (file_node, RDF.type, self.spdx_namespace.File)
         self.graph.add(type_triple)
 
@@ -334,24 +353,16 @@ class FileWriter(LicenseWriter):
         Handle dependencies for a single file.
         - doc_file - instance of spdx.file.File.
         """
-        subj_triples = list(
-            self.graph.triples(
-                (None, self.spdx_namespace.fileName, Literal(doc_file.name))
-            )
-        )
-        if len(subj_triples) != 1:
+        subject_nodes = list(self.file_nodes_by_name.get(doc_file.name, ()))
+        if len(subject_nodes) != 1:
             raise InvalidDocumentError(
                 "Could not find dependency subject {0}".format(doc_file.name)
             )
-        subject_node = subj_triples[0][0]
+        subject_node = subject_nodes[0]
         for dependency in doc_file.dependencies:
-            dep_triples = list(
-                self.graph.triples(
-                    (None, self.spdx_namespace.fileName, Literal(dependency))
-                )
-            )
-            if len(dep_triples) == 1:
-                dep_node = dep_triples[0][0]
+            dep_nodes = list(self.file_nodes_by_name.get(dependency, ()))
+            if len(dep_nodes) == 1:
+                dep_node = dep_nodes[0]
                 dep_triple = (
                     subject_node,
                     self.spdx_namespace.fileDependency,
@@ -463,7 +474,7 @@ class ReviewInfoWriter(BaseWriter):
         """
         Return a review node.
         """
-        review_node = BNode()
+        review_node = self.create_node()
         type_triple = (review_node, RDF.type, self.spdx_namespace.Review)
         self.graph.add(type_triple)
 
@@ -553,7 +564,7 @@ class RelationshipInfoWriter(BaseWriter):
         """
         Return a relationship node.
         """
-        relationship_node = BNode()
+        relationship_node = self.create_node()
         type_triple = (relationship_node, RDF.type, self.spdx_namespace.Relationship)
         self.graph.add(type_triple)
 
@@ -616,7 +627,7 @@ class CreationInfoWriter(BaseWriter):
         """
         Add and return a creation info node to graph
         """
-        ci_node = BNode()
+        ci_node = self.create_node()
         # Type property
         type_triple = (ci_node, RDF.type, self.spdx_namespace.CreationInfo)
         self.graph.add(type_triple)
@@ -649,7 +660,7 @@ class ExternalDocumentRefWriter(BaseWriter):
         """
         Add and return a creation info node to graph
         """
-        ext_doc_ref_node = BNode()
+        ext_doc_ref_node = self.create_node()
         type_triple = (
             ext_doc_ref_node,
             RDF.type,
@@ -696,7 +707,7 @@ class PackageWriter(LicenseWriter):
         """
         Return a node representing package verification code.
         """
-        verif_node = BNode()
+        verif_node = self.create_node()
         type_triple = (
             verif_node,
             RDF.type,
@@ -867,13 +878,9 @@ class PackageWriter(LicenseWriter):
         Return node representing pkg_file
         pkg_file should be instance of spdx.file.
         """
-        nodes = list(
-            self.graph.triples(
-                (None, self.spdx_namespace.fileName, Literal(pkg_file.name))
-            )
-        )
-        if len(nodes) == 1:
-            return nodes[0][0]
+        node = self.file_nodes_by_spdx_id.get(pkg_file.spdx_id)
+        if node is not None:
+            return node
         else:
             raise InvalidDocumentError(
                 "handle_package_has_file_helper could not"
@@ -885,7 +892,9 @@ class PackageWriter(LicenseWriter):
         Add hasFile triples to graph.
         Must be called after files have been added.
         """
-        files = get_files_in_package(package, self.document.files, self.document.relationships)
+        if self.files_by_package is None:
+            self.files_by_package = get_files_by_package(self.document.files, self.document.relationships)
+        files = self.files_by_package.get(package.spdx_id, [])
         file_nodes = map(self.handle_package_has_file_helper, files)
         triples = [
             (package_node, self.spdx_namespace.hasFile, node) for node in file_nodes
@@ -906,7 +915,7 @@ class PackageExternalRefWriter(BaseWriter):
         """
         Add and return an external package reference node to graph.
         """
-        pkg_ext_ref_node = BNode()
+        pkg_ext_ref_node = self.create_node()
         pkg_ext_ref_triple = (
             pkg_ext_ref_node,
             RDF.type,
@@ -973,12 +982,19 @@ class Writer(
     Call `write()` to start writing.
     """
 
-    def __init__(self, document, out):
+    def __init__(self, document, out, deterministic=False):
         """
         - document is spdx.document instance that will be written.
         - out is a file-like object that will be written to.
+        - deterministic: number blank nodes as they are created and write
+          the triples in the order they were added, so that the same
+          document is always written the same way.
         """
         super(Writer, self).__init__(document, out)
+        self.deterministic = deterministic
+        if deterministic:
+            self.graph = OrderedGraph()
+            self.node_ids = itertools.count()
 
     def create_doc(self):
         """
@@ -1053,6 +1069,10 @@ class Writer(
         for snippet in snippet_nodes:
             self.graph.add((doc_node, self.spdx_namespace.Snippet, snippet))
 
+        if self.deterministic:
+            OrderedXMLSerializer(self.graph).serialize(self.out, encoding="utf-8")
+            return
+
         # normalize the graph to ensure that the sort order is stable
         self.graph = to_isomorphic(self.graph)
 
@@ -1060,13 +1080,15 @@ class Writer(
         self.graph.serialize(self.out, "pretty-xml", encoding="utf-8")
 
 
-def write_document(document, out, validate=True):
+def write_document(document, out, validate=True, deterministic=False):
     """
     Write an SPDX RDF document.
     - document - spdx.document instance.
     - out - file like object that will be written to.
     Optionally `validate` the document before writing and raise
     InvalidDocumentError if document.validate returns False.
+    With `deterministic`, the output only depends on the document and is
+    written without canonicalizing the graph, see Writer.
     """
 
     if validate:
@@ -1075,5 +1097,5 @@ def write_document(document, out, validate=True):
         if messages:
             raise InvalidDocumentError(messages)
 
-    writer = Writer(document, out)
+    writer = Writer(document, out, deterministic)
     writer.write()
@@ -0,0 +1,133 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Graph and RDF/XML serializer for writing SPDX documents in a stable order.
+
+rdflib's memory store and pretty-xml serializer go through sets of triples
+and nodes, so the order of elements, properties and namespaces in their
+output changes from run to run. OrderedGraph keeps the triples in insertion
+order and OrderedXMLSerializer writes them in that order, in the same
+layout as pretty-xml. Together with blank nodes numbered as they are
+created, writing the same document gives the same bytes every time.
+"""
+
+from rdflib import BNode, Graph, Literal, RDF
+from rdflib.plugins.parsers.RDFVOC import RDFVOC
+from rdflib.plugins.serializers.rdfxml import XMLLANG
+from rdflib.plugins.serializers.xmlwriter import XMLWriter
+
+from spdx.rdf_index import TripleIndex
+
+
+class OrderedGraph(Graph):
+    """
+    A Graph keeping its triples in a TripleIndex only, so that they are
+    read back in the order they were added.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(OrderedGraph, self).__init__(*args, **kwargs)
+        self.index = TripleIndex()
+
+    def add(self, triple):
+        self.index.add(triple)
+        return self
+
+    def triples(self, triple):
+        return self.index.triples(triple)
+
+    def __len__(self):
+        return sum(len(objects) for by_predicate in self.index.spo.values() for objects in by_predicate.values())
+
+
+class OrderedXMLSerializer(object):
+    """
+    Write an OrderedGraph as RDF/XML. Nodes are nested in the node
+    referencing them first, down to `max_depth` like pretty-xml does;
+    blank nodes are always identified by rdf:nodeID.
+    """
+
+    def __init__(self, graph, max_depth=3):
+        self.graph = graph
+        self.index = graph.index
+        self.max_depth = max_depth
+        self.serialized = set()
+        self.writer = None
+
+    def serialize(self, stream, encoding="utf-8"):
+        nm = self.graph.namespace_manager
+        namespaces = dict()
+        for uri in list(self.index.pos) + list(self.index.pos.get(RDF.type, {})):
+            prefix, namespace, _ = nm.compute_qname_strict(uri)
+            namespaces.setdefault(prefix, namespace)
+        namespaces["rdf"] = str(RDF)
+
+        self.writer = XMLWriter(stream, nm, encoding)
+        self.writer.push(RDFVOC.RDF)
+        self.writer.namespaces(namespaces.items())
+        # nodes nobody refers to first, then whatever is left
+        for subject in self.index.spo:
+            if subject not in self.index.osp:
+                self.subject(subject, 1)
+        for subject in self.index.spo:
+            self.subject(subject, 1)
+        self.writer.pop(RDFVOC.RDF)
+        stream.write("\n".encode("latin-1"))
+
+    def subject(self, subject, depth):
+        if subject in self.serialized:
+            return
+        self.serialized.add(subject)
+        writer = self.writer
+        node_type = next(iter(self.index.spo[subject].get(RDF.type, {})), None)
+        try:
+            self.graph.namespace_manager.qname(node_type)
+        except Exception:
+            node_type = None
+
+        element = node_type or RDFVOC.Description
+        writer.push(element)
+        if isinstance(subject, BNode):
+            writer.attribute(RDFVOC.nodeID, subject)
+        else:
+            writer.attribute(RDFVOC.about, subject)
+        for _, predicate, obj in self.index.triples((subject, None, None)):
+            if not (predicate == RDF.type and obj == node_type):
+                self.predicate(predicate, obj, depth + 1)
+        writer.pop(element)
+
+    def predicate(self, predicate, obj, depth):
+        writer = self.writer
+        writer.push(predicate)
+        if isinstance(obj, Literal):
+            if obj.language:
+                writer.attribute(XMLLANG, obj.language)
+            if obj.datatype:
+                writer.attribute(RDFVOC.datatype, obj.datatype)
+            writer.text(obj)
+        elif obj in self.serialized or obj not in self.index.spo:
+            if isinstance(obj, BNode):
+                writer.attribute(RDFVOC.nodeID, obj)
+            else:
+                writer.attribute(RDFVOC.resource, obj)
+        elif depth <= self.max_depth:
+            self.subject(obj, depth + 1)
+        elif isinstance(obj, BNode):
+            if len(self.index.osp[obj]) == 1:
+                # inline blank nodes only referenced once regardless of depth
+                self.subject(obj, depth + 1)
+            else:
+                writer.attribute(RDFVOC.nodeID, obj)
+        else:
+            writer.attribute(RDFVOC.resource, obj)
+        writer.pop(predicate)
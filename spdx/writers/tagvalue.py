@@ -19,7 +19,7 @@ from spdx.document import Document
 from spdx.file import File
 from spdx.package import Package
 from spdx.parsers.loggers import ErrorMessages
-from spdx.relationship import Relationship
+from spdx.relationship import Relationship, RelationshipType
 from spdx.snippet import Snippet
 from spdx.version import Version
 
@@ -388,13 +388,14 @@ def write_document(document, out, validate=True):
             write_separator(out)
         write_separator(out)
 
-    relationships_to_write, contained_files_by_package_id = scan_relationships(document.relationships,
-                                                                               document.packages, document.files)
-    contained_snippets_by_file_id = determine_files_containing_snippets(document.snippet, document.files)
-    packaged_file_ids = [file.spdx_id for files_list in contained_files_by_package_id.values()
-                         for file in files_list]
-    filed_snippet_ids = [snippet.spdx_id for snippets_list in contained_snippets_by_file_id.values()
-                         for snippet in snippets_list]
+    relationships_to_write, contained_files_by_package_id = scan_relationships(
+        document.relationships, document.packages, document.files, document=document)
+    contained_snippets_by_file_id = determine_files_containing_snippets(
+        document.snippet, document.files, document=document)
+    packaged_file_ids = {file.spdx_id for files_list in contained_files_by_package_id.values()
+                         for file in files_list}
+    filed_snippet_ids = {snippet.spdx_id for snippets_list in contained_snippets_by_file_id.values()
+                         for snippet in snippets_list}
 
     # Write Relationships
     if relationships_to_write:
@@ -443,25 +444,39 @@ def write_snippets(snippets_to_write: List, out: TextIO) -> None:
         write_separators(out)
 
 
-def scan_relationships(relationships: List[Relationship], packages: List[Package], files: List[File]) \
-        -> Tuple[List, Dict]:
+def elements_by_spdx_id(elements: List) -> Dict:
+    by_spdx_id = dict()
+    for element in elements:
+        by_spdx_id.setdefault(element.spdx_id, element)
+    return by_spdx_id
+
+
+def scan_relationships(relationships: List[Relationship], packages: List[Package], files: List[File],
+                       document: Document = None) -> Tuple[List, Dict]:
+    """
+    Return the relationships to write and the files contained by each
+    package. If `document` is given, its packages and files are looked up
+    with Document.get_package and get_file instead of being indexed again.
+    """
+    if document is not None:
+        get_package, get_file = document.get_package, document.get_file
+    else:
+        get_package, get_file = elements_by_spdx_id(packages).get, elements_by_spdx_id(files).get
     contained_files_by_package_id = dict()
     relationships_to_write = []
-    files_by_spdx_id = {file.spdx_id: file for file in files}
-    packages_spdx_ids = [package.spdx_id for package in packages]
     for relationship in relationships:
-        if relationship.relationship_type == "CONTAINS" and \
-            relationship.spdx_element_id in packages_spdx_ids and \
-                relationship.related_spdx_element in files_by_spdx_id.keys():
+        if relationship.type is RelationshipType.CONTAINS and \
+            get_package(relationship.spdx_element_id) is not None and \
+                get_file(relationship.related_spdx_element) is not None:
             contained_files_by_package_id.setdefault(relationship.spdx_element_id, []).append(
-                files_by_spdx_id[relationship.related_spdx_element])
+                get_file(relationship.related_spdx_element))
             if relationship.has_comment:
                 relationships_to_write.append(relationship)
-        elif relationship.relationship_type == "CONTAINED_BY" and \
-            relationship.related_spdx_element in packages_spdx_ids and \
-                relationship.spdx_element_id in files_by_spdx_id:
+        elif relationship.type is RelationshipType.CONTAINED_BY and \
+            get_package(relationship.related_spdx_element) is not None and \
+                get_file(relationship.spdx_element_id) is not None:
             contained_files_by_package_id.setdefault(relationship.related_spdx_element, []).append(
-                files_by_spdx_id[relationship.spdx_element_id])
+                get_file(relationship.spdx_element_id))
             if relationship.has_comment:
                 relationships_to_write.append(relationship)
         else:
@@ -470,10 +485,15 @@ def scan_relationships(relationships: List[Relationship], packages: List[Package
     return relationships_to_write, contained_files_by_package_id
 
 
-def determine_files_containing_snippets(snippets: List[Snippet], files: List[File]) -> Dict:
+def determine_files_containing_snippets(snippets: List[Snippet], files: List[File], document: Document = None) -> Dict:
+    """
+    Return the snippets of each file. If `document` is given, its files are
+    looked up with Document.get_file instead of being indexed again.
+    """
+    get_file = document.get_file if document is not None else elements_by_spdx_id(files).get
     contained_snippets_by_file_id = dict()
     for snippet in snippets:
-        if snippet.snip_from_file_spdxid in [file.spdx_id for file in files]:
+        if get_file(snippet.snip_from_file_spdxid) is not None:
             contained_snippets_by_file_id.setdefault(snippet.snip_from_file_spdxid, []).append(snippet)
 
     return contained_snippets_by_file_id
@@ -11,30 +11,76 @@
 # limitations under the License.
 
 
-from spdx.writers import json
-from spdx.writers import yaml
-from spdx.writers import rdf
-from spdx.writers import xml
-from spdx.writers import tagvalue
+import io
+
+from spdx import compression
+from spdx.formats import format_of_name
 from spdx.parsers.builderexceptions import FileTypeError
 
 
-def write_file(doc, fn, validate=True, encoding="utf-8"):
+# formats whose writers have a compact output
+COMPACT_FORMATS = ("json", "yaml", "xml")
+
+
+def get_writer_module(file_format):
+    """
+    Return the writer module for `file_format`, only imported now so that
+    using one format does not import the libraries of the others.
+    """
+    if file_format == "rdf":
+        from spdx.writers import rdf
+        return rdf
+    elif file_format == "tag":
+        from spdx.writers import tagvalue
+        return tagvalue
+    elif file_format == "json":
+        from spdx.writers import json
+        return json
+    elif file_format == "xml":
+        from spdx.writers import xml
+        return xml
+    elif file_format == "yaml":
+        from spdx.writers import yaml
+        return yaml
+    raise FileTypeError("FileType Not Supported")
+
+
+def write_document(doc, out, file_format, validate=True, compact=False):
+    if compact and file_format in COMPACT_FORMATS:
+        get_writer_module(file_format).write_document(doc, out, validate, compact=True)
+    else:
+        get_writer_module(file_format).write_document(doc, out, validate)
+
+
+def write_file(doc, fn, validate=True, encoding="utf-8", compact=False):
+    """
+    Write `doc` to the file `fn` in the format its name ends with,
+    compressed if the name ends with a compression suffix like ".gz", see
+    spdx.compression. `compact` output is smaller and without layout for
+    people, for the COMPACT_FORMATS; it is ignored for the others.
+    """
+    file_format = format_of_name(fn)
     out_mode = "w"
-    if fn.endswith(".rdf") or fn.endswith(".rdf.xml"):
-        writer_module = rdf
+    if file_format == "rdf":
         out_mode = "wb"
         encoding = None
-    elif fn.endswith(".tag") or fn.endswith(".spdx"):
-        writer_module = tagvalue
-    elif fn.endswith(".json"):
-        writer_module = json
-    elif fn.endswith(".xml"):
-        writer_module = xml
-    elif fn.endswith(".yaml"):
-        writer_module = yaml
-    else:
-        raise FileTypeError("FileType Not Supported")
 
-    with open(fn, out_mode, encoding=encoding) as out:
-        p = writer_module.write_document(doc, out, validate)
+    with compression.open_file(fn, out_mode, encoding=encoding) as out:
+        write_document(doc, out, file_format, validate, compact)
+
+
+def write_stream(doc, out, file_format, validate=True, encoding="utf-8", compact=False):
+    """
+    Write `doc` in `file_format`, one of "rdf", "tag", "json", "xml" or
+    "yaml", to the binary file like object `out`, for instance
+    sys.stdout.buffer, which is left open. `compact` is as for write_file.
+    """
+    if file_format == "rdf":
+        write_document(doc, out, file_format, validate)
+        return
+    text_out = io.TextIOWrapper(out, encoding=encoding)
+    try:
+        write_document(doc, text_out, file_format, validate, compact)
+    finally:
+        text_out.flush()
+        text_out.detach()
@@ -10,6 +10,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Iterator
+from xml.sax.saxutils import XMLGenerator
+
 import xmltodict
 
 from spdx.writers.tagvalue import InvalidDocumentError
@@ -17,8 +20,86 @@ from spdx.writers.jsonyamlxml import Writer
 from spdx.parsers.loggers import ErrorMessages
 
 
-def write_document(document, out, validate=True):
+INDENT = "\t"
+
+
+def value_to_string(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def emit(handler, key, value, depth, pretty=True):
+    """
+    Send the elements for `key` and `value` of a document object to the
+    SAX content `handler` nested `depth` deep, like xmltodict.unparse with
+    `pretty`: "@" keys are attributes, "#text" is the text, and lists are
+    repeated elements.
+    """
+    values = value if isinstance(value, list) else [value]
+    for value in values:
+        if value is None:
+            value = {}
+        elif not isinstance(value, dict):
+            value = {"#text": value_to_string(value)}
+        text = None
+        attributes = {}
+        children = []
+        for child_key, child_value in value.items():
+            if child_key == "#text":
+                text = None if child_value is None else value_to_string(child_value)
+            elif child_key.startswith("@"):
+                attributes[child_key[1:]] = "" if child_value is None else value_to_string(child_value)
+            elif not (isinstance(child_value, list) and not child_value):
+                children.append((child_key, child_value))
+
+        if pretty:
+            handler.ignorableWhitespace(INDENT * depth)
+        handler.startElement(key, attributes)
+        if pretty and children:
+            handler.ignorableWhitespace("\n")
+        for child_key, child_value in children:
+            emit(handler, child_key, child_value, depth + 1, pretty)
+        if text is not None:
+            handler.characters(text)
+        if pretty and children:
+            handler.ignorableWhitespace(INDENT * depth)
+        handler.endElement(key)
+        if pretty and depth:
+            handler.ignorableWhitespace("\n")
+
+
+def write_document_object(pairs, out, compact=False):
+    """
+    Write the (key, value) `pairs` of Writer.iter_document to `out` as the
+    children of the <Document> element, the same way xmltodict.unparse
+    writes {"Document": dict(pairs)} with pretty=True, or pretty=False if
+    `compact`, writing the items of iterator values one by one instead of
+    holding the whole document.
+    """
+    pretty = not compact
+    handler = XMLGenerator(out, "utf-8")
+    handler.startDocument()
+    handler.startElement("Document", {})
+    if pretty:
+        handler.ignorableWhitespace("\n")
+    for key, value in pairs:
+        if isinstance(value, Iterator):
+            for item in value:
+                emit(handler, key, item, 1, pretty)
+        else:
+            emit(handler, key, value, 1, pretty)
+    handler.endElement("Document")
+    handler.endDocument()
+
 
+def write_document(document, out, validate=True, streaming=True, compact=False):
+    """
+    Write `document` to `out` as XML. With `streaming`, the packages and
+    files are written as they are created instead of building the whole
+    document object first; the output is the same. With `compact`, the
+    elements are not indented nor on lines of their own.
+    """
     if validate:
         messages = ErrorMessages()
         messages = document.validate(messages)
@@ -26,6 +107,9 @@ def write_document(document, out, validate=True):
             raise InvalidDocumentError(messages)
 
     writer = Writer(document)
+    if streaming:
+        write_document_object(writer.iter_document(), out, compact=compact)
+        return
     document_object = {"Document": writer.create_document()}
 
-    xmltodict.unparse(document_object, out, encoding="utf-8", pretty=True)
+    xmltodict.unparse(document_object, out, encoding="utf-8", pretty=not compact)
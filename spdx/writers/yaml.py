@@ -10,14 +10,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import yaml
-
+from spdx import yaml_engine
 from spdx.writers.tagvalue import InvalidDocumentError
 from spdx.writers.jsonyamlxml import Writer
 from spdx.parsers.loggers import ErrorMessages
 
 
-def write_document(document, out, validate=True):
+# flow style output on a single line, as libyaml takes negative widths
+# for unlimited but PyYAML does not
+COMPACT_WIDTH = 1 << 30
+
+
+def write_document(document, out, validate=True, compact=False):
+    """
+    Write `document` to `out` as YAML, in block style, or with `compact`
+    in flow style on a single line, which is smaller but meant for
+    machines rather than people.
+    """
 
     if validate:
         messages = ErrorMessages()
@@ -28,4 +37,8 @@ def write_document(document, out, validate=True):
     writer = Writer(document)
     document_object = writer.create_document()
 
-    yaml.safe_dump(document_object, out, indent=2, explicit_start=True, encoding='utf-8')
+    if compact:
+        yaml_engine.dump(document_object, out, default_flow_style=True, width=COMPACT_WIDTH, explicit_start=True,
+                         encoding='utf-8')
+        return
+    yaml_engine.dump(document_object, out, indent=2, explicit_start=True, encoding='utf-8')
@@ -0,0 +1,65 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The PyYAML loader and dumper used by the YAML parser and writer: the safe
+ones of libyaml's C implementation when PyYAML was built with it, which
+are many times faster, or else the pure Python ones. Both load and dump
+the same values; only the folding of long strings in the output differs.
+"""
+
+import yaml
+
+ENGINES = ("libyaml", "python")
+
+_engine = None
+
+
+def default_engine():
+    return "libyaml" if yaml.__with_libyaml__ else "python"
+
+
+def set_engine(name=None):
+    """
+    Use the engine `name`, one of ENGINES, from now on, or the default one
+    if None. Raise ValueError for an unknown engine and ImportError if
+    PyYAML was built without libyaml.
+    """
+    global _engine
+    if name is not None and name not in ENGINES:
+        raise ValueError("Unknown YAML engine {0}, expected one of {1}".format(name, ", ".join(ENGINES)))
+    if name == "libyaml" and not yaml.__with_libyaml__:
+        raise ImportError("PyYAML was built without libyaml")
+    _engine = name
+
+
+def engine():
+    """Return the name of the active engine."""
+    return _engine or default_engine()
+
+
+def loader():
+    return yaml.CSafeLoader if engine() == "libyaml" else yaml.SafeLoader
+
+
+def dumper():
+    return yaml.CSafeDumper if engine() == "libyaml" else yaml.SafeDumper
+
+
+def load(stream):
+    """Return the value of the YAML read from `stream`, like yaml.safe_load."""
+    return yaml.load(stream, Loader=loader())
+
+
+def dump(data, stream=None, **kwds):
+    """Write `data` to `stream` as YAML, like yaml.safe_dump."""
+    return yaml.dump(data, stream, Dumper=dumper(), **kwds)
@@ -17,6 +17,7 @@ import tests.testing_utils as testing_utils
 from spdx.document import Document
 from spdx.license import License
 import spdx.parsers.tagvaluebuilders as builders
+from spdx.relationship import Relationship
 from spdx.version import Version
 
 
@@ -179,6 +180,14 @@ class TestEntityBuilder(TestCase):
         assert org.name == org_name
         assert org.email == org_email
 
+    def test_org_names_are_shared_per_builder(self):
+        # built at run time, so that they are distinct from the constant
+        org_str = "Organization: {0} ()".format("".join(["Exa", "mple"]))
+        first = self.builder.build_org(self.document, org_str)
+        second = self.builder.build_org(self.document, org_str[:])
+        assert first.name is second.name
+        assert first.name is not builders.EntityBuilder().build_org(self.document, org_str).name
+
     def test_org(self):
         org_name = "Example"
         org_str = "Organization: {0} ()".format(org_name)
@@ -462,6 +471,29 @@ class TestRelationshipBuilder(TestCase):
         relationship = "SPDXRef-DOCUMENT DESCRIBES SPDXRef-File"
         assert self.builder.add_relationship(self.document, relationship)
 
+    def test_equal_relationship_is_moved_to_the_end(self):
+        for relationship in ["SPDXRef-A CONTAINS SPDXRef-B", "SPDXRef-A CONTAINS SPDXRef-C",
+                             "SPDXRef-A CONTAINS SPDXRef-B"]:
+            assert self.builder.add_relationship(self.document, relationship)
+        assert [r.relationship for r in self.document.relationships] == [
+            "SPDXRef-A CONTAINS SPDXRef-C", "SPDXRef-A CONTAINS SPDXRef-B"]
+
+    def test_equal_relationship_with_comment_is_kept(self):
+        self.builder.add_relationship(self.document, "SPDXRef-A CONTAINS SPDXRef-B")
+        self.document.relationships[-1].relationship_comment = "Comment"
+        self.builder.add_relationship(self.document, "SPDXRef-A CONTAINS SPDXRef-C")
+        assert not self.builder.add_relationship(self.document, "SPDXRef-A CONTAINS SPDXRef-B")
+        assert len(self.document.relationships) == 2
+
+    def test_relationships_changed_outside_of_builder(self):
+        self.builder.add_relationship(self.document, "SPDXRef-A CONTAINS SPDXRef-B")
+        self.document.relationships = [Relationship("SPDXRef-A CONTAINS SPDXRef-C")]
+        self.builder.add_relationship(self.document, "SPDXRef-A CONTAINS SPDXRef-B")
+        self.document.add_relationship(Relationship("SPDXRef-A CONTAINS SPDXRef-D"))
+        self.builder.add_relationship(self.document, "SPDXRef-A CONTAINS SPDXRef-C")
+        assert [r.relationship for r in self.document.relationships] == [
+            "SPDXRef-A CONTAINS SPDXRef-B", "SPDXRef-A CONTAINS SPDXRef-D", "SPDXRef-A CONTAINS SPDXRef-C"]
+
     def add_relationship(self):
         relate_str = "SPDXRef-DOCUMENT DESCRIBES SPDXRef-File"
         self.builder.add_relationship(self.document, relate_str)
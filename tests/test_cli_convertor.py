@@ -11,6 +11,8 @@
 # limitations under the License.
 
 import os
+import subprocess
+import sys
 from unittest import TestCase
 
 from spdx.cli_tools.convertor import determine_infile_and_outfile
@@ -73,6 +75,29 @@ class TestConvertor(TestCase):
         assert infile == expected_infile
         assert outfile == outfile_given
 
+    def test_determine_input_with_stdin_and_stdout(self):
+        infile_given = None
+        outfile_given = None
+        src = ('-', '-')
+        from_ = 'tag'
+        to = 'json'
+
+        infile, outfile = determine_infile_and_outfile(infile_given, outfile_given, src, from_, to)
+
+        assert infile == '-'
+        assert outfile == '-'
+
+    def test_messages_go_to_stderr_when_writing_to_stdout(self):
+        document = b"SPDXVersion: SPDX-2.1\nDataLicense: MIT\n"
+        result = subprocess.run(
+            [sys.executable, "-m", "spdx.cli_tools.convertor", "-", "-t", "json", "-"],
+            input=document, capture_output=True,
+        )
+
+        assert result.stdout == b""
+        assert b"Invalid DataLicense value 'MIT'" in result.stderr
+        assert b"Errors while parsing" in result.stderr
+
     @raises(ValueError)
     def test_determine_input_with_invalid_arguments(self):
         infile_given = None
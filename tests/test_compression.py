@@ -0,0 +1,76 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import os
+
+import pytest
+
+from spdx import compression
+from spdx.parsers.parse_anything import parse_file
+from spdx.writers.write_anything import write_file
+from tests.utils_test import TestParserUtils
+
+tag_file = os.path.join(os.path.dirname(__file__), "data", "formats", "SPDXTagExample.tag")
+
+
+def compressions():
+    for name in compression.COMPRESSIONS:
+        marks = []
+        if name == "zstd":
+            try:
+                compression.zstandard()
+            except ImportError:
+                marks = [pytest.mark.skip(reason="zstandard is not installed")]
+        yield pytest.param(name, marks=marks)
+
+
+def suffix(name):
+    return next(suffix for suffix, compression_name in compression.SUFFIXES.items() if compression_name == name)
+
+
+def test_split_suffix():
+    assert compression.split_suffix("doc.spdx.json.gz") == ("doc.spdx.json", "gzip")
+    assert compression.split_suffix("doc.spdx.zst") == ("doc.spdx", "zstd")
+    assert compression.split_suffix("doc.spdx.json") == ("doc.spdx.json", None)
+
+
+@pytest.mark.parametrize("name", compressions())
+@pytest.mark.parametrize("out_format", ["json", "yaml", "xml", "spdx"])
+def test_write_and_parse_compressed(tmp_path, name, out_format):
+    document, _ = parse_file(tag_file)
+    plain_file = str(tmp_path / ("doc." + out_format))
+    compressed_file = plain_file + suffix(name)
+    write_file(document, plain_file, validate=False)
+    write_file(document, compressed_file, validate=False)
+
+    with open(compressed_file, "rb") as f:
+        assert compression.detect(f.read(8)) == name
+    with compression.open_file(compressed_file, "rb") as f, open(plain_file, "rb") as plain:
+        assert f.read() == plain.read()
+    expected, _ = parse_file(plain_file)
+    parsed, _ = parse_file(compressed_file)
+    assert TestParserUtils.to_dict(parsed) == TestParserUtils.to_dict(expected)
+
+
+def test_parse_detects_compression_by_magic_bytes(tmp_path):
+    json_file = str(tmp_path / "doc.json")
+    write_file(parse_file(tag_file)[0], json_file, validate=False)
+    expected, _ = parse_file(json_file)
+    with open(json_file, "rb") as f:
+        data = f.read()
+    with open(json_file, "wb") as f:
+        f.write(gzip.compress(data))
+
+    with compression.open_file(json_file) as f:
+        assert f.read() == data.decode("utf-8")
+    assert TestParserUtils.to_dict(parse_file(json_file)[0]) == TestParserUtils.to_dict(expected)
@@ -10,6 +10,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import subprocess
+import sys
 from unittest import TestCase
 
 from spdx import config
@@ -33,6 +35,11 @@ class TestLicenseList(TestCase):
     def test_config_license_list_version_constant(self):
         assert config.LICENSE_LIST_VERSION == Version(major=3, minor=20)
 
+    def test_lists_loaded_on_first_use(self):
+        script = ("import sys\nfrom spdx import config\nassert 'LICENSE_MAP' not in vars(config)\n"
+                  "from spdx.config import EXCEPTION_MAP\nassert config.LICENSE_MAP['MIT'] == 'MIT License'")
+        subprocess.run([sys.executable, "-c", script], check=True)
+
     def test_load_exception_list(self):
         version, exception_map = config.load_exception_list(config._exceptions)
         assert version == ('3', '20')
@@ -11,6 +11,7 @@
 # limitations under the License.
 
 import os
+import pickle
 import shutil
 import tempfile
 import unittest
@@ -20,13 +21,13 @@ from unittest import TestCase
 from spdx.checksum import Checksum, ChecksumAlgorithm
 from spdx.config import LICENSE_MAP, EXCEPTION_MAP
 from spdx.creationinfo import Tool
-from spdx.document import Document, ExternalDocumentRef
+from spdx.document import Document, ElementIndex, ExternalDocumentRef
 from spdx.license import License
 from spdx.file import File, FileType
 from spdx.package import Package, PackagePurpose
 from spdx.parsers.loggers import ErrorMessages
 from spdx.relationship import Relationship, RelationshipType
-from spdx.utils import NoAssert
+from spdx.utils import NoAssert, SPDXNone
 from spdx.version import Version
 
 from tests import utils_test
@@ -165,6 +166,104 @@ class TestDocument(TestCase):
         messages = doc.validate()
         assert len(messages.messages) == 0
 
+    def test_model_objects_use_slots(self):
+        for element in [File('./some/file'), Checksum(ChecksumAlgorithm.SHA1, 'a' * 40),
+                        Relationship('SPDXRef-A CONTAINS SPDXRef-B'), License.from_identifier('MIT')]:
+            assert not hasattr(element, '__dict__')
+            with self.assertRaises(AttributeError):
+                element.unknown_field = None
+
+        package = Package(name='some/path')
+        package.files_verified = False
+        assert package.files_verified is False
+
+    def test_get_element_by_spdx_id(self):
+        doc = Document()
+        package = Package(name='some/path', spdx_id='SPDXRef-Package')
+        doc.add_package(package)
+        file = File('./some/file')
+        doc.add_file(file)
+        # the builders set the SPDX id after adding the element
+        file.spdx_id = 'SPDXRef-File'
+
+        assert doc.get_package('SPDXRef-Package') is package
+        assert doc.get_file('SPDXRef-File') is file
+        assert doc.get_element('SPDXRef-File') is file
+        assert doc.get_file('SPDXRef-Package') is None
+        assert doc.get_element('SPDXRef-Missing') is None
+
+        other_file = File('./some/other/file', spdx_id='SPDXRef-Other-File')
+        doc.files.append(other_file)
+        assert doc.get_element('SPDXRef-Other-File') is other_file
+
+        doc.files = [other_file]
+        assert doc.get_file('SPDXRef-File') is None
+        other_file.spdx_id = 'SPDXRef-File'
+        assert doc.get_file('SPDXRef-Other-File') is None
+        assert doc.get_file('SPDXRef-File') is other_file
+
+    def test_get_element_after_changes(self):
+        doc = Document()
+        file = File('./some/file', spdx_id='SPDXRef-A')
+        doc.add_file(file)
+        assert doc.get_file('SPDXRef-A') is file
+
+        file.spdx_id = 'SPDXRef-B'
+        assert doc.get_file('SPDXRef-B') is file
+        assert doc.get_file('SPDXRef-A') is None
+
+        other_file = File('./some/other/file', spdx_id='SPDXRef-B')
+        doc.files[0] = other_file
+        assert doc.get_file('SPDXRef-B') is other_file
+
+        doc.files.pop()
+        doc.add_file(File('./third/file', spdx_id='SPDXRef-C'))
+        assert doc.get_file('SPDXRef-B') is None
+        assert doc.get_file('SPDXRef-C').name == './third/file'
+
+        package = Package(name='some/path')
+        doc.add_package(package)
+        assert doc.get_package('SPDXRef-Package') is None
+        package.spdx_id = 'SPDXRef-Package'
+        assert doc.get_element('SPDXRef-Package') is package
+
+    def test_element_index_stays_linear(self):
+        indexed = []
+
+        class CountingIndex(ElementIndex):
+            def add(self, element):
+                indexed.append(element)
+                super(CountingIndex, self).add(element)
+
+        doc = Document()
+        doc._file_index = CountingIndex()
+        other_doc = Document()
+        for number in range(1000):
+            file = File('./file/{0}'.format(number))
+            doc.add_file(file)
+            file.spdx_id = 'SPDXRef-{0}'.format(number)
+            assert doc.get_file(file.spdx_id) is file
+            file.spdx_id = 'SPDXRef-File-{0}'.format(number)
+            assert doc.get_file('SPDXRef-{0}'.format(number)) is None
+            assert doc.get_file(file.spdx_id) is file
+            # changes to elements of other documents do not concern this one
+            other_doc.add_file(File('./other/{0}'.format(number), spdx_id='SPDXRef-Other'))
+            other_doc.files[-1].spdx_id = 'SPDXRef-Other-{0}'.format(number)
+        assert len(indexed) == 1000
+
+    def test_element_index_after_pickling(self):
+        doc = Document()
+        file = File('./some/file', spdx_id='SPDXRef-A')
+        doc.add_file(file)
+        copy = pickle.loads(pickle.dumps(doc))
+        copy.files[0].spdx_id = 'SPDXRef-B'
+        assert copy.get_file('SPDXRef-B') is copy.files[0]
+        assert doc.get_file('SPDXRef-A') is file
+        copy.files[0].spdx_id = 'SPDXRef-C'
+        assert copy.get_file('SPDXRef-C') is copy.files[0]
+        assert copy.files[0]._indexes == (copy._file_index,)
+
+
 class TestWriters(TestCase):
     maxDiff = None
 
@@ -579,6 +678,30 @@ class TestWriters(TestCase):
             if temp_dir and os.path.exists(temp_dir):
                 shutil.rmtree(temp_dir)
 
+    def test_write_document_rdf_deterministic(self):
+        from spdx.writers.rdf import write_document
+        temp_dir = ''
+        try:
+            temp_dir = tempfile.mkdtemp(prefix='test_spdx')
+            written = []
+            for name in ('first.rdf', 'second.rdf'):
+                result_file = os.path.join(temp_dir, name)
+                with open(result_file, 'wb') as output:
+                    write_document(self._get_lgpl_doc(), output, validate=True, deterministic=True)
+                with open(result_file, 'rb') as result:
+                    written.append(result.read())
+            assert written[0] == written[1]
+            assert b'rdf:nodeID="N0"' in written[0]
+
+            expected_file = utils_test.get_test_loc(
+                'doc_write/rdf-simple.json',
+                test_data_dir=utils_test.test_data_dir)
+
+            utils_test.check_rdf_scan(expected_file, result_file, regen=False)
+        finally:
+            if temp_dir and os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir)
+
 
 def create_relationship(spdx_element_id: str, relationship_type: RelationshipType, related_spdx_element: str) -> Relationship:
     return Relationship(spdx_element_id + " " + relationship_type.name + " " + related_spdx_element)
@@ -609,6 +732,19 @@ class TestLicense(TestCase):
         assert mit.full_name == 'MIT License'
         assert mit.url == 'http://spdx.org/licenses/MIT'
 
+    def test_interned(self):
+        mit = License.interned('MIT')
+        assert mit is License.interned('MIT')
+        assert mit == License.from_identifier('MIT')
+        assert mit is not License.from_identifier('MIT')
+        with self.assertRaises(AttributeError):
+            mit.full_name = 'Something else'
+
+    def test_special_values_are_singletons(self):
+        assert NoAssert() is NoAssert()
+        assert SPDXNone() is SPDXNone()
+        assert NoAssert() is not SPDXNone()
+
 
 class TestException(TestCase):
 
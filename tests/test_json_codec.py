@@ -0,0 +1,120 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import glob
+import io
+import json
+import os
+
+import pytest
+
+from spdx import json_codec
+from spdx.parsers import jsonparser
+from spdx.parsers.jsonyamlxmlbuilders import Builder
+from spdx.parsers.loggers import StandardLogger
+from spdx.writers import json as json_writer
+from tests.utils_test import TestParserUtils
+
+
+def installed_backends():
+    backends = []
+    for name in json_codec.BACKENDS:
+        try:
+            json_codec.get_codec(name)
+        except ImportError:
+            continue
+        backends.append(name)
+    return backends
+
+
+json_files = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "data", "formats", "*.json")))
+
+
+@pytest.fixture(params=installed_backends())
+def codec(request):
+    json_codec.set_backend(request.param)
+    yield json_codec.get_codec()
+    json_codec.set_backend()
+
+
+def test_default_backend_is_preferred_installed():
+    json_codec.set_backend()
+    assert json_codec.backend() == installed_backends()[0]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        json_codec.set_backend("simplejson")
+
+
+def test_stdlib_codec_matches_json_module():
+    codec = json_codec.get_codec("json")
+    obj = {"name": "café", "list": [1, 2.5, None, True, {}], "empty": []}
+    assert codec.dumps(obj, pretty=True) == json.dumps(obj, indent=4)
+    assert codec.dumps(obj) == json.dumps(obj, separators=(",", ":"))
+
+
+@pytest.mark.parametrize("file_name", json_files)
+def test_codec_round_trip(codec, file_name):
+    with open(file_name, encoding="utf-8") as f:
+        text = f.read()
+    expected = json.loads(text)
+
+    assert codec.loads(text) == expected
+    assert codec.loads(text.encode("utf-8")) == expected
+    assert json.loads(codec.dumps(expected)) == expected
+    assert json.loads(codec.dumps(expected, pretty=True)) == expected
+
+
+def test_codec_default(codec):
+    created = datetime.datetime(2022, 1, 1, 12)
+    assert json.loads(codec.dumps([created], default=json_writer.json_converter)) == [str(created)]
+
+
+@pytest.mark.parametrize("file_name", json_files)
+def test_write_defaults_to_json_module(file_name):
+    json_codec.set_backend()
+    with open(file_name, encoding="utf-8") as f:
+        document, _ = jsonparser.Parser(Builder(), StandardLogger()).parse(f)
+
+    expected = io.StringIO()
+    json.dump(json_writer.Writer(document).create_document(), expected, indent=4, default=json_writer.json_converter)
+    for streaming in (False, True):
+        out = io.StringIO()
+        json_writer.write_document(document, out, validate=False, streaming=streaming)
+        assert out.getvalue() == expected.getvalue()
+
+
+@pytest.mark.parametrize("file_name", json_files)
+def test_parse_and_write_with_codec(codec, file_name):
+    with open(file_name, encoding="utf-8") as f:
+        document, _ = jsonparser.Parser(Builder(), StandardLogger()).parse(f)
+
+    written = []
+    for streaming in (False, True):
+        out = io.StringIO()
+        json_writer.write_document(document, out, validate=False, streaming=streaming)
+        written.append(out.getvalue())
+    assert written[0] == written[1]
+    assert written[0].startswith("{\n" + " " * codec.indent + '"')
+
+    compact = []
+    for streaming in (False, True):
+        out = io.StringIO()
+        json_writer.write_document(document, out, validate=False, streaming=streaming, compact=True)
+        compact.append(out.getvalue())
+    assert compact[0] == compact[1]
+    assert json.loads(compact[0]) == json.loads(written[0])
+
+    reparsed, _ = jsonparser.Parser(Builder(), StandardLogger()).parse(io.StringIO(written[0]))
+    assert TestParserUtils.to_dict(reparsed) == TestParserUtils.to_dict(document)
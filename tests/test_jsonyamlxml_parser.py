@@ -15,9 +15,14 @@ import io
 import json
 from unittest import TestCase
 
+import pytest
+import xmltodict
+
 from spdx.parsers import jsonparser, yamlparser, xmlparser
+from spdx.parsers.json_streaming import JsonReader
 from spdx.parsers.jsonyamlxmlbuilders import Builder
 from spdx.parsers.loggers import StandardLogger
+from spdx.parsers.xml_streaming import XmlDictTarget, read as read_xml
 
 from tests import utils_test
 from tests.utils_test import TestParserUtils
@@ -46,6 +51,50 @@ class TestParser(TestCase):
         expected_loc = utils_test.get_test_loc('doc_parse/expected.json')
         self.check_document(document, expected_loc)
 
+    def test_json_parser_stream(self):
+        parser = jsonparser.Parser(Builder(), StandardLogger())
+        test_file = utils_test.get_test_loc('formats/SPDXJsonExample.json')
+        with io.open(test_file, encoding='utf-8') as f:
+            document, _ = parser.parse_stream(f)
+        expected_loc = utils_test.get_test_loc('doc_parse/expected.json')
+        self.check_document(document, expected_loc)
+
+    def test_json_parser_stream_arrays_first(self):
+        # the arrays are streamed before the extracted licenses they refer to
+        test_file = utils_test.get_test_loc('formats/SPDXJsonExample.json')
+        with io.open(test_file, encoding='utf-8') as f:
+            data = json.load(f)
+        first = ['spdxVersion', 'packages', 'files', 'snippets']
+        data = dict([(key, data[key]) for key in first] + [(key, data[key]) for key in data if key not in first])
+
+        parser = jsonparser.Parser(Builder(), StandardLogger())
+        document, _ = parser.parse_stream(io.BytesIO(json.dumps(data).encode('utf-8')), chunk_size=16)
+        expected_loc = utils_test.get_test_loc('doc_parse/expected.json')
+        self.check_document(document, expected_loc)
+
+    def test_json_parser_stream_relationships_last(self):
+        test_file = utils_test.get_test_loc('formats/SPDXJSONExample-v2.3.spdx.json')
+        with io.open(test_file, encoding='utf-8') as f:
+            data = json.load(f)
+        relationships = data.pop('relationships')
+        # equal to relationships from hasFiles, which are parsed after these
+        relationships.extend(
+            {'spdxElementId': package['SPDXID'], 'relationshipType': 'CONTAINS', 'relatedSpdxElement': file_id}
+            for package in data['packages'] for file_id in package.get('hasFiles', [])
+        )
+        relationships[-1]['comment'] = 'Contained file'
+        data['relationships'] = relationships
+        text = json.dumps(data)
+
+        document, error = jsonparser.Parser(Builder(), StandardLogger()).parse(io.StringIO(text))
+        streamed_document, streamed_error = jsonparser.Parser(Builder(), StandardLogger()).parse_stream(
+            io.StringIO(text), chunk_size=16)
+
+        assert streamed_error == error
+        assert [(r.relationship, getattr(r, 'comment', None)) for r in streamed_document.relationships] == [
+            (r.relationship, getattr(r, 'comment', None)) for r in document.relationships]
+        assert TestParserUtils.to_dict(streamed_document) == TestParserUtils.to_dict(document)
+
     def test_yaml_parser(self):
         parser = yamlparser.Parser(Builder(), StandardLogger())
         test_file = utils_test.get_test_loc('formats/SPDXYamlExample.yaml')
@@ -70,3 +119,37 @@ class TestParser(TestCase):
             assert not errors
         expected_loc = utils_test.get_test_loc('doc_parse/SBOMexpected.json')
         self.check_document(document, expected_loc)
+
+
+def test_json_reader():
+    text = '{"a": 12345, "b": [1, {"c": "\u00e9\u00e9"}, [], 2.5e3], "d": {}, "e": null}'
+    reader = JsonReader(io.BytesIO(text.encode('utf-8')), chunk_size=1)
+    values = dict()
+    for key in reader.members():
+        values[key] = list(reader.elements()) if key == 'b' else reader.value()
+    reader.end()
+    assert values == json.loads(text)
+
+
+def test_json_reader_extra_data():
+    reader = JsonReader(io.StringIO('{} {}'))
+    assert list(reader.members()) == []
+    with pytest.raises(json.JSONDecodeError):
+        reader.end()
+
+
+def test_xml_dict_target():
+    text = ('<a xmlns="u" xmlns:p="v"> <b>1</b> <c/> <b x="2">3</b> <p:d p:y="4"><e>5</e>6</p:d> '
+            '<files>7</files> <f> </f></a>')
+    value = read_xml(io.BytesIO(text.encode('utf-8')), XmlDictTarget(['files']), chunk_size=3)
+    expected = xmltodict.parse(text, strip_whitespace=False)
+    expected['a']['files'] = [expected['a']['files']]
+    assert value == expected
+
+
+def test_xml_dict_target_streamed_fields():
+    text = '<Document><files><a>1</a></files><name>n</name><files><a>2</a></files><ranges/></Document>'
+    streamed = []
+    target = XmlDictTarget(['ranges'], 'Document', ['files'], lambda name, value: streamed.append((name, value)))
+    assert read_xml(io.StringIO(text), target) == {'Document': {'name': 'n', 'ranges': [None]}}
+    assert streamed == [('files', {'a': '1'}), ('files', {'a': '2'})]
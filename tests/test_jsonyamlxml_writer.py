@@ -1,20 +1,27 @@
 import glob
+import io
 import os
 from datetime import datetime
 from typing import List
 
 import pytest
+import xmltodict
 
 from spdx.checksum import Checksum, ChecksumAlgorithm
 from spdx.document import Document
 from spdx.file import File
 from spdx.license import License
 from spdx.package import Package, ExternalPackageRef, PackagePurpose
-from spdx.parsers.parse_anything import parse_file
+from spdx.parsers.parse_anything import parse_file, parse_stream
 from spdx.relationship import Relationship
 from spdx.snippet import Snippet
 from spdx.utils import update_dict_item_with_new_item
+from spdx.writers import json as json_writer
+from spdx.writers import xml as xml_writer
+from spdx.writers import yaml as yaml_writer
 from spdx.writers import write_anything
+from spdx.writers.jsonyamlxml import Writer
+from tests.utils_test import TestParserUtils
 from tests.test_rdf_writer import minimal_document_with_package
 
 tested_formats: List[str] = ['yaml', 'xml', 'json']
@@ -162,3 +169,72 @@ def test_update_dict_item_with_new_item(key, value, expected_length):
     assert key in current_state
     assert value in current_state[key]
     assert len(current_state[key]) == expected_length
+
+
+@pytest.mark.parametrize("file_name", ["SPDXJSONExample-v2.3.spdx.json", "SPDXJsonExampleEmptyArrays.json",
+                                       "SPDXTagExample-v2.2.spdx", "SPDXSBOMExample.tag"])
+def test_streaming_json_is_identical(file_name):
+    document = parse_file(os.path.join(os.path.dirname(__file__), "data", "formats", file_name))[0]
+    written = []
+    for streaming in (False, True):
+        out = io.StringIO()
+        json_writer.write_document(document, out, validate=False, streaming=streaming)
+        written.append(out.getvalue())
+
+    assert written[0] == written[1]
+
+
+@pytest.mark.parametrize("file_name", ["SPDXXMLExample-v2.3.spdx.xml", "SPDXJsonExampleEmptyArrays.json",
+                                       "SPDXTagExample-v2.2.spdx", "SPDXSBOMExample.tag"])
+def test_streaming_xml_is_identical(file_name):
+    document = parse_file(os.path.join(os.path.dirname(__file__), "data", "formats", file_name))[0]
+    written = []
+    for streaming in (False, True):
+        out = io.StringIO()
+        xml_writer.write_document(document, out, validate=False, streaming=streaming)
+        written.append(out.getvalue())
+
+    assert written[0] == written[1]
+
+
+def test_write_xml_document_object_matches_xmltodict():
+    pairs = [("a", {"@x": 1, "b": [None, "<&>", {"c": True}], "d": [], "#text": "t"}),
+             ("e", iter([{"f": 2.5}, "g"]))]
+    out = io.StringIO()
+    xml_writer.write_document_object(iter(pairs), out)
+
+    expected = {"Document": {"a": pairs[0][1], "e": [{"f": 2.5}, "g"]}}
+    assert out.getvalue() == xmltodict.unparse(expected, encoding="utf-8", pretty=True)
+
+
+@pytest.mark.parametrize("writer_module", [json_writer, yaml_writer, xml_writer])
+@pytest.mark.parametrize("file_name", ["SPDXJSONExample-v2.3.spdx.json", "SPDXSBOMExample.tag"])
+def test_compact_output(writer_module, file_name):
+    document = parse_file(os.path.join(os.path.dirname(__file__), "data", "formats", file_name))[0]
+    pretty_out = io.StringIO()
+    writer_module.write_document(document, pretty_out, validate=False)
+    compact_out = io.StringIO()
+    writer_module.write_document(document, compact_out, validate=False, compact=True)
+
+    assert len(compact_out.getvalue()) < len(pretty_out.getvalue())
+    if writer_module is not yaml_writer:
+        non_streaming_out = io.StringIO()
+        writer_module.write_document(document, non_streaming_out, validate=False, streaming=False, compact=True)
+        assert compact_out.getvalue() == non_streaming_out.getvalue()
+    pretty_document, _ = parse_stream(io.BytesIO(pretty_out.getvalue().encode("utf-8")))
+    compact_document, _ = parse_stream(io.BytesIO(compact_out.getvalue().encode("utf-8")))
+    assert TestParserUtils.to_dict(compact_document) == TestParserUtils.to_dict(pretty_document)
+
+
+def test_iter_document_matches_create_document():
+    document = minimal_document_with_package()
+    document.spdx_id = "SPDXRef-DOCUMENT"
+    document.add_file(minimal_file())
+    document.add_relationship(Relationship("SPDXRef-DOCUMENT DESCRIBES SPDXRef-Package"))
+    document.add_relationship(Relationship("SPDXRef-Package CONTAINS SPDXRef-File"))
+    expected = Writer(document).create_document()
+
+    pairs = list(Writer(document).iter_document())
+    assert [key for key, _ in pairs] == list(expected)
+    assert {key: list(value) if key in ("packages", "files") else value for key, value in pairs} == expected
+    assert expected["packages"][0]["hasFiles"] == ["SPDXRef-File"]
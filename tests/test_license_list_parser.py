@@ -0,0 +1,80 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from unittest import TestCase
+
+from spdx import utils
+from spdx.license import License, LicenseConjunction, LicenseDisjunction
+
+
+class TestCachedLicenseListParser(TestCase):
+
+    def setUp(self):
+        self.parser = utils.CachedLicenseListParser(maxsize=2)
+
+    def test_parse(self):
+        lic = self.parser.parse("MIT OR (Apache-2.0 AND LGPL-2.1-only)")
+        assert isinstance(lic, LicenseDisjunction)
+        assert isinstance(lic.license_2, LicenseConjunction)
+        assert lic.identifier == "MIT OR (Apache-2.0 AND LGPL-2.1-only)"
+
+    def test_cache_hits_and_misses(self):
+        first = self.parser.parse("MIT OR Apache-2.0")
+        second = self.parser.parse("MIT OR Apache-2.0")
+        assert first is second
+        assert self.parser.cache_info() == utils.CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    def test_least_recently_used_is_evicted(self):
+        self.parser.parse("MIT")
+        self.parser.parse("Apache-2.0")
+        self.parser.parse("MIT")
+        self.parser.parse("BSD-3-Clause")
+        assert self.parser.cache_info().currsize == 2
+        self.parser.parse("MIT")
+        assert self.parser.cache_info().hits == 2
+        self.parser.parse("Apache-2.0")
+        assert self.parser.cache_info().misses == 4
+
+    def test_cache_clear(self):
+        self.parser.parse("MIT")
+        self.parser.cache_clear()
+        assert self.parser.cache_info() == utils.CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+    def test_cached_licenses_are_frozen(self):
+        lic = self.parser.parse("MIT AND Apache-2.0")
+        with self.assertRaises(AttributeError):
+            lic.license_1 = License.from_identifier("GPL-2.0-only")
+        with self.assertRaises(AttributeError):
+            lic.license_2.full_name = "Something else"
+        assert lic.identifier == "MIT AND Apache-2.0"
+
+    def test_thread_safety(self):
+        expressions = ["MIT", "MIT OR Apache-2.0", "(MIT AND BSD-2-Clause) OR GPL-2.0-only"]
+        results = []
+
+        def work():
+            for _ in range(50):
+                results.append([self.parser.parse(expression).identifier for expression in expressions])
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(result == expressions for result in results)
+        info = self.parser.cache_info()
+        assert info.hits + info.misses == 4 * 50 * len(expressions)
+
+    def test_shared_instance(self):
+        assert utils.get_license_list_parser() is utils.get_license_list_parser()
@@ -10,11 +10,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+import io
 import os
+import subprocess
+import sys
 
 import pytest
 
 from spdx.parsers import parse_anything
+from spdx.parsers.builderexceptions import FileTypeError
+from tests.utils_test import TestParserUtils
 
 dirname = os.path.join(os.path.dirname(__file__), "data", "formats")
 # Some rdf examples still cause issues
@@ -32,3 +38,33 @@ def test_parse_anything(test_file):
     assert doc.comment in (None, 'This is a sample spreadsheet', 'Sample Comment',
                            'This document was created using SPDX 2.0 using licenses from the web site.')
     assert len(doc.packages) in (1, 2, 3, 4)
+
+
+@pytest.mark.parametrize("test_file", test_files)
+def test_parse_stream(test_file):
+    with open(test_file, "rb") as f:
+        data = f.read()
+    expected_format = parse_anything.format_of_name(test_file)
+    assert parse_anything.sniff_format(data[:parse_anything.SNIFF_SIZE].decode("utf-8")) == expected_format
+
+    doc, error = parse_anything.parse_file(test_file)
+    streamed_doc, streamed_error = parse_anything.parse_stream(io.BytesIO(data))
+    assert streamed_error == error
+    assert TestParserUtils.to_dict(streamed_doc) == TestParserUtils.to_dict(doc)
+
+    compressed_doc, _ = parse_anything.parse_bytes(gzip.compress(data))
+    assert TestParserUtils.to_dict(compressed_doc) == TestParserUtils.to_dict(doc)
+
+
+def test_sniff_unknown_format():
+    with pytest.raises(FileTypeError):
+        parse_anything.sniff_format("name,version\nspdx,1.0\n")
+
+
+def test_format_libraries_imported_on_first_use():
+    script = ("import sys\nfrom spdx.parsers import parse_anything\nfrom spdx.writers import write_anything\n"
+              "parse_anything.parse_file({0!r})\n"
+              "print(' '.join(m for m in ('rdflib', 'yaml', 'xmltodict') if m in sys.modules))")
+    json_file = os.path.join(dirname, "SPDXJSONExample-v2.3.spdx.json")
+    out = subprocess.run([sys.executable, "-c", script.format(json_file)], check=True, capture_output=True, text=True)
+    assert out.stdout.split() == []
@@ -0,0 +1,44 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import TestCase
+
+from spdx import utils
+from spdx.parsers import licenselist_parsetab
+from spdx.parsers import tables
+from spdx.parsers import tagvalue
+from spdx.parsers import tagvalue_parsetab
+from spdx.parsers.loggers import StandardLogger
+from spdx.parsers.tagvaluebuilders import Builder
+
+
+class TestParserTables(TestCase):
+
+    def test_shipped_tables_are_up_to_date(self):
+        assert tables.stale_tables() == [], "run `python -m spdx.parsers.tables`"
+
+    def test_tagvalue_parser_uses_shipped_table(self):
+        p = tagvalue.Parser(Builder(), StandardLogger())
+        p.build()
+        assert p.yacc.action is tagvalue_parsetab._lr_action
+
+    def test_license_list_parser_uses_shipped_table(self):
+        p = utils.LicenseListParser()
+        p.build()
+        assert p.yacc.action is licenselist_parsetab._lr_action
+
+    def test_changed_grammar_is_detected(self):
+        p = utils.LicenseListParser()
+        signature = tables.grammar_signature(p)
+        p.p_license_atom_1 = lambda p_: None
+        p.p_license_atom_1.__doc__ = "license_atom : LICENSE LICENSE"
+        assert tables.grammar_signature(p) != signature
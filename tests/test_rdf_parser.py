@@ -12,12 +12,20 @@
 
 import io
 import json
+import os
+import pathlib
+import tempfile
 import unittest
 from collections import OrderedDict
 
+from rdflib import Graph
+
 from spdx.parsers import rdf
+from spdx.parsers import rdf_sax
 from spdx.parsers.loggers import StandardLogger
 from spdx.parsers.rdfbuilders import Builder as RDFBuilder
+from spdx.rdf_index import TripleIndex
+from spdx.writers import rdf as rdf_writer
 
 from tests import utils_test
 from tests.utils_test import TestParserUtils
@@ -46,3 +54,134 @@ class TestParser(unittest.TestCase):
             expected = json.load(ex, object_pairs_hook=OrderedDict)
 
         assert result == expected
+
+    def test_rdf_parser_without_index(self):
+        parser = rdf.Parser(RDFBuilder(), StandardLogger())
+        test_file = utils_test.get_test_loc('formats/SPDXRdfExample.rdf', test_data_dir=utils_test.test_data_dir)
+        graph = Graph()
+        with io.open(test_file, 'rb') as f:
+            graph.parse(file=f, format="xml")
+        document, _ = parser.parse_graph(graph)
+        expected_loc = utils_test.get_test_loc('doc_parse/spdx-expected.json', test_data_dir=utils_test.test_data_dir)
+        self.check_document(document, expected_loc)
+
+
+class TestTripleIndex(unittest.TestCase):
+
+    def setUp(self):
+        test_file = utils_test.get_test_loc('formats/SPDXRdfExample.rdf', test_data_dir=utils_test.test_data_dir)
+        self.graph = rdf.IndexedGraph()
+        with io.open(test_file, 'rb') as f:
+            self.graph.parse(file=f, format="xml")
+        self.index = self.graph.index
+
+    def test_same_triples_as_graph(self):
+        assert sorted(self.index.triples((None, None, None))) == sorted(self.graph.triples((None, None, None)))
+
+    def test_same_answers_as_graph_in_the_same_order(self):
+        subjects = list(self.index.spo)[:20]
+        predicates = list(self.index.pos)
+        objects = list(self.index.osp)[:20]
+        patterns = [(s, p, None) for s in subjects for p in predicates]
+        patterns += [(s, None, None) for s in subjects]
+        patterns += [(None, p, None) for p in predicates]
+        patterns += [(None, p, o) for p in predicates for o in objects]
+        patterns += [(None, None, o) for o in objects]
+        patterns += [(s, p, o) for s, p, o in list(self.graph)[:20]]
+        for pattern in patterns:
+            assert list(self.index.triples(pattern)) == list(self.graph.triples(pattern)), pattern
+            assert (pattern in self.index) == (pattern in self.graph), pattern
+
+
+class TestSax(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        test_file = utils_test.get_test_loc('formats/SPDXRdfExample.rdf', test_data_dir=utils_test.test_data_dir)
+        with io.open(test_file, 'r', encoding='utf-8') as f:
+            self.text = f.read()
+        # the example has a stray '>' after a node element, which rdflib skips
+        self.supported = self.text.replace('#SPDXRef-File1">>', '#SPDXRef-File1">')
+        self.expected_loc = utils_test.get_test_loc('doc_parse/spdx-expected.json',
+                                                    test_data_dir=utils_test.test_data_dir)
+
+    def parse(self, fil, sax=True):
+        return rdf.Parser(RDFBuilder(), StandardLogger()).parse(fil, sax=sax)
+
+    def test_sax_reads_every_triple(self):
+        graph = Graph()
+        graph.parse(data=self.supported, format="xml")
+        index = TripleIndex()
+        rdf_sax.read(io.StringIO(self.supported), index, chunk_size=100)
+        assert len(list(index.triples((None, None, None)))) == len(graph)
+        for predicate in set(graph.predicates()):
+            assert len(list(index.triples((None, predicate, None)))) == len(list(graph.triples((None, predicate, None))))
+
+    def test_same_document_as_rdflib(self):
+        for make_file in (io.StringIO, lambda text: io.BytesIO(text.encode('utf-8'))):
+            document, error = self.parse(make_file(self.supported))
+            expected, expected_error = self.parse(make_file(self.supported), sax=False)
+            assert error == expected_error
+            assert TestParserUtils.to_dict(document) == TestParserUtils.to_dict(expected)
+        self.check_document(document)
+
+    def test_written_document(self):
+        document, _ = self.parse(io.StringIO(self.text), sax=False)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'written.rdf')
+            with open(path, 'wb') as out:
+                rdf_writer.write_document(document, out, validate=False)
+            with open(path, 'rb') as f:
+                rdf_sax.read(f, TripleIndex(), pathlib.Path(path).absolute().as_uri())
+            with open(path, 'rb') as f:
+                read, error = self.parse(f)
+            with open(path, 'rb') as f:
+                expected, expected_error = self.parse(f, sax=False)
+        assert error == expected_error
+        assert TestParserUtils.to_dict(read) == TestParserUtils.to_dict(expected)
+
+    def test_unsupported_layout_falls_back_to_rdflib(self):
+        texts = [
+            self.text,
+            self.supported.replace('<rdf:RDF', '<rdf:RDF xml:base="http://spdx.org/rdf/terms"', 1),
+        ]
+        for text in texts:
+            with self.assertRaises(rdf_sax.UnsupportedRdfXml):
+                rdf_sax.read(io.StringIO(text), TripleIndex())
+            document, error = self.parse(io.StringIO(text))
+            expected, expected_error = self.parse(io.StringIO(text), sax=False)
+            assert error == expected_error
+            assert TestParserUtils.to_dict(document) == TestParserUtils.to_dict(expected)
+
+    def test_unseekable_file(self):
+        class Unseekable(io.BytesIO):
+            def seekable(self):
+                return False
+
+        document, _ = self.parse(Unseekable(self.text.encode('utf-8')))
+        self.check_document(document)
+
+        spool_size = rdf.SPOOL_SIZE
+        rdf.SPOOL_SIZE = 1000
+        try:
+            for text in (self.text, self.supported):
+                copy = rdf.spooled_copy(Unseekable(text.encode('utf-8')))
+                assert copy._rolled
+                copy.close()
+                document, _ = self.parse(Unseekable(text.encode('utf-8')))
+                self.check_document(document)
+        finally:
+            rdf.SPOOL_SIZE = spool_size
+
+    def test_file_named_by_descriptor(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'example.rdf')
+            with open(path, 'w', encoding='utf-8') as out:
+                out.write(self.supported)
+            for sax in (True, False):
+                with os.fdopen(os.open(path, os.O_RDONLY), 'rb') as f:
+                    document, _ = self.parse(f, sax=sax)
+                self.check_document(document)
+
+    def check_document(self, document):
+        TestParser().check_document(document, self.expected_loc)
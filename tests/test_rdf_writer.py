@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 from typing import Optional
 from unittest import TestCase
 
@@ -6,13 +8,15 @@ import pytest
 from rdflib import URIRef
 
 from spdx.document import Document
+from spdx.file import File
 from spdx.license import License
 from spdx.package import Package, ExternalPackageRef
 from spdx.parsers.loggers import StandardLogger
 from spdx.parsers.parse_anything import parse_file
 from spdx.parsers.rdf import Parser
 from spdx.parsers.rdfbuilders import Builder
-from spdx.utils import NoAssert
+from spdx.relationship import Relationship
+from spdx.utils import NoAssert, get_files_by_package, get_files_in_package
 from spdx.writers.rdf import Writer
 
 
@@ -93,6 +97,46 @@ def test_multiple_packages_in_one_document(temporary_file_path) -> None:
     assert second_package.version == "2.3"
 
 
+def test_package_files_and_file_dependencies(temporary_file_path) -> None:
+    document: Document = minimal_document_with_package()
+    for name in ("./a", "./b", "./c"):
+        file = File(name, spdx_id="SPDXRef-" + name[2:])
+        file.conc_lics = NoAssert()
+        file.copyright = NoAssert()
+        document.add_file(file)
+    document.files[0].dependencies = ["./b", "./missing"]
+    document.add_relationship(Relationship("SPDXRef-Package CONTAINS SPDXRef-a"))
+    document.add_relationship(Relationship("SPDXRef-c CONTAINED_BY SPDXRef-Package"))
+
+    with open(temporary_file_path, "wb") as out:
+        writer = Writer(document, out)
+        writer.write()
+
+    assert writer.file_nodes_by_spdx_id["SPDXRef-b"] == URIRef("http://www.spdx.org/files#SPDXRef-b")
+    assert list(writer.graph.objects(writer.file_nodes_by_spdx_id["SPDXRef-a"], writer.spdx_namespace.fileDependency)) \
+        == [writer.file_nodes_by_spdx_id["SPDXRef-b"]]
+    package_node = URIRef("http://www.spdx.org/tools#SPDXRef-Package")
+    assert sorted(writer.graph.objects(package_node, writer.spdx_namespace.hasFile)) == [
+        writer.file_nodes_by_spdx_id["SPDXRef-a"], writer.file_nodes_by_spdx_id["SPDXRef-c"]
+    ]
+
+
+def test_get_files_by_package() -> None:
+    files = [File("./" + name, spdx_id="SPDXRef-" + name) for name in "abcd"]
+    relationships = [
+        Relationship("SPDXRef-p CONTAINS SPDXRef-c"),
+        Relationship("SPDXRef-p CONTAINS SPDXRef-a"),
+        Relationship("SPDXRef-a CONTAINED_BY SPDXRef-p"),
+        Relationship("SPDXRef-b CONTAINED_BY SPDXRef-q"),
+        Relationship("SPDXRef-q DEPENDS_ON SPDXRef-d"),
+        Relationship("SPDXRef-q CONTAINS SPDXRef-p"),
+    ]
+    files_by_package = get_files_by_package(files, relationships)
+    for package_spdx_id in ("SPDXRef-p", "SPDXRef-q", "SPDXRef-r"):
+        package = Package(spdx_id=package_spdx_id)
+        assert files_by_package.get(package_spdx_id, []) == get_files_in_package(package, files, relationships)
+
+
 def minimal_document_with_package() -> Document:
     document = Document(data_license=License.from_identifier('CC0-1.0'))
     document.creation_info.set_created_now()
@@ -115,3 +159,9 @@ def get_package_by_spdx_id(package_spdx_id: str, document: Document) -> Optional
         if package.spdx_id == package_spdx_id:
             return package
     return None
+
+
+def test_writer_does_not_import_the_parser():
+    script = "import sys\nimport spdx.writers.rdf\nprint('spdx.parsers.rdf' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)
+    assert out.stdout.strip() == "False"
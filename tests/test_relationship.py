@@ -0,0 +1,110 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from spdx.document import Document
+from spdx.file import File
+from spdx.parsers.loggers import ErrorMessages
+from spdx.relationship import Relationship, RelationshipGraph, RelationshipType
+
+
+def test_relationship_graph():
+    graph = RelationshipGraph([
+        Relationship("SPDXRef-A DEPENDS_ON SPDXRef-B"),
+        Relationship("SPDXRef-B DEPENDS_ON SPDXRef-C"),
+        Relationship("SPDXRef-D DEPENDENCY_OF SPDXRef-C"),
+        Relationship("SPDXRef-C DEPENDS_ON SPDXRef-A"),
+        Relationship("SPDXRef-A DEPENDS_ON SPDXRef-B"),
+        Relationship("SPDXRef-A UNKNOWN SPDXRef-E"),
+        Relationship("SPDXRef-A"),
+    ])
+
+    assert graph.related("SPDXRef-A", RelationshipType.DEPENDS_ON) == ["SPDXRef-B"]
+    assert graph.relating("SPDXRef-B", RelationshipType.DEPENDS_ON) == ["SPDXRef-A"]
+    assert graph.related("SPDXRef-A", RelationshipType.CONTAINS) == []
+    assert graph.dependencies("SPDXRef-A") == ["SPDXRef-B", "SPDXRef-C", "SPDXRef-D"]
+    assert graph.dependencies("SPDXRef-D") == []
+    assert graph.dependents("SPDXRef-D") == ["SPDXRef-C", "SPDXRef-B", "SPDXRef-A"]
+
+
+def test_document_relationship_graph():
+    doc = Document()
+    for name in ["a", "b", "c"]:
+        doc.add_file(File(name, spdx_id="SPDXRef-" + name))
+    doc.add_relationship(Relationship("SPDXRef-Package CONTAINS SPDXRef-b"))
+    doc.add_relationship(Relationship("SPDXRef-a CONTAINED_BY SPDXRef-Package"))
+    assert doc.get_contained_files("SPDXRef-Package") == [doc.files[1], doc.files[0]]
+
+    doc.add_relationship(Relationship("SPDXRef-Package CONTAINS SPDXRef-Missing"))
+    doc.add_relationship(Relationship("SPDXRef-Package CONTAINS SPDXRef-c"))
+    assert doc.get_contained_files("SPDXRef-Package") == [doc.files[1], doc.files[2], doc.files[0]]
+
+    doc.relationships = doc.relationships[2:]
+    assert doc.get_relationship_graph().contained("SPDXRef-Package") == ["SPDXRef-Missing", "SPDXRef-c"]
+
+
+def test_document_relationship_graph_after_changes():
+    doc = Document()
+    doc.add_relationship(Relationship("SPDXRef-A DEPENDS_ON SPDXRef-B"))
+    assert doc.get_relationship_graph().dependencies("SPDXRef-A") == ["SPDXRef-B"]
+
+    doc.relationships.pop()
+    doc.add_relationship(Relationship("SPDXRef-A DEPENDS_ON SPDXRef-C"))
+    assert doc.get_relationship_graph().dependencies("SPDXRef-A") == ["SPDXRef-C"]
+
+    doc.relationships[0].relationship_type = "CONTAINS"
+    assert doc.get_relationship_graph().dependencies("SPDXRef-A") == []
+    assert doc.get_relationship_graph().contained("SPDXRef-A") == ["SPDXRef-C"]
+
+    doc.relationships[0].relationship = "SPDXRef-C DEPENDS_ON SPDXRef-A"
+    assert doc.get_relationship_graph().dependents("SPDXRef-A") == ["SPDXRef-C"]
+
+
+def test_relationship_changes_only_rebuild_their_graphs():
+    added = []
+
+    class CountingGraph(RelationshipGraph):
+        def add(self, relationship):
+            added.append(relationship)
+            super(CountingGraph, self).add(relationship)
+
+    doc = Document()
+    doc._relationship_graph = CountingGraph()
+    doc.add_relationship(Relationship("SPDXRef-A DEPENDS_ON SPDXRef-B"))
+    other_doc = Document()
+    other_doc.add_relationship(Relationship("SPDXRef-C DEPENDS_ON SPDXRef-D"))
+    other_doc.get_relationship_graph()
+    doc.get_relationship_graph()
+
+    other_doc.relationships[0].relationship_type = "CONTAINS"
+    Relationship("SPDXRef-E DEPENDS_ON SPDXRef-F").relationship = "SPDXRef-E CONTAINS SPDXRef-F"
+    assert doc.get_relationship_graph().dependencies("SPDXRef-A") == ["SPDXRef-B"]
+    assert len(added) == 1
+    assert other_doc.get_relationship_graph().contained("SPDXRef-C") == ["SPDXRef-D"]
+
+
+def test_relationship_parsed_once():
+    relationship = Relationship("SPDXRef-A CONTAINS SPDXRef-B", "comment")
+    assert relationship.spdx_element_id == "SPDXRef-A"
+    assert relationship.type is RelationshipType.CONTAINS
+    assert relationship.relationship_type == "CONTAINS"
+    assert relationship.related_spdx_element == "SPDXRef-B"
+
+    relationship.relationship_type = "DEPENDS_ON"
+    assert relationship.relationship == "SPDXRef-A DEPENDS_ON SPDXRef-B"
+    assert relationship == Relationship("SPDXRef-A DEPENDS_ON SPDXRef-B")
+
+    unknown = Relationship("SPDXRef-A UNKNOWN SPDXRef-B")
+    assert unknown.type is None
+    assert unknown.relationship == "SPDXRef-A UNKNOWN SPDXRef-B"
+    assert len(unknown.validate(ErrorMessages()).messages) == 1
+    assert Relationship().relationship is None
+    assert Relationship("SPDXRef-A").relationship == "SPDXRef-A"
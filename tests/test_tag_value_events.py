@@ -0,0 +1,175 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+from unittest import TestCase
+
+import pytest
+
+from spdx.parsers.loggers import StandardLogger
+from spdx.parsers.tagvalue import Parser
+from spdx.parsers.tagvalue_events import TagValueHandler
+from spdx.parsers.tagvaluebuilders import Builder
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data", "formats")
+
+DOCUMENT = """SPDXVersion: SPDX-2.3
+DataLicense: CC0-1.0
+DocumentNamespace: https://spdx.org/spdxdocs/events
+DocumentName: events
+SPDXID: SPDXRef-DOCUMENT
+Creator: Tool: test
+Created: 2022-01-01T00:00:00Z
+
+PackageName: p
+SPDXID: SPDXRef-p
+PackageDownloadLocation: NOASSERTION
+FilesAnalyzed: false
+PackageLicenseConcluded: NOASSERTION
+PackageLicenseDeclared: NOASSERTION
+PackageCopyrightText: NOASSERTION
+
+FileName: ./a
+SPDXID: SPDXRef-a
+FileChecksum: SHA1: d6a770ba38583ed4bb4525bd96e50461655d2758
+LicenseConcluded: MIT
+LicenseInfoInFile: MIT
+FileCopyrightText: NOASSERTION
+
+FileName: ./b
+SPDXID: SPDXRef-b
+FileChecksum: SHA1: 0000000000000000000000000000000000000000
+LicenseConcluded: Apache-2.0
+LicenseInfoInFile: Apache-2.0
+FileCopyrightText: NOASSERTION
+
+Relationship: SPDXRef-DOCUMENT DESCRIBES SPDXRef-p
+Relationship: SPDXRef-p CONTAINS SPDXRef-a
+"""
+
+
+class RecordingHandler(TagValueHandler):
+
+    def __init__(self, parser):
+        self.parser = parser
+        self.events = []
+        self.largest_list = 0
+
+    def record(self, kind, element):
+        doc = self.parser.document
+        self.largest_list = max(self.largest_list, len(doc.packages), len(doc.files), len(doc.relationships))
+        self.events.append((kind, element))
+
+    def on_package(self, package):
+        self.record("package", package)
+
+    def on_file(self, file):
+        self.record("file", file)
+
+    def on_snippet(self, snippet):
+        self.record("snippet", snippet)
+
+    def on_relationship(self, relationship):
+        self.record("relationship", relationship)
+
+    def on_annotation(self, annotation):
+        self.record("annotation", annotation)
+
+    def on_review(self, review):
+        self.record("review", review)
+
+    def on_extracted_license(self, extracted_license):
+        self.record("extracted_license", extracted_license)
+
+    def on_document(self, document):
+        self.record("document", document)
+
+
+def new_parser():
+    parser = Parser(Builder(), StandardLogger())
+    parser.build()
+    return parser
+
+
+class TestParseEvents(TestCase):
+
+    def setUp(self):
+        self.parser = new_parser()
+        self.handler = RecordingHandler(self.parser)
+
+    def test_events(self):
+        doc, error = self.parser.parse_events(io.StringIO(DOCUMENT), self.handler)
+        assert not error
+        assert [(kind, getattr(element, "spdx_id", None)) for kind, element in self.handler.events] == [
+            ("file", "SPDXRef-a"),
+            ("relationship", None),
+            ("relationship", None),
+            ("relationship", None),
+            ("file", "SPDXRef-b"),
+            ("package", "SPDXRef-p"),
+            ("document", "SPDXRef-DOCUMENT"),
+        ]
+        # the last relationship repeats the first one
+        relationships = [element.relationship for kind, element in self.handler.events if kind == "relationship"]
+        assert relationships == [
+            "SPDXRef-p CONTAINS SPDXRef-a", "SPDXRef-p CONTAINS SPDXRef-b", "SPDXRef-DOCUMENT DESCRIBES SPDXRef-p",
+        ]
+        files = [element for kind, element in self.handler.events if kind == "file"]
+        assert files[1].conc_lics.identifier == "Apache-2.0"
+        assert doc.name == "events"
+        assert doc.files == [] and doc.packages == [] and doc.relationships == []
+
+    def test_only_one_element_of_a_kind_is_kept(self):
+        self.parser.parse_events(io.StringIO(DOCUMENT), self.handler)
+        assert self.handler.largest_list == 1
+
+    def test_validation_messages(self):
+        text = DOCUMENT.replace("SPDXID: SPDXRef-b\n", "")
+        serial_messages = []
+        event_messages = []
+        serial = Parser(Builder(), StandardLogger())
+        serial.logger.log = serial_messages.append
+        serial.build()
+        self.parser.logger.log = event_messages.append
+
+        _, serial_error = serial.parse(text)
+        _, event_error = self.parser.parse_events(io.StringIO(text), self.handler)
+
+        assert serial_error and event_error
+        assert event_messages == serial_messages == ["events: ./b: File has no SPDX Identifier."]
+
+
+@pytest.mark.parametrize("file_name", [
+    "SPDXTagExample.tag", "SPDXSimpleTag.tag", "SPDXSBOMExample.tag",
+    "SPDXTagExample-v2.2.spdx", "SPDXTagExample-v2.3.spdx",
+])
+def test_same_elements_as_parse(file_name):
+    with open(os.path.join(DATA_DIR, file_name)) as f:
+        doc, error = new_parser().parse(f.read())
+    parser = new_parser()
+    handler = RecordingHandler(parser)
+    with open(os.path.join(DATA_DIR, file_name)) as f:
+        _, event_error = parser.parse_events(f, handler)
+
+    assert event_error == error
+
+    def reported(kind):
+        return [element for event_kind, element in handler.events if event_kind == kind]
+
+    assert [p.spdx_id for p in reported("package")] == [p.spdx_id for p in doc.packages]
+    assert [f.spdx_id for f in reported("file")] == [f.spdx_id for f in doc.files]
+    assert [s.spdx_id for s in reported("snippet")] == [s.spdx_id for s in doc.snippet]
+    assert len(reported("annotation")) == len(doc.annotations)
+    assert len(reported("review")) == len(doc.reviews)
+    assert [lic.identifier for lic in reported("extracted_license")] == [lic.identifier for lic in doc.extracted_licenses]
+    assert sorted(r.relationship for r in reported("relationship")) == sorted(r.relationship for r in doc.relationships)
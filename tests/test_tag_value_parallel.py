@@ -0,0 +1,134 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+from unittest import TestCase
+
+import pytest
+
+from spdx.parsers import tagvalue_parallel
+from spdx.parsers.loggers import StandardLogger
+from spdx.parsers.tagvalue import Parser
+from spdx.parsers.tagvaluebuilders import Builder
+from spdx.relationship import Relationship
+from spdx.document import Document
+from spdx.writers import tagvalue as tagvalue_writer
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data", "formats")
+
+HEADER = """SPDXVersion: SPDX-2.3
+DataLicense: CC0-1.0
+DocumentNamespace: https://spdx.org/spdxdocs/parallel
+DocumentName: parallel
+SPDXID: SPDXRef-DOCUMENT
+Creator: Tool: test
+Created: 2022-01-01T00:00:00Z
+"""
+
+
+def new_parser():
+    parser = Parser(Builder(), StandardLogger())
+    parser.build()
+    return parser
+
+
+def write(doc):
+    out = io.StringIO()
+    tagvalue_writer.write_document(doc, out, validate=False)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("file_name", [
+    "SPDXTagExample.tag", "SPDXSimpleTag.tag", "SPDXSBOMExample.tag",
+    "SPDXTagExample-v2.2.spdx", "SPDXTagExample-v2.3.spdx",
+])
+def test_same_document_as_serial_parse(file_name):
+    with open(os.path.join(DATA_DIR, file_name)) as f:
+        text = f.read()
+    assert len(tagvalue_parallel.plan_shards(text, shard_size=1)) > 1
+
+    serial_doc, serial_error = new_parser().parse(text)
+    parallel_doc, parallel_error = new_parser().parse_parallel(text, max_workers=2, shard_size=1)
+
+    assert parallel_error == serial_error
+    assert write(parallel_doc) == write(serial_doc)
+
+
+class TestPlanShards(TestCase):
+
+    def test_shards_start_at_sections(self):
+        text = HEADER + "FileName: ./a\nSPDXID: SPDXRef-a\n\nFileName: ./b\nSPDXID: SPDXRef-b\n"
+        shards = tagvalue_parallel.plan_shards(text, shard_size=1)
+        assert len(shards) == 2
+        assert shards[0] == [(0, text.index("FileName: ./b"), 1, True)]
+        assert shards[1] == [(0, len(HEADER), 1, False), (text.index("FileName: ./b"), len(text), 11, True)]
+
+    def test_package_is_replayed_for_its_files(self):
+        text = HEADER + "PackageName: p\nSPDXID: SPDXRef-p\n\nFileName: ./a\nSPDXID: SPDXRef-a\n"
+        shards = tagvalue_parallel.plan_shards(text, shard_size=1)
+        package_start = len(HEADER)
+        file_start = text.index("FileName")
+        assert shards[1] == [
+            (0, package_start, 1, False),
+            (package_start, file_start, 8, False),
+            (file_start, len(text), 11, True),
+        ]
+
+    def test_small_shards_are_joined(self):
+        text = HEADER + "FileName: ./a\nSPDXID: SPDXRef-a\n\nFileName: ./b\nSPDXID: SPDXRef-b\n"
+        assert tagvalue_parallel.plan_shards(text, shard_size=len(text)) is None
+
+    def test_no_split_before_tags_of_previous_section(self):
+        text = HEADER + "FileName: ./a\nSPDXID: SPDXRef-a\nFileName: ./b\nFileComment: <text>b</text>\n"
+        # FileComment refers to ./b, but so would a FileChecksum without a
+        # preceding FileName, which rules out the split
+        assert tagvalue_parallel.plan_shards(text, shard_size=1) is not None
+        text = HEADER + "PackageName: p\nSPDXID: SPDXRef-p\nFileName: ./a\nPackageComment: <text>p</text>\n"
+        assert tagvalue_parallel.plan_shards(text, shard_size=1) is None
+
+    def test_document_tags_after_first_section(self):
+        text = HEADER + "FileName: ./a\nSPDXID: SPDXRef-a\nFileName: ./b\nDocumentComment: <text>c</text>\n"
+        assert tagvalue_parallel.plan_shards(text, shard_size=1) is None
+
+    def test_unknown_tag(self):
+        text = HEADER + "FileName: ./a\nSPDXID: SPDXRef-a\nFileName: ./b\nNoSuchTag: value\n"
+        assert tagvalue_parallel.plan_shards(text, shard_size=1) is None
+
+
+class TestParseParallel(TestCase):
+
+    def test_error_falls_back_to_serial_parse(self):
+        text = HEADER + "FileName: ./a\nSPDXID: SPDXRef-a\n\nFileName: ./b\nSPDXID: SPDXRef-b\nLicenseConcluded: (\n"
+        serial_doc, serial_error = new_parser().parse(text)
+        parallel_doc, parallel_error = new_parser().parse_parallel(text, max_workers=2, shard_size=1)
+        assert serial_error and parallel_error
+        assert [f.name for f in parallel_doc.files] == [f.name for f in serial_doc.files]
+
+    def test_parse_shard_keeps_replaced_relationships(self):
+        # the replaced relationships are freed while the shard is parsed and
+        # new elements may be allocated at their addresses
+        header = HEADER + "".join("Relationship: SPDXRef-DOCUMENT DESCRIBES SPDXRef-{0}\n".format(i) for i in range(50))
+        section = "FileName: ./a\nSPDXID: SPDXRef-a\n" + "".join(
+            "Relationship: SPDXRef-DOCUMENT DESCRIBES SPDXRef-{0}\nRelationship: SPDXRef-a CONTAINS SPDXRef-{0}\n".format(i)
+            for i in range(50))
+        result = tagvalue_parallel.parse_shard(Builder, "ply", [(header, 1, False), (section, 60, True)])
+        assert len(result["relationships"]) == 100
+
+    def test_merge_relationships_moves_repeated_relationship_to_the_end(self):
+        doc = Document()
+        doc.relationships = [Relationship("SPDXRef-a CONTAINS SPDXRef-b"), Relationship("SPDXRef-a CONTAINS SPDXRef-c")]
+        tagvalue_parallel.merge_relationships(doc, [Relationship("SPDXRef-a CONTAINS SPDXRef-b"),
+                                                    Relationship("SPDXRef-c CONTAINS SPDXRef-d")])
+        assert [r.relationship for r in doc.relationships] == [
+            "SPDXRef-a CONTAINS SPDXRef-c", "SPDXRef-a CONTAINS SPDXRef-b", "SPDXRef-c CONTAINS SPDXRef-d",
+        ]
@@ -10,6 +10,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import os
 import sys
 from datetime import datetime
 from unittest import TestCase
@@ -18,7 +20,7 @@ import spdx
 from spdx import utils
 from spdx.package import PackagePurpose
 from spdx.parsers.tagvalue import Parser
-from spdx.parsers.lexers.tagvalue import Lexer
+from spdx.parsers.lexers.tagvalue import FastLexer, Lexer, split_chunks
 from spdx.parsers.tagvaluebuilders import Builder
 from spdx.parsers.loggers import StandardLogger
 from spdx.version import Version
@@ -122,9 +124,10 @@ document_str_with_empty_line = "\n".join(
 
 class TestLexer(TestCase):
     maxDiff = None
+    lexer_class = Lexer
 
     def setUp(self):
-        self.l = Lexer()
+        self.l = self.lexer_class()
         self.l.build()
 
     def test_document(self):
@@ -303,6 +306,50 @@ class TestLexer(TestCase):
         self.token_assert_helper(self.l.token(), 'DOC_LICENSE', 'DataLicense', 3)
         self.token_assert_helper(self.l.token(), 'LINE', 'CC0-1.0', 3)
 
+    def test_same_tokens_as_ply_lexer(self):
+        tricky_str = '\n'.join([
+            'PackageComment:',
+            '',
+            '<text>multi line',
+            'FileName: not a tag',
+            '</text>',
+            'Creator:',
+            'Tool: SomeTool',
+            '# comment: <text>',
+            'ExternalDocumentRef:DocumentRef-spdx-tool-2.1',
+            'http://spdx.org/spdxdocs/spdx-tools-v2.1 SHA1: d6a770ba38583ed4bb4525bd96e50461655d2759',
+        ])
+        dirname = os.path.join(os.path.dirname(__file__), 'data', 'formats')
+        with open(os.path.join(dirname, 'SPDXTagExample-v2.3.spdx')) as f:
+            example_str = f.read()
+        for data in (tricky_str, example_str):
+            self.l = Lexer()
+            self.l.build()
+            self.l.input(data)
+            expected = self.all_tokens()
+            self.setUp()
+            self.l.input(data)
+            assert self.all_tokens() == expected
+            # positions are relative to the chunk when streaming
+            expected = [token[:3] for token in expected]
+            self.setUp()
+            self.l.input_stream(io.StringIO(data), chunk_size=1)
+            assert [token[:3] for token in self.all_tokens()] == expected
+
+    def test_split_chunks(self):
+        chunks = list(split_chunks(io.StringIO(document_str), chunk_size=1))
+        assert ''.join(chunks) == document_str
+        assert chunks[0] == 'SPDXVersion: SPDX-2.1\n'
+        assert len(chunks) == 6
+
+    def all_tokens(self):
+        tokens = []
+        token = self.l.token()
+        while token is not None:
+            tokens.append((token.type, token.value, token.lineno, token.lexpos))
+            token = self.l.token()
+        return tokens
+
     def token_assert_helper(self, token, ttype, value, line):
         assert token.type == ttype
         assert token.value == value
@@ -311,12 +358,13 @@ class TestLexer(TestCase):
 
 class TestParser(TestCase):
     maxDiff = None
+    lexer_backend = 'ply'
     complete_str = '{0}\n{1}\n{2}\n{3}\n{4}\n{5}\n{6}'.format(document_str, creation_str, review_str, package_str,
                                                               file_str, annotation_str, snippet_str)
 
     def setUp(self):
         self.p = Parser(Builder(), StandardLogger())
-        self.p.build()
+        self.p.build(lexer_backend=self.lexer_backend)
 
     def test_doc(self):
         document, error = self.p.parse(self.complete_str)
@@ -329,6 +377,15 @@ class TestParser(TestCase):
         assert document.comment == 'Sample Comment'
         assert document.namespace == 'https://spdx.org/spdxdocs/spdx-example-444504E0-4F89-41D3-9A0C-0305E82C3301'
 
+    def test_parse_stream(self):
+        document, error = self.p.parse_stream(io.StringIO(self.complete_str), chunk_size=1)
+        assert not error
+        assert document.name == 'Sample_Document-V2.1'
+        assert len(document.packages) == 1
+        assert len(document.files) == 1
+        assert document.files[0].comment == 'Very long file'
+        assert document.snippet[-1].spdx_id == 'SPDXRef-Snippet'
+
     def test_creation_info(self):
         document, error = self.p.parse(self.complete_str)
         assert document is not None
@@ -421,3 +478,11 @@ class TestParser(TestCase):
         assert document.snippet[-1].byte_range[1] == 420
         assert document.snippet[-1].line_range[0] == 5
         assert document.snippet[-1].line_range[1] == 7
+
+
+class TestFastLexer(TestLexer):
+    lexer_class = FastLexer
+
+
+class TestParserWithFastLexer(TestParser):
+    lexer_backend = 'fast'
@@ -10,6 +10,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import os
 
 import pytest
@@ -82,3 +83,27 @@ def write_anything_test(in_basename, in_file, out_format, tmpdir):
         # if this test fails, this means we are more stable \o/
         # in that case, please remove the test from UNSTABLE_CONVERSIONS list
         assert result_out != result_in, test
+
+
+@pytest.mark.parametrize("out_format", ["json", "yaml", "xml", "tag"])
+def test_write_stream(out_format, tmpdir):
+    doc, _ = parse_anything.parse_file(os.path.join(dirname, "SPDXJSONExample-v2.3.spdx.json"))
+    out_file_name = os.path.join(str(tmpdir), "test." + out_format)
+    write_anything.write_file(doc, out_file_name)
+
+    out = io.BytesIO()
+    write_anything.write_stream(doc, out, out_format)
+    assert not out.closed
+    with open(out_file_name, "rb") as f:
+        assert out.getvalue() == f.read()
+
+
+@pytest.mark.parametrize("file_name", ["test.yml", "test.yml.gz"])
+def test_write_file_named_like_the_parser_reads(file_name, tmpdir):
+    doc, _ = parse_anything.parse_file(os.path.join(dirname, "SPDXJSONExample-v2.3.spdx.json"))
+    out_file_name = os.path.join(str(tmpdir), file_name)
+    write_anything.write_file(doc, out_file_name)
+
+    result, errors = parse_anything.parse_file(out_file_name)
+    assert not errors
+    assert result.name == doc.name
@@ -0,0 +1,75 @@
+# Copyright (c) 2022 spdx contributors
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+
+import pytest
+import yaml
+
+from spdx import yaml_engine
+from spdx.parsers import yamlparser
+from spdx.parsers.jsonyamlxmlbuilders import Builder
+from spdx.parsers.loggers import StandardLogger
+from spdx.writers.yaml import write_document
+from tests.utils_test import TestParserUtils
+
+engines = ["python"] + (["libyaml"] if yaml.__with_libyaml__ else [])
+yaml_files = ["SPDXYAMLExample-2.3.spdx.yaml", "SPDXYamlExample.yaml", "SPDXSBOMExample.spdx.yml"]
+
+
+@pytest.fixture(params=engines)
+def engine(request):
+    yaml_engine.set_engine(request.param)
+    yield request.param
+    yaml_engine.set_engine()
+
+
+def parse(file_name):
+    with open(os.path.join(os.path.dirname(__file__), "data", "formats", file_name), encoding="utf-8") as f:
+        return yamlparser.Parser(Builder(), StandardLogger()).parse(f)
+
+
+def test_default_engine():
+    yaml_engine.set_engine()
+    assert yaml_engine.engine() == ("libyaml" if yaml.__with_libyaml__ else "python")
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        yaml_engine.set_engine("ruamel")
+
+
+def test_engine_classes(engine):
+    if engine == "libyaml":
+        assert yaml_engine.loader() is yaml.CSafeLoader
+        assert yaml_engine.dumper() is yaml.CSafeDumper
+    else:
+        assert yaml_engine.loader() is yaml.SafeLoader
+        assert yaml_engine.dumper() is yaml.SafeDumper
+
+
+@pytest.mark.parametrize("file_name", yaml_files)
+def test_engines_parse_and_write_alike(engine, file_name):
+    document, _ = parse(file_name)
+    yaml_engine.set_engine("python")
+    expected, _ = parse(file_name)
+    assert TestParserUtils.to_dict(document) == TestParserUtils.to_dict(expected)
+
+    written = []
+    for name in ("python", engine):
+        yaml_engine.set_engine(name)
+        out = io.BytesIO()
+        write_document(document, out, validate=False)
+        written.append(yaml.safe_load(out.getvalue()))
+    assert written[0] == written[1]
+